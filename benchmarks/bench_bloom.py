@@ -0,0 +1,71 @@
+"""
+Compares the memory use and lookup speed of BloomFilter against IsSeen, and
+measures the false positive rate of the filter.
+
+    python benchmarks/bench_bloom.py 100000 1000000
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from jobspy.bloom import BloomFilter
+from jobspy.is_seen import IsSeen
+
+
+def job_ids(count: int, prefix: str = "li") -> list[str]:
+    return [f"{prefix}-{3_900_000_000 + i}" for i in range(count)]
+
+
+def filled(factory, ids: list[str]):
+    tracemalloc.start()
+    can_skip = factory()
+    for job_id in ids:
+        can_skip.add_seen(job_id)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return can_skip, memory
+
+
+def lookups_per_second(can_skip, ids: list[str]) -> float:
+    start = time.perf_counter()
+    for job_id in ids:
+        can_skip.can_skip(job_id)
+    return len(ids) / (time.perf_counter() - start)
+
+
+def main(counts: list[int], error_rate: float = 0.001):
+    print(
+        f"{'ids':>10} {'store':>12} {'memory (MB)':>12} {'lookups/s':>11}"
+        f" {'false pos.':>11}"
+    )
+    for count in counts:
+        ids = job_ids(count)
+        probes = ids[: min(count, 100_000)]
+        unseen = job_ids(len(probes), prefix="new")
+        # the first stage is sized for a tenth of the ids, so the filter scales
+        stores = {
+            "IsSeen": filled(IsSeen, ids),
+            "BloomFilter": filled(
+                lambda: BloomFilter(max(count // 10, 1), error_rate), ids
+            ),
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "seen.bloom")
+            stores["BloomFilter"][0].save(path)
+            stores["mmap"] = (BloomFilter.load(path), os.path.getsize(path))
+            for name, (can_skip, memory) in stores.items():
+                assert all(can_skip.can_skip(job_id) for job_id in probes)
+                false_positives = sum(map(can_skip.can_skip, unseen)) / len(unseen)
+                print(
+                    f"{count:>10} {name:>12} {memory / 2**20:>12.1f}"
+                    f" {lookups_per_second(can_skip, probes):>11.0f}"
+                    f" {false_positives:>11.5f}"
+                )
+            del stores
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000])
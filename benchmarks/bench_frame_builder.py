@@ -0,0 +1,174 @@
+"""
+Times the DataFrame post-processing of scrape_jobs against the number of rows.
+
+Compares the columnar JobFrameBuilder with the previous approach of one
+DataFrame per job, built from job.dict(), followed by pd.concat. Both must give
+equal frames.
+
+    python benchmarks/bench_frame_builder.py 1000 5000 20000
+"""
+
+import random
+import sys
+import time
+import warnings
+from datetime import date
+
+import pandas as pd
+from pydantic import PydanticDeprecatedSince20
+
+from jobspy.frame_builder import JobFrameBuilder
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Country,
+    JobPost,
+    JobType,
+    Location,
+    SalarySource,
+)
+from jobspy.util import convert_to_annual, desired_order, extract_salary
+
+SITES = ["indeed", "linkedin", "zip_recruiter", "glassdoor"]
+
+
+def make_jobs(count: int) -> list[tuple[str, JobPost]]:
+    rnd = random.Random(count)
+    jobs = []
+    for i in range(count):
+        compensation = None
+        if rnd.random() < 0.4:
+            compensation = Compensation(
+                interval=CompensationInterval.YEARLY,
+                min_amount=rnd.randint(50, 120) * 1000,
+                max_amount=rnd.randint(130, 200) * 1000,
+            )
+        job = JobPost(
+            id=str(i),
+            title=f"Software Engineer {i}",
+            company_name=f"Company {rnd.randint(0, 500)}",
+            job_url=f"https://example.com/jobs/{i}",
+            location=Location(city="Austin", state="TX", country=Country.USA),
+            description="Pay $60,000 - $90,000 a year. " * rnd.randint(1, 20),
+            job_type=[JobType.FULL_TIME],
+            compensation=compensation,
+            date_posted=date(2024, 1, rnd.randint(1, 28)),
+            is_remote=rnd.random() < 0.3,
+        )
+        jobs.append((rnd.choice(SITES), job))
+    return jobs
+
+
+def job_data_of(
+    job: JobPost, site: str, enforce_annual_salary: bool = False
+) -> dict:
+    """
+    Row of a job as scrape_jobs built it before JobFrameBuilder, for a search in
+    the USA
+    """
+    with warnings.catch_warnings():
+        # job.dict() as the baseline called it
+        warnings.simplefilter("ignore", PydanticDeprecatedSince20)
+        job_data = job.dict()
+    job_data["site"] = site
+    job_data["company"] = job_data["company_name"]
+    job_data["job_type"] = (
+        ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+        if job_data["job_type"]
+        else None
+    )
+    job_data["emails"] = ", ".join(job_data["emails"]) if job_data["emails"] else None
+    if job_data["location"]:
+        job_data["location"] = Location(**job_data["location"]).display_location()
+
+    compensation_obj = job_data.get("compensation")
+    if compensation_obj and isinstance(compensation_obj, dict):
+        job_data["interval"] = (
+            compensation_obj.get("interval").value
+            if compensation_obj.get("interval")
+            else None
+        )
+        job_data["min_amount"] = compensation_obj.get("min_amount")
+        job_data["max_amount"] = compensation_obj.get("max_amount")
+        job_data["currency"] = compensation_obj.get("currency", "USD")
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    else:
+        (
+            job_data["interval"],
+            job_data["min_amount"],
+            job_data["max_amount"],
+            job_data["currency"],
+        ) = extract_salary(
+            job_data["description"], enforce_annual_salary=enforce_annual_salary
+        )
+        job_data["salary_source"] = SalarySource.DESCRIPTION.value
+    job_data["salary_source"] = (
+        job_data["salary_source"]
+        if "min_amount" in job_data and job_data["min_amount"]
+        else None
+    )
+
+    job_data["skills"] = ", ".join(job_data["skills"]) if job_data["skills"] else None
+    for field in (
+        "experience_range",
+        "company_rating",
+        "company_reviews_count",
+        "vacancy_count",
+        "work_from_home_type",
+    ):
+        job_data[field] = job_data.get(field)
+    return job_data
+
+
+def concat_per_job(jobs: list[tuple[str, JobPost]]) -> pd.DataFrame:
+    jobs_dfs = [
+        pd.DataFrame([job_data_of(job, site)]).dropna(axis=1, how="all")
+        for site, job in jobs
+    ]
+    jobs_df = pd.concat(jobs_dfs, ignore_index=True)
+    for column in desired_order:
+        if column not in jobs_df.columns:
+            jobs_df[column] = None
+    jobs_df = jobs_df[desired_order]
+    return jobs_df.sort_values(
+        by=["site", "date_posted"], ascending=[True, False]
+    ).reset_index(drop=True)
+
+
+def columnar(jobs: list[tuple[str, JobPost]]) -> pd.DataFrame:
+    frame_builder = JobFrameBuilder(country=Country.USA)
+    for site, job in jobs:
+        frame_builder.add_job(site, job)
+    return frame_builder.build()
+
+
+def timed(fn, jobs) -> float:
+    start = time.perf_counter()
+    fn(jobs)
+    return time.perf_counter() - start
+
+
+def main(row_counts: list[int]):
+    print(f"{'rows':>8} {'concat (s)':>12} {'columnar (s)':>13} {'speedup':>8}")
+    for count in row_counts:
+        jobs = make_jobs(count)
+        expected, built = concat_per_job(jobs), columnar(jobs)
+        pd.testing.assert_frame_equal(expected, built)
+        assert expected.equals(built)
+        concat_time = timed(concat_per_job, jobs)
+        columnar_time = timed(columnar, jobs)
+        print(
+            f"{count:>8} {concat_time:>12.3f} {columnar_time:>13.3f}"
+            f" {concat_time / columnar_time:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [100, 1000, 5000, 20000])
@@ -0,0 +1,193 @@
+"""
+End-to-end benchmark of the scrapers against recorded responses, without
+network access.
+
+Record a scenario once, with the scrape_jobs parameters as JSON:
+
+    python benchmarks/bench_replay.py record fixtures/swe \\
+        '{"site_name": ["linkedin", "indeed"], "search_term": "software engineer",
+          "location": "Austin, TX", "results_wanted": 50}'
+
+Then replay it, timing each Scraper.scrape and the full scrape_jobs:
+
+    python benchmarks/bench_replay.py run fixtures/swe --latency 0.05 --repeat 3
+
+benchmarks/fixtures/linkedin is a synthetic LinkedIn scenario, runnable offline
+as is. It is recorded from the page fixtures of the tests, renumbered into as
+many search pages and jobs as the scenario asks for:
+
+    python benchmarks/bench_replay.py synthesize benchmarks/fixtures/linkedin \\
+        '{"site_name": "linkedin", "search_term": "software engineer",
+          "results_wanted": 50, "linkedin_fetch_description": true}'
+"""
+
+import argparse
+import inspect
+import json
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import httpx
+import requests
+
+import jobspy
+from jobspy import scrape_jobs
+from jobspy.rate_limit import DEFAULT_RATES
+from jobspy.util import (
+    RequestsRotating,
+    RequestsRotatingAsync,
+    http_replay,
+    rate_limiter,
+)
+
+SCENARIO_FILE = "scenario.json"
+PAGES = Path(__file__).parent.parent / "tests" / "fixtures" / "linkedin"
+JOB_ID = re.compile(r"\b39\d{8}\b")
+
+
+def record(path: Path, scenario: dict):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / SCENARIO_FILE).write_text(json.dumps(scenario, indent=2))
+    http_replay.record(path)
+    try:
+        jobs = scrape_jobs(**scenario)
+    finally:
+        http_replay.off()
+    print(f"recorded {len(jobs)} jobs into {path}")
+
+
+def synthetic_page(url: str, params: dict | None) -> str:
+    """
+    :return: a page fixture standing in for a LinkedIn search page or job page,
+        search pages renumbered by their offset so that each has new jobs
+    """
+    if "seeMoreJobPostings" not in url:
+        job_id = int(JOB_ID.search(url).group())
+        return (PAGES / f"job_{job_id % 4}.html").read_text()
+    page = int((params or {}).get("start", 0)) // 10
+    html = (PAGES / f"search_{page % 2}.html").read_text()
+    return JOB_ID.sub(lambda match: str(int(match.group()) + page * 1000), html)
+
+
+def synthesize(path: Path, scenario: dict):
+    """
+    Records the scenario with the page fixtures served in place of LinkedIn
+    """
+
+    def request(self, method, url, rotating_proxy=None, **kwargs):
+        response = requests.Response()
+        response.status_code, response.url = 200, url
+        response.headers["Content-Type"] = "text/html; charset=utf-8"
+        response._content = synthetic_page(url, kwargs.get("params")).encode()
+        return response
+
+    async def request_async(self, method, url, rotating_proxy=None, **kwargs):
+        return httpx.Response(
+            200,
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            content=synthetic_page(url, kwargs.get("params")).encode(),
+            request=httpx.Request(method, url),
+        )
+
+    RequestsRotating.request = request
+    RequestsRotatingAsync.request = request_async
+    for target in DEFAULT_RATES:
+        rate_limiter.set_rate(target, None)
+    for archive in path.glob("*.jsonl.gz"):
+        archive.unlink()
+    record(path, scenario)
+
+
+def scraper_input_for(scenario: dict, site: str):
+    build_params = inspect.signature(jobspy._build_scraper_input).parameters
+    defaults = {
+        name: parameter.default
+        for name, parameter in inspect.signature(scrape_jobs).parameters.items()
+        if name in build_params
+    }
+    given = {name: value for name, value in scenario.items() if name in build_params}
+    return jobspy._build_scraper_input(**{**defaults, **given, "site_name": site})
+
+
+def measure(path: Path, latency: float, fn) -> dict:
+    """
+    Runs fn twice against a fresh replay, timed first, then under tracemalloc
+    """
+    results = {}
+    for traced in (False, True):
+        http_replay.replay(path, latency=latency)
+        http_replay.archive.load()
+        if traced:
+            tracemalloc.start()
+        wall, cpu = time.perf_counter(), time.process_time()
+        jobs = fn()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+        if traced:
+            results["peak_mb"] = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+        else:
+            results.update(jobs=jobs, wall=wall, cpu=cpu)
+        results["misses"] = len(http_replay.archive.misses)
+    http_replay.off()
+    return results
+
+
+def run(path: Path, latency: float, repeat: int):
+    scenario = json.loads((path / SCENARIO_FILE).read_text())
+    sites = scenario.get("site_name") or [site.value for site in jobspy.Site]
+    sites = [sites] if isinstance(sites, str) else sites
+
+    targets = {}
+    for site in sites:
+        def scrape_site(site=site):
+            scraper_input = scraper_input_for(scenario, site)
+            scraper = jobspy.SCRAPER_MAPPING[scraper_input.site_type[0]]()
+            return len(scraper.scrape(scraper_input).jobs)
+
+        targets[f"{site}.scrape"] = scrape_site
+    targets["scrape_jobs"] = lambda: len(scrape_jobs(**scenario))
+
+    print(
+        f"{'target':>24} {'jobs':>6} {'wall (s)':>9} {'jobs/s':>8} {'cpu (s)':>8}"
+        f" {'peak (MB)':>10} {'misses':>7}"
+    )
+    for name, fn in targets.items():
+        for _ in range(repeat):
+            result = measure(path, latency, fn)
+            print(
+                f"{name:>24} {result['jobs']:>6} {result['wall']:>9.3f}"
+                f" {result['jobs'] / result['wall']:>8.1f} {result['cpu']:>8.3f}"
+                f" {result['peak_mb']:>10.1f} {result['misses']:>7}"
+            )
+
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="record a scenario live")
+    record_parser.add_argument("path", type=Path)
+    record_parser.add_argument("scenario", type=json.loads)
+    synthesize_parser = commands.add_parser(
+        "synthesize", help="record a LinkedIn scenario from the page fixtures"
+    )
+    synthesize_parser.add_argument("path", type=Path)
+    synthesize_parser.add_argument("scenario", type=json.loads)
+    run_parser = commands.add_parser("run", help="replay a recorded scenario")
+    run_parser.add_argument("path", type=Path)
+    run_parser.add_argument("--latency", type=float, default=0.0)
+    run_parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        record(args.path, args.scenario)
+    elif args.command == "synthesize":
+        synthesize(args.path, args.scenario)
+    else:
+        run(args.path, args.latency, args.repeat)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
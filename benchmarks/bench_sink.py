@@ -0,0 +1,74 @@
+"""
+Times writing and reloading scrape results as CSV, as run.py exports them,
+against the partitioned parquet dataset of ParquetSink.
+
+    python benchmarks/bench_sink.py 5000 20000
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from bench_frame_builder import columnar, make_jobs
+from jobspy.sink import ParquetSink, read_jobs
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def size_of(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(
+        os.path.getsize(os.path.join(root, name))
+        for root, _, names in os.walk(path)
+        for name in names
+    )
+
+
+def main(row_counts: list[int]):
+    print(
+        f"{'rows':>8} {'format':>8} {'write (s)':>10} {'reload (s)':>11}"
+        f" {'size (MB)':>10}"
+    )
+    for count in row_counts:
+        jobs_df = columnar(make_jobs(count))
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp, "jobs.csv")
+            parquet_path = Path(tmp, "jobs")
+            results = {
+                "csv": (
+                    timed(
+                        lambda: jobs_df.to_csv(
+                            csv_path,
+                            quoting=csv.QUOTE_NONNUMERIC,
+                            escapechar="\\",
+                            index=False,
+                        )
+                    ),
+                    timed(lambda: pd.read_csv(csv_path, escapechar="\\")),
+                    size_of(csv_path),
+                ),
+                "parquet": (
+                    timed(lambda: ParquetSink(parquet_path).write(jobs_df)),
+                    timed(lambda: read_jobs(parquet_path)),
+                    size_of(parquet_path),
+                ),
+            }
+        for name, (write_time, reload_time, size) in results.items():
+            print(
+                f"{count:>8} {name:>8} {write_time:>10.3f} {reload_time:>11.3f}"
+                f" {size / 2**20:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 5000, 20000])
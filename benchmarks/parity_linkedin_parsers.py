@@ -0,0 +1,120 @@
+"""
+Checks that the lxml and BeautifulSoup backends of the LinkedIn parsers
+return identical results from saved search and job pages, and times both.
+
+Pages are read from .html files or from the linkedin archive of a directory
+recorded with bench_replay.py:
+
+    python benchmarks/parity_linkedin_parsers.py fixtures/swe pages/*.html
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin import util
+from jobspy.model import DescriptionFormat, JobPost
+
+
+def saved_pages(paths: list[Path]) -> tuple[dict[str, str], dict[str, str]]:
+    """
+    :return: search pages and job pages by name
+    """
+    search_pages, job_pages = {}, {}
+    for path in paths:
+        if path.is_dir():
+            archive = path / "linkedin.jsonl.gz"
+            if not archive.exists():
+                continue
+            with gzip.open(archive, "rt") as f:
+                for i, line in enumerate(f):
+                    record = json.loads(line)
+                    content = base64.b64decode(record["content"]).decode(
+                        record["encoding"] or "utf-8"
+                    )
+                    if "seeMoreJobPostings" in record["url"]:
+                        search_pages[f"{archive}:{i}"] = content
+                    elif "/jobs/view/" in record["url"]:
+                        job_pages[f"{archive}:{i}"] = content
+        else:
+            content = path.read_text()
+            pages = search_pages if "base-search-card" in content else job_pages
+            pages[str(path)] = content
+    return search_pages, job_pages
+
+
+def job_posts(cards: list[dict]) -> list:
+    return [
+        card if "error" in card else JobPost(**card).model_dump(mode="json")
+        for card in cards
+    ]
+
+
+def parse_search_pages(pages: dict[str, str]) -> dict:
+    return {
+        name: job_posts(util.parse_search_cards(html, LinkedIn.base_url, "worldwide"))
+        for name, html in pages.items()
+    }
+
+
+def parse_job_pages(pages: dict[str, str]) -> dict:
+    return {
+        (name, description_format.value): util.parse_job_details(
+            html, f"{LinkedIn.base_url}/jobs/view/1", description_format, False
+        )
+        for name, html in pages.items()
+        for description_format in DescriptionFormat
+    }
+
+
+def timed(parse, pages: dict[str, str], repeat: int) -> tuple[dict, float]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = parse(pages)
+    return results, (time.perf_counter() - start) / repeat
+
+
+def main(argv: list[str]):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("paths", type=Path, nargs="+")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    lxml_html = util.lxml_html
+    if lxml_html is None:
+        sys.exit("lxml is not installed")
+    search_pages, job_pages = saved_pages(args.paths)
+    if not search_pages and not job_pages:
+        sys.exit("no LinkedIn pages found")
+
+    mismatches = []
+    for kind, parse, pages in (
+        ("search", parse_search_pages, search_pages),
+        ("job", parse_job_pages, job_pages),
+    ):
+        if not pages:
+            continue
+        try:
+            util.lxml_html = None
+            bs4_results, bs4_time = timed(parse, pages, args.repeat)
+        finally:
+            util.lxml_html = lxml_html
+        lxml_results, lxml_time = timed(parse, pages, args.repeat)
+        mismatches += [
+            name for name in bs4_results if bs4_results[name] != lxml_results[name]
+        ]
+        print(f"{len(pages)} {kind} pages")
+        print(f"  BeautifulSoup {len(pages) / bs4_time:>10.0f} pages/s")
+        print(f"  lxml          {len(pages) / lxml_time:>10.0f} pages/s")
+    for name in mismatches:
+        print(f"mismatch: {name}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,29 +1,59 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Tuple
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from queue import Queue
+from typing import AsyncIterator, Awaitable, Callable, Iterator, TypeVar
 
 import pandas as pd
 
 from jobspy.bayt import BaytScraper
+from jobspy.bloom import BloomFilter
+from jobspy.cache import ResponseCache
+from jobspy.can_skip_job_post import CanSkipJobPost
+from jobspy.filters import JobFilter
+from jobspy.frame_builder import JobFrameBuilder, normalize_job
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
+from jobspy.linkedin.company_cache import CompanyCache
+from jobspy.linkedin.details import RESOLVER_ATTR, DetailResolver, resolver_for
+from jobspy.linkedin.enrich import CompanyEnricher
 from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
-from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.seen_store import SeenJobStore
+from jobspy.sink import ParquetSink, read_jobs
+from jobspy.watermark import WatermarkStore
+from jobspy.model import JobType, JobPost, Location, JobResponse, Country
+from jobspy.model import SalarySource, Scraper, ScraperInput, Site
 from jobspy.util import (
+    http_cache,
+    http_replay,
+    proxy_breaker,
+    rate_limiter,
     set_logger_level,
-    extract_salary,
     create_logger,
     get_enum_from_value,
     map_str_to_site,
-    convert_to_annual,
-    desired_order,
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+}
+
+# marks the end of a site's pages, or of all jobs, when handed over through a queue
+_DONE = object()
+
+T = TypeVar("T")
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -41,26 +71,391 @@ def scrape_jobs(
     description_format: str = "markdown",
     linkedin_fetch_description: bool | None = False,
     linkedin_company_ids: list[int] | None = None,
+    linkedin_company_shard_size: int | None = None,
+    linkedin_prefetch_pages: int = 1,
+    linkedin_stream_details: bool = False,
+    linkedin_defer_details: bool = False,
+    fetch_details_if: Callable[[JobPost], bool] | None = None,
+    job_filter: JobFilter | None = None,
     offset: int | None = 0,
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
+    parse_workers: int | None = None,
+    seen_store: CanSkipJobPost | None = None,
+    watermark_store: WatermarkStore | None = None,
+    enrich_companies: bool = False,
+    company_cache: CompanyCache | None = None,
     **kwargs,
 ) -> pd.DataFrame:
     """
     Scrapes job data from job boards concurrently
+    :param linkedin_defer_details: skips the LinkedIn job pages during the scrape,
+        they are fetched for chosen rows with df.jobspy.resolve_details()
+    :param fetch_details_if: called with each job as parsed from the search
+        results, its job page or description is only fetched when it returns
+        True, e.g. lambda job: job.compensation is None. LinkedIn, ZipRecruiter
+        and Glassdoor
+    :param job_filter: jobs to drop, e.g. JobFilter(exclude_companies=["Acme"],
+        min_salary=80000), checked by each site before the work on the job.
+        Dropped jobs do not count toward results_wanted
+    :param enrich_companies: fills in the employee count and description of the
+        jobs from their LinkedIn company pages, fetched while the search runs
+    :param company_cache: companies reused by enrich_companies, e.g.
+        CompanyCache("companies.sqlite") to keep them across runs
+    :return: Pandas DataFrame containing job data
+    """
+    return _run_sync(
+        scrape_jobs_async(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            linkedin_company_shard_size=linkedin_company_shard_size,
+            linkedin_prefetch_pages=linkedin_prefetch_pages,
+            linkedin_stream_details=linkedin_stream_details,
+            linkedin_defer_details=linkedin_defer_details,
+            fetch_details_if=fetch_details_if,
+            job_filter=job_filter,
+            offset=offset,
+            hours_old=hours_old,
+            enforce_annual_salary=enforce_annual_salary,
+            verbose=verbose,
+            parse_workers=parse_workers,
+            seen_store=seen_store,
+            watermark_store=watermark_store,
+            enrich_companies=enrich_companies,
+            company_cache=company_cache,
+            **kwargs,
+        )
+    )
+
+
+async def scrape_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_company_shard_size: int | None = None,
+    linkedin_prefetch_pages: int = 1,
+    linkedin_stream_details: bool = False,
+    linkedin_defer_details: bool = False,
+    fetch_details_if: Callable[[JobPost], bool] | None = None,
+    job_filter: JobFilter | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    parse_workers: int | None = None,
+    seen_store: CanSkipJobPost | None = None,
+    watermark_store: WatermarkStore | None = None,
+    enrich_companies: bool = False,
+    company_cache: CompanyCache | None = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Scrapes job data from job boards concurrently on the running event loop, see
+    iter_jobs_async for which of them run on it
     :return: Pandas DataFrame containing job data
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-    }
+    frame_builder = JobFrameBuilder()
+    enricher = (
+        CompanyEnricher(proxies=proxies, ca_cert=ca_cert, company_cache=company_cache)
+        if enrich_companies
+        else None
+    )
+    try:
+        async for job_data in iter_jobs_async(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            linkedin_company_shard_size=linkedin_company_shard_size,
+            linkedin_prefetch_pages=linkedin_prefetch_pages,
+            linkedin_stream_details=linkedin_stream_details,
+            linkedin_defer_details=linkedin_defer_details,
+            fetch_details_if=fetch_details_if,
+            job_filter=job_filter,
+            offset=offset,
+            hours_old=hours_old,
+            enforce_annual_salary=enforce_annual_salary,
+            verbose=verbose,
+            parse_workers=parse_workers,
+            seen_store=seen_store,
+            watermark_store=watermark_store,
+            **kwargs,
+        ):
+            if enricher is not None:
+                enricher.add(len(frame_builder), job_data)
+            frame_builder.add_row(job_data)
+        if enricher is not None:
+            await enricher.fill(frame_builder)
+    finally:
+        if enricher is not None:
+            await enricher.aclose()
+    jobs_df = frame_builder.build()
+    if (
+        linkedin_defer_details
+        and not jobs_df.empty
+        and (jobs_df["site"] == Site.LINKEDIN.value).any()
+    ):
+        resolver = DetailResolver(
+            LinkedIn(proxies=proxies, ca_cert=ca_cert),
+            ScraperInput(
+                site_type=[Site.LINKEDIN],
+                description_format=description_format,
+                linkedin_stream_details=linkedin_stream_details,
+            ),
+        )
+        jobs_df.attrs[RESOLVER_ATTR] = resolver.register()
+    return jobs_df
+
+
+def iter_jobs(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_company_shard_size: int | None = None,
+    linkedin_prefetch_pages: int = 1,
+    linkedin_stream_details: bool = False,
+    linkedin_defer_details: bool = False,
+    fetch_details_if: Callable[[JobPost], bool] | None = None,
+    job_filter: JobFilter | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    parse_workers: int | None = None,
+    seen_store: CanSkipJobPost | None = None,
+    watermark_store: WatermarkStore | None = None,
+    **kwargs,
+) -> Iterator[dict]:
+    """
+    Scrapes job data from job boards concurrently, yielding the jobs of every
+    results page as soon as it is scraped
+    :return: iterator over jobs, each a dict with the columns of scrape_jobs
+    """
+    yield from _iterate_sync(
+        iter_jobs_async(
+            site_name=site_name,
+            search_term=search_term,
+            google_search_term=google_search_term,
+            location=location,
+            distance=distance,
+            is_remote=is_remote,
+            job_type=job_type,
+            easy_apply=easy_apply,
+            results_wanted=results_wanted,
+            country_indeed=country_indeed,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            description_format=description_format,
+            linkedin_fetch_description=linkedin_fetch_description,
+            linkedin_company_ids=linkedin_company_ids,
+            linkedin_company_shard_size=linkedin_company_shard_size,
+            linkedin_prefetch_pages=linkedin_prefetch_pages,
+            linkedin_stream_details=linkedin_stream_details,
+            linkedin_defer_details=linkedin_defer_details,
+            fetch_details_if=fetch_details_if,
+            job_filter=job_filter,
+            offset=offset,
+            hours_old=hours_old,
+            enforce_annual_salary=enforce_annual_salary,
+            verbose=verbose,
+            parse_workers=parse_workers,
+            seen_store=seen_store,
+            watermark_store=watermark_store,
+            **kwargs,
+        )
+    )
+
+
+async def iter_jobs_async(
+    site_name: str | list[str] | Site | list[Site] | None = None,
+    search_term: str | None = None,
+    google_search_term: str | None = None,
+    location: str | None = None,
+    distance: int | None = 50,
+    is_remote: bool = False,
+    job_type: str | None = None,
+    easy_apply: bool | None = None,
+    results_wanted: int = 15,
+    country_indeed: str = "usa",
+    proxies: list[str] | str | None = None,
+    ca_cert: str | None = None,
+    description_format: str = "markdown",
+    linkedin_fetch_description: bool | None = False,
+    linkedin_company_ids: list[int] | None = None,
+    linkedin_company_shard_size: int | None = None,
+    linkedin_prefetch_pages: int = 1,
+    linkedin_stream_details: bool = False,
+    linkedin_defer_details: bool = False,
+    fetch_details_if: Callable[[JobPost], bool] | None = None,
+    job_filter: JobFilter | None = None,
+    offset: int | None = 0,
+    hours_old: int = None,
+    enforce_annual_salary: bool = False,
+    verbose: int = 0,
+    parse_workers: int | None = None,
+    seen_store: CanSkipJobPost | None = None,
+    watermark_store: WatermarkStore | None = None,
+    **kwargs,
+) -> AsyncIterator[dict]:
+    """
+    Async version of iter_jobs. All sites are scraped as tasks on the running
+    event loop. Only LinkedIn sends its requests on the loop, the other sites
+    run their blocking scraper in a thread of the loop's default executor
+    :return: async iterator over jobs, each a dict with the columns of scrape_jobs
+    """
     set_logger_level(verbose)
+    scraper_input = _build_scraper_input(
+        site_name=site_name,
+        search_term=search_term,
+        google_search_term=google_search_term,
+        location=location,
+        distance=distance,
+        is_remote=is_remote,
+        job_type=job_type,
+        easy_apply=easy_apply,
+        results_wanted=results_wanted,
+        country_indeed=country_indeed,
+        description_format=description_format,
+        linkedin_fetch_description=linkedin_fetch_description,
+        linkedin_company_ids=linkedin_company_ids,
+        linkedin_company_shard_size=linkedin_company_shard_size,
+        linkedin_prefetch_pages=linkedin_prefetch_pages,
+        linkedin_stream_details=linkedin_stream_details,
+        linkedin_defer_details=linkedin_defer_details,
+        fetch_details_if=fetch_details_if,
+        job_filter=job_filter,
+        offset=offset,
+        hours_old=hours_old,
+    )
+    loop = asyncio.get_running_loop()
+    pages: asyncio.Queue = asyncio.Queue()
+    # HTML parsing is CPU bound, so it can be moved off the GIL into processes
+    parse_executor = ProcessPoolExecutor(parse_workers) if parse_workers else None
+
+    async def scrape_site(site: Site):
+        scraper = None
+        try:
+            # some scrapers send requests while being created
+            scraper = await loop.run_in_executor(
+                None,
+                _create_scraper,
+                site,
+                proxies,
+                ca_cert,
+                parse_executor,
+                seen_store,
+                watermark_store,
+            )
+            async for page in scraper.iter_pages_async(scraper_input):
+                await pages.put((site, page))
+            create_logger(_site_logger_name(site)).info(f"finished scraping")
+        except Exception as e:
+            await pages.put((site, e))
+        finally:
+            # sync scrapers can still be running a page in the executor
+            if scraper is not None and scraper.is_async:
+                await scraper.aclose()
+            await pages.put((site, _DONE))
+
+    tasks = [
+        asyncio.create_task(scrape_site(site)) for site in scraper_input.site_type
+    ]
+    try:
+        sites_running = len(tasks)
+        while sites_running:
+            site, page = await pages.get()
+            if page is _DONE:
+                sites_running -= 1
+                continue
+            if isinstance(page, Exception):
+                raise page
+            for job in page:
+                yield normalize_job(
+                    job,
+                    site.value,
+                    country=scraper_input.country,
+                    enforce_annual_salary=enforce_annual_salary,
+                )
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if parse_executor is not None:
+            parse_executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _build_scraper_input(
+    site_name: str | list[str] | Site | list[Site] | None,
+    search_term: str | None,
+    google_search_term: str | None,
+    location: str | None,
+    distance: int | None,
+    is_remote: bool,
+    job_type: str | None,
+    easy_apply: bool | None,
+    results_wanted: int,
+    country_indeed: str,
+    description_format: str,
+    linkedin_fetch_description: bool | None,
+    linkedin_company_ids: list[int] | None,
+    linkedin_company_shard_size: int | None,
+    linkedin_prefetch_pages: int,
+    linkedin_stream_details: bool,
+    linkedin_defer_details: bool,
+    fetch_details_if: Callable[[JobPost], bool] | None,
+    job_filter: JobFilter | None,
+    offset: int | None,
+    hours_old: int | None,
+) -> ScraperInput:
     job_type = get_enum_from_value(job_type) if job_type else None
 
     def get_site_type():
@@ -78,7 +473,7 @@ def scrape_jobs(
 
     country_enum = Country.from_string(country_indeed)
 
-    scraper_input = ScraperInput(
+    return ScraperInput(
         site_type=get_site_type(),
         country=country_enum,
         search_term=search_term,
@@ -92,124 +487,98 @@ def scrape_jobs(
         linkedin_fetch_description=linkedin_fetch_description,
         results_wanted=results_wanted,
         linkedin_company_ids=linkedin_company_ids,
+        linkedin_company_shard_size=linkedin_company_shard_size,
+        linkedin_prefetch_pages=linkedin_prefetch_pages,
+        linkedin_stream_details=linkedin_stream_details,
+        linkedin_defer_details=linkedin_defer_details,
+        fetch_details_if=fetch_details_if,
+        job_filter=job_filter,
         offset=offset,
         hours_old=hours_old,
     )
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
-
-    site_to_jobs_dict = {}
-
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
-
-    with ThreadPoolExecutor() as executor:
-        future_to_site = {
-            executor.submit(worker, site): site for site in scraper_input.site_type
-        }
-
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
-                    )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
 
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
-        return pd.DataFrame()
\ No newline at end of file
+def _create_scraper(
+    site: Site,
+    proxies: list[str] | str | None,
+    ca_cert: str | None,
+    parse_executor: Executor | None = None,
+    seen_store: CanSkipJobPost | None = None,
+    watermark_store: WatermarkStore | None = None,
+) -> Scraper:
+    scraper_class = SCRAPER_MAPPING[site]
+    kwargs = {"proxies": proxies, "ca_cert": ca_cert, "parse_executor": parse_executor}
+    if scraper_class.supports_async:
+        kwargs["is_async"] = True
+    if seen_store is not None and site == Site.LINKEDIN:
+        kwargs["can_skip"] = seen_store
+    if watermark_store is not None and site == Site.LINKEDIN:
+        kwargs["watermarks"] = watermark_store
+    return scraper_class(**kwargs)
+
+
+def _run_sync(coroutine: Awaitable[T]) -> T:
+    """
+    Runs a coroutine to completion from sync code, on a separate thread when the
+    caller is already inside an event loop (e.g. Jupyter)
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    result = {}
+
+    def run():
+        try:
+            result["value"] = asyncio.run(coroutine)
+        except BaseException as e:
+            result["error"] = e
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    thread.join()
+    if "error" in result:
+        raise result["error"]
+    return result["value"]
+
+
+def _iterate_sync(async_iterator: AsyncIterator[T]) -> Iterator[T]:
+    """
+    Iterates an async iterator from sync code by running it on an event loop in a
+    separate thread. Closing the returned iterator cancels the async one
+    """
+    items: Queue = Queue()
+    loop = asyncio.new_event_loop()
+
+    async def pump():
+        try:
+            async for item in async_iterator:
+                items.put((item, None))
+        except BaseException as e:
+            items.put((None, e))
+        finally:
+            items.put((_DONE, None))
+
+    task = loop.create_task(pump())
+    thread = threading.Thread(target=loop.run_until_complete, args=(task,))
+    thread.start()
+    try:
+        while True:
+            item, error = items.get()
+            if error is not None:
+                if isinstance(error, asyncio.CancelledError):
+                    break
+                raise error
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        loop.call_soon_threadsafe(task.cancel)
+        thread.join()
+        loop.close()
+
+
+def _site_logger_name(site: Site) -> str:
+    cap_name = site.value.capitalize()
+    return "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import random
-import time
-
-from bs4 import BeautifulSoup
+import math
+from concurrent.futures import Executor
+from typing import Iterator
 
+from jobspy.bayt.util import parse_job_listings
+from jobspy.filters import FILTERED_PAGES_FACTOR
 from jobspy.model import (
     Scraper,
     ScraperInput,
@@ -21,67 +22,83 @@ log = create_logger("Bayt")
 
 class BaytScraper(Scraper):
     base_url = "https://www.bayt.com"
-    delay = 2
-    band_delay = 3
+    jobs_per_page = 20
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
-        super().__init__(Site.BAYT, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.BAYT, proxies=proxies, ca_cert=ca_cert, parse_executor=parse_executor
+        )
         self.scraper_input = None
         self.session = None
         self.country = "worldwide"
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
         self.scraper_input = scraper_input
         self.session = create_session(
             proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
         )
-        job_list: list[JobPost] = []
+        job_count = 0
         page = 1
         results_wanted = (
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
+        # bounds the pages of a filtered search, which keeps paging past pages
+        # whose jobs were all dropped
+        max_pages = FILTERED_PAGES_FACTOR * math.ceil(
+            results_wanted / self.jobs_per_page
+        )
 
-        while len(job_list) < results_wanted:
+        while job_count < results_wanted:
+            if page > max_pages and scraper_input.job_filter is not None:
+                log.info(
+                    f"Job filter kept {job_count} jobs in {max_pages} pages. "
+                    "Ending pagination."
+                )
+                break
             log.info(f"Fetching Bayt jobs page {page}")
-            job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
-            if not job_elements:
+            job_listings = self._fetch_jobs(self.scraper_input.search_term, page)
+            if not job_listings:
                 break
 
-            if job_elements:
-                log.debug(
-                    "First job element snippet:\n" + job_elements[0].prettify()[:500]
-                )
-
-            initial_count = len(job_list)
-            for job in job_elements:
-                try:
-                    job_post = self._extract_job_info(job)
-                    if job_post:
-                        job_list.append(job_post)
-                        if len(job_list) >= results_wanted:
-                            break
-                    else:
-                        log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
-                        )
-                except Exception as e:
-                    log.error(f"Bayt: Error extracting job info: {str(e)}")
+            page_jobs: list[JobPost] = []
+            for job_listing in job_listings:
+                if job_listing is None:
+                    log.debug("Extraction returned None for a job listing")
                     continue
+                if "error" in job_listing:
+                    log.error(
+                        f"Bayt: Error extracting job info: {job_listing['error']}"
+                    )
+                    continue
+                job_filter = self.scraper_input.job_filter
+                if job_filter is not None and not job_filter.keeps(
+                    job_listing["title"], job_listing["company_name"]
+                ):
+                    continue
+                page_jobs.append(self._to_job_post(job_listing))
+                if job_count + len(page_jobs) >= results_wanted:
+                    break
 
-            if len(job_list) == initial_count:
+            if not page_jobs and self.scraper_input.job_filter is None:
                 log.info(f"No new jobs found on page {page}. Ending pagination.")
                 break
 
-            page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+            job_count += len(page_jobs)
+            if page_jobs:
+                yield page_jobs
 
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+            page += 1
 
-    def _fetch_jobs(self, query: str, page: int) -> list | None:
+    def _fetch_jobs(self, query: str, page: int) -> list[dict | None] | None:
         """
         Grabs the job results for the given query and page number.
         """
@@ -89,57 +106,25 @@ class BaytScraper(Scraper):
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
             response = self.session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
-            job_listings = soup.find_all("li", attrs={"data-js-job": ""})
+            job_listings = self.parse(parse_job_listings, response.text, self.base_url)
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
             return None
 
-    def _extract_job_info(self, job: BeautifulSoup) -> JobPost | None:
+    def _to_job_post(self, job_listing: dict) -> JobPost:
         """
-        Extracts the job information from a single job listing.
+        Builds the JobPost of a parsed job listing. The id is derived here, as str
+        hashes differ between processes
         """
-        # Find the h2 element holding the title and link (no class filtering)
-        job_general_information = job.find("h2")
-        if not job_general_information:
-            return
-
-        job_title = job_general_information.get_text(strip=True)
-        job_url = self._extract_job_url(job_general_information)
-        if not job_url:
-            return
-
-        # Extract company name using the original approach:
-        company_tag = job.find("div", class_="t-nowrap p10l")
-        company_name = (
-            company_tag.find("span").get_text(strip=True)
-            if company_tag and company_tag.find("span")
-            else None
-        )
-
-        # Extract location using the original approach:
-        location_tag = job.find("div", class_="t-mute t-small")
-        location = location_tag.get_text(strip=True) if location_tag else None
-
-        job_id = f"bayt-{abs(hash(job_url))}"
-        location_obj = Location(
-            city=location,
-            country=Country.from_string(self.country),
-        )
         return JobPost(
-            id=job_id,
-            title=job_title,
-            company_name=company_name,
-            location=location_obj,
-            job_url=job_url,
+            id=f"bayt-{abs(hash(job_listing['job_url']))}",
+            title=job_listing["title"],
+            company_name=job_listing["company_name"],
+            location=Location(
+                city=job_listing["location"],
+                country=Country.from_string(self.country),
+            ),
+            job_url=job_listing["job_url"],
         )
-
-    def _extract_job_url(self, job_general_information: BeautifulSoup) -> str | None:
-        """
-        Pulls the job URL from the 'a' within the h2 element.
-        """
-        a_tag = job_general_information.find("a")
-        if a_tag and a_tag.has_attr("href"):
-            return self.base_url + a_tag["href"].strip()
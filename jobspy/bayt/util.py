@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from bs4 import BeautifulSoup, Tag
+
+
+def parse_job_listings(html: str, base_url: str) -> list[dict | None]:
+    """
+    Parses the job listings of a results page. Runs standalone so it can be
+    offloaded to a parse executor
+    :param html: results page body
+    :param base_url: prefix of the job urls
+    :return: one entry per listing, None when the listing has no title or url and
+        {"error": ...} when it failed to parse
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    job_listings = []
+    for job in soup.find_all("li", attrs={"data-js-job": ""}):
+        try:
+            job_listings.append(parse_job_listing(job, base_url))
+        except Exception as e:
+            job_listings.append({"error": str(e)})
+    return job_listings
+
+
+def parse_job_listing(job: Tag, base_url: str) -> dict | None:
+    """
+    Extracts the job information from a single job listing.
+    """
+    # Find the h2 element holding the title and link (no class filtering)
+    job_general_information = job.find("h2")
+    if not job_general_information:
+        return
+
+    job_title = job_general_information.get_text(strip=True)
+    job_url = parse_job_url(job_general_information, base_url)
+    if not job_url:
+        return
+
+    # Extract company name using the original approach:
+    company_tag = job.find("div", class_="t-nowrap p10l")
+    company_name = (
+        company_tag.find("span").get_text(strip=True)
+        if company_tag and company_tag.find("span")
+        else None
+    )
+
+    # Extract location using the original approach:
+    location_tag = job.find("div", class_="t-mute t-small")
+    location = location_tag.get_text(strip=True) if location_tag else None
+
+    return {
+        "title": job_title,
+        "company_name": company_name,
+        "location": location,
+        "job_url": job_url,
+    }
+
+
+def parse_job_url(job_general_information: Tag, base_url: str) -> str | None:
+    """
+    Pulls the job URL from the 'a' within the h2 element.
+    """
+    a_tag = job_general_information.find("a")
+    if a_tag and a_tag.has_attr("href"):
+        return base_url + a_tag["href"].strip()
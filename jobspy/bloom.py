@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import os
+from pathlib import Path
+
+import numpy as np
+
+from jobspy.can_skip_job_post import CanSkipJobPost
+
+_MAGIC = b"JOBSPYBF"
+_ALIGNMENT = 64
+
+
+class _BloomStage:
+    """
+    Fixed size Bloom filter over a uint8 numpy bit array, probed with double
+    hashing
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        num_bits: int,
+        num_hashes: int,
+        bits: np.ndarray | None = None,
+        count: int = 0,
+    ):
+        self.capacity = capacity
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bits if bits is not None else np.zeros(num_bits // 8, np.uint8)
+        self.count = count
+        # probing through a memoryview is faster than numpy for a few bits
+        self._view = memoryview(self.bits)
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float) -> _BloomStage:
+        num_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        num_bits = -(-num_bits // 64) * 64
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(capacity, num_bits, num_hashes)
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+    @property
+    def is_writable(self) -> bool:
+        return self.bits.flags.writeable
+
+    def __contains__(self, hashes: tuple[int, int]) -> bool:
+        h1, h2 = hashes
+        bits = self._view
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % self.num_bits
+            if not bits[position >> 3] >> (position & 7) & 1:
+                return False
+        return True
+
+    def add(self, hashes: tuple[int, int]):
+        h1, h2 = hashes
+        bits = self._view
+        for i in range(self.num_hashes):
+            position = (h1 + i * h2) % self.num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+def _hashes(job_id: str) -> tuple[int, int]:
+    digest = hashlib.blake2b(job_id.encode(), digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    # odd, so the probes of one id never collapse onto a single bit
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return h1, h2
+
+
+class BloomFilter(CanSkipJobPost):
+    """
+    Scalable Bloom filter of seen job ids. Lookups can return false positives,
+    at most at error_rate, so a new job is skipped with that probability. Once a
+    stage holds its capacity, a larger stage with a tighter error rate is added,
+    which keeps the overall rate under error_rate as the filter grows
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 1_000_000,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.8,
+    ):
+        """
+        :param initial_capacity: number of ids of the first stage
+        :param error_rate: false positive rate of the whole filter
+        :param growth: capacity ratio between consecutive stages
+        :param tightening: error rate ratio between consecutive stages
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.stages: list[_BloomStage] = []
+
+    def _add_stage(self) -> _BloomStage:
+        index = len(self.stages)
+        # the stage error rates form a geometric series summing to error_rate
+        stage = _BloomStage.for_capacity(
+            self.initial_capacity * self.growth**index,
+            self.error_rate * (1 - self.tightening) * self.tightening**index,
+        )
+        self.stages.append(stage)
+        return stage
+
+    def can_skip(self, job_id: str) -> bool:
+        return job_id in self
+
+    def add_seen(self, job_id: str):
+        self.add(job_id)
+
+    def add(self, job_id: str) -> bool:
+        """
+        :return: False when the id was probably already in the filter
+        """
+        hashes = _hashes(job_id)
+        if any(hashes in stage for stage in self.stages):
+            return False
+        stage = self.stages[-1] if self.stages else None
+        if stage is None or stage.is_full or not stage.is_writable:
+            stage = self._add_stage()
+        stage.add(hashes)
+        return True
+
+    def __contains__(self, job_id: str) -> bool:
+        hashes = _hashes(job_id)
+        return any(hashes in stage for stage in reversed(self.stages))
+
+    def __len__(self) -> int:
+        return sum(stage.count for stage in self.stages)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(stage.bits.nbytes for stage in self.stages)
+
+    def save(self, path: str | Path):
+        """
+        Writes the filter to a file that load() can memory-map. The file is
+        replaced atomically, so processes that mapped the old one are unaffected
+        """
+        stages = []
+        offset = 0
+        for stage in self.stages:
+            stages.append(
+                {
+                    "capacity": stage.capacity,
+                    "num_bits": stage.num_bits,
+                    "num_hashes": stage.num_hashes,
+                    "count": stage.count,
+                    "offset": offset,
+                }
+            )
+            offset += -(-stage.bits.nbytes // _ALIGNMENT) * _ALIGNMENT
+        header = json.dumps(
+            {
+                "initial_capacity": self.initial_capacity,
+                "error_rate": self.error_rate,
+                "growth": self.growth,
+                "tightening": self.tightening,
+                "stages": stages,
+            }
+        ).encode()
+        data_start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGNMENT) * _ALIGNMENT
+
+        tmp_path = Path(f"{path}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for stage, meta in zip(self.stages, stages):
+                f.seek(data_start + meta["offset"])
+                f.write(stage.bits.tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str | Path, mmap: bool = True) -> BloomFilter:
+        """
+        Reads a filter written by save()
+        :param path: file written by save()
+        :param mmap: maps the stages read-only, so that processes loading the same
+            file share its pages. Ids added afterwards go to a new in-memory stage
+        :return: the filter
+        """
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise ValueError(f"{path} is not a saved BloomFilter")
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+        data_start = -(-(len(_MAGIC) + 8 + header_size) // _ALIGNMENT) * _ALIGNMENT
+
+        bloom_filter = cls(
+            initial_capacity=header["initial_capacity"],
+            error_rate=header["error_rate"],
+            growth=header["growth"],
+            tightening=header["tightening"],
+        )
+        if not header["stages"]:
+            return bloom_filter
+        if mmap:
+            data = np.memmap(path, dtype=np.uint8, mode="r", offset=data_start)
+        else:
+            data = np.fromfile(path, dtype=np.uint8, offset=data_start)
+        for meta in header["stages"]:
+            bits = data[meta["offset"] : meta["offset"] + meta["num_bits"] // 8]
+            bloom_filter.stages.append(
+                _BloomStage(
+                    meta["capacity"],
+                    meta["num_bits"],
+                    meta["num_hashes"],
+                    bits=bits,
+                    count=meta["count"],
+                )
+            )
+        return bloom_filter
@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from jobspy.model import SITE_HOSTS, Site
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "jobspy" / "http.sqlite"
+
+# headers describing the encoded body, which is stored decoded
+_TRANSPORT_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+@dataclass
+class CacheEntry:
+    key: str
+    url: str
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+    encoding: str | None
+    stored_at: float
+    ttl: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.stored_at < self.ttl
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """
+        Conditional request headers revalidating the entry, empty when the site
+        sent neither an ETag nor a Last-Modified header
+        """
+        headers = CaseInsensitiveDict(self.headers)
+        validators = {}
+        if headers.get("etag"):
+            validators["If-None-Match"] = headers["etag"]
+        if headers.get("last-modified"):
+            validators["If-Modified-Since"] = headers["last-modified"]
+        return validators
+
+    def to_response(self, method: str, is_async: bool = False):
+        """
+        Rebuilds the response of the session type the entry is served to
+        :return: httpx.Response when is_async, else requests.Response
+        """
+        if is_async:
+            response = httpx.Response(
+                self.status_code,
+                headers=self.headers,
+                content=self.content,
+                request=httpx.Request(method, self.url),
+            )
+            if self.encoding:
+                response.encoding = self.encoding
+        else:
+            response = requests.Response()
+            response.status_code = self.status_code
+            response.headers = CaseInsensitiveDict(self.headers)
+            response._content = self.content
+            response.encoding = self.encoding
+            response.url = self.url
+        response.from_cache = True
+        return response
+
+
+class ResponseCache:
+    """
+    Disk backed HTTP response cache in SQLite. Entries expire after the TTL of
+    their site, are revalidated with ETag/Last-Modified when the site supports
+    it, and the least recently used ones are evicted above max_size bytes
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl: float = 3600,
+        site_ttls: dict[Site, float] | None = None,
+        max_size: int = 512 * 2**20,
+    ):
+        """
+        :param path: SQLite file, defaults to ~/.cache/jobspy/http.sqlite
+        :param ttl: seconds a response is served without revalidation
+        :param site_ttls: ttl overrides per site
+        :param max_size: total size of the cached bodies in bytes
+        """
+        self.path = Path(path) if path else DEFAULT_CACHE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.site_ttls = site_ttls or {}
+        self.max_size = max_size
+        self.hits = self.misses = self.revalidated = 0
+
+        self._lock = threading.Lock()
+        # access times of the entries read since the last write, flushed with
+        # it rather than by a commit per hit
+        self._accessed: dict[str, float] = {}
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                status_code INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                content BLOB NOT NULL,
+                encoding TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+        self._db.commit()
+        (self._size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+
+    @staticmethod
+    def make_key(method: str, url: str, **kwargs) -> str:
+        """
+        Key of a request, from its method, url, params and body
+        """
+        params = kwargs.get("params") or {}
+        if isinstance(params, dict):
+            params = params.items()
+        request = {
+            "method": method.upper(),
+            "url": url,
+            "params": sorted((str(k), str(v)) for k, v in params),
+            "data": kwargs.get("data"),
+            "json": kwargs.get("json"),
+        }
+        serialized = json.dumps(request, sort_keys=True, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def ttl_for(self, url: str) -> float:
+        host = urlsplit(url).hostname or ""
+        for site, ttl in self.site_ttls.items():
+            if SITE_HOSTS[site] in host:
+                return ttl
+        return self.ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status_code, headers, content, encoding, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._accessed[key] = time.time()
+        url, status_code, headers, content, encoding, stored_at = row
+        return CacheEntry(
+            key=key,
+            url=url,
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=content,
+            encoding=encoding,
+            stored_at=stored_at,
+            ttl=self.ttl_for(url),
+        )
+
+    def put(self, key: str, method: str, response) -> None:
+        """
+        Stores a successful requests, httpx or tls_client response. Cached
+        responses do not set cookies, so POSTs that set cookies are not stored,
+        nor are the responses whose body was only partly read
+        """
+        if response.status_code != 200 or getattr(response, "truncated", False):
+            return
+        if method.upper() != "GET" and "set-cookie" in response.headers:
+            return
+        headers = {
+            name: ", ".join(value) if isinstance(value, list) else value
+            for name, value in response.headers.items()
+            if name.lower() not in _TRANSPORT_HEADERS
+        }
+        content = response.content
+        encoding = getattr(response, "encoding", None)
+        if encoding is None and not isinstance(response, requests.Response):
+            # tls_client decodes bodies without a charset as utf-8
+            encoding = "utf-8"
+        now = time.time()
+        with self._lock:
+            previous = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    str(response.url),
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    encoding,
+                    now,
+                    now,
+                    len(content),
+                ),
+            )
+            self._size += len(content) - (previous[0] if previous else 0)
+            self._accessed.pop(key, None)
+            self._evict()
+            self._flush_accessed()
+            self._db.commit()
+
+    def refresh(self, entry: CacheEntry) -> None:
+        """
+        Marks an entry as fresh again after a 304 revalidation
+        """
+        entry.stored_at = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?",
+                (entry.stored_at, entry.key),
+            )
+            self._db.commit()
+
+    def _flush_accessed(self) -> None:
+        """
+        Writes the pending access times, the commit is left to the caller
+        """
+        if not self._accessed:
+            return
+        self._db.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._accessed.items()],
+        )
+        self._accessed.clear()
+
+    def _evict(self) -> None:
+        if self._size <= self.max_size:
+            return
+        # least recently used, counting the reads not written yet
+        self._flush_accessed()
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if self._size <= self.max_size:
+                break
+            evicted.append((key,))
+            self._size -= size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def delete(self, key: str) -> None:
+        """
+        Drops a response, e.g. one the site turned out to block
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return
+            self._accessed.pop(key, None)
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+            self._size -= row[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self._accessed.clear()
+            self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_accessed()
+            self._db.commit()
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
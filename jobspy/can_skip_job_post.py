@@ -1,8 +1,23 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
 
 
 class CanSkipJobPost(ABC):
 
     @abstractmethod
     def can_skip(self, job_id: str) -> bool:
-        pass
\ No newline at end of file
+        pass
+
+    def add_seen(self, job_id: str):
+        """
+        Called for every job a scraper returns, so that it can be skipped later
+        """
+        pass
+
+    def add_seen_many(self, job_ids: Iterable[str]):
+        """
+        Called with the jobs of each page a scraper returns, add_seen per job
+        unless overridden
+        """
+        for job_id in job_ids:
+            self.add_seen(job_id)
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jobspy.model import Compensation, JobPost
+
+# pay periods in a year, as convert_to_annual counts them
+_PERIODS_PER_YEAR = {
+    "yearly": 1,
+    "monthly": 12,
+    "weekly": 52,
+    "daily": 260,
+    "hourly": 2080,
+}
+# interval of the amounts of a salary without one, as extract_salary guesses it
+_HOURLY_THRESHOLD = 350
+_MONTHLY_THRESHOLD = 30000
+# pages read by a search with a job_filter per page of results_wanted, as the
+# jobs it drops do not count toward results_wanted
+FILTERED_PAGES_FACTOR = 5
+
+
+def _compile(patterns: list[str]) -> re.Pattern | None:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.I)
+
+
+@dataclass
+class JobFilter:
+    """
+    Jobs to drop from a scrape. Each scraper checks a field as soon as it has
+    parsed it, from the search card or API response, or from the job page for
+    the description, so a dropped job costs no detail request, no markdown
+    conversion and no JobPost. Dropped jobs do not count toward results_wanted
+    """
+
+    # company names, compared case-insensitively
+    exclude_companies: list[str] = field(default_factory=list)
+    # regexes, matched case-insensitively anywhere in the title
+    exclude_titles: list[str] = field(default_factory=list)
+    # regexes, matched case-insensitively anywhere in the description. Jobs
+    # scraped without a description are kept
+    exclude_descriptions: list[str] = field(default_factory=list)
+    # least yearly pay, in the currency of each job. Jobs without a salary are
+    # kept
+    min_salary: float | None = None
+
+    def __post_init__(self):
+        self._companies = {name.strip().lower() for name in self.exclude_companies}
+        self._titles = _compile(self.exclude_titles)
+        self._descriptions = _compile(self.exclude_descriptions)
+
+    def keeps(
+        self,
+        title: str | None = None,
+        company_name: str | None = None,
+        description: str | None = None,
+    ) -> bool:
+        """
+        Checks the fields known so far, None for those that are not
+        """
+        if company_name and company_name.strip().lower() in self._companies:
+            return False
+        if title and self._titles is not None and self._titles.search(title):
+            return False
+        if (
+            description
+            and self._descriptions is not None
+            and self._descriptions.search(description)
+        ):
+            return False
+        return True
+
+    def keeps_salary(
+        self,
+        min_amount: float | None,
+        max_amount: float | None,
+        interval=None,
+    ) -> bool:
+        """
+        :param interval: CompensationInterval or its value, guessed from the
+            amounts when None
+        :return: whether the top of the salary range reaches min_salary a year
+        """
+        if self.min_salary is None:
+            return True
+        amount = max_amount if max_amount is not None else min_amount
+        if amount is None:
+            return True
+        interval = getattr(interval, "value", interval)
+        if interval not in _PERIODS_PER_YEAR:
+            if amount < _HOURLY_THRESHOLD:
+                interval = "hourly"
+            elif amount < _MONTHLY_THRESHOLD:
+                interval = "monthly"
+            else:
+                interval = "yearly"
+        return amount * _PERIODS_PER_YEAR[interval] >= self.min_salary
+
+    def keeps_compensation(self, compensation: Compensation | None) -> bool:
+        if compensation is None:
+            return True
+        return self.keeps_salary(
+            compensation.min_amount, compensation.max_amount, compensation.interval
+        )
+
+    def keeps_job(self, job: JobPost) -> bool:
+        """
+        Checks every field of a scraped job
+        """
+        return self.keeps(
+            job.title, job.company_name, job.description
+        ) and self.keeps_compensation(job.compensation)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from jobspy.model import Country, JobPost, SalarySource
+from jobspy.util import convert_to_annual, desired_order, extract_salary
+
+
+def normalize_job(
+    job: JobPost,
+    site: str,
+    country: Country | None = None,
+    enforce_annual_salary: bool = False,
+) -> dict:
+    """
+    Flattens a JobPost into a row keyed by the columns of desired_order
+    :param job: scraped job
+    :param site: site value the job was scraped from
+    :param country: country of the search, used to parse salaries from descriptions
+    :param enforce_annual_salary: converts wages to annual salary
+    :return: dict with one entry per column in desired_order
+    """
+    job_data = {
+        "id": job.id,
+        "site": site,
+        "job_url": job.job_url,
+        "job_url_direct": job.job_url_direct,
+        "title": job.title,
+        "company": job.company_name,
+        "location": (
+            job.location.display_location() if job.location is not None else None
+        ),
+        "date_posted": job.date_posted,
+        "job_type": (
+            ", ".join(job_type.value[0] for job_type in job.job_type)
+            if job.job_type
+            else None
+        ),
+        "salary_source": None,
+        "interval": None,
+        "min_amount": None,
+        "max_amount": None,
+        "currency": None,
+        "is_remote": job.is_remote,
+        "job_level": job.job_level,
+        "job_function": job.job_function,
+        "listing_type": job.listing_type,
+        "emails": ", ".join(job.emails) if job.emails else None,
+        "description": job.description,
+        "company_industry": job.company_industry,
+        "company_url": job.company_url,
+        "company_logo": job.company_logo,
+        "company_url_direct": job.company_url_direct,
+        "company_addresses": job.company_addresses,
+        "company_num_employees": job.company_num_employees,
+        "company_revenue": job.company_revenue,
+        "company_description": job.company_description,
+        # naukri-specific fields
+        "skills": ", ".join(job.skills) if job.skills else None,
+        "experience_range": job.experience_range,
+        "company_rating": job.company_rating,
+        "company_reviews_count": job.company_reviews_count,
+        "vacancy_count": job.vacancy_count,
+        "work_from_home_type": job.work_from_home_type,
+    }
+
+    compensation = job.compensation
+    if compensation is not None:
+        job_data["interval"] = (
+            compensation.interval.value if compensation.interval else None
+        )
+        job_data["min_amount"] = compensation.min_amount
+        job_data["max_amount"] = compensation.max_amount
+        job_data["currency"] = compensation.currency
+        job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+        if enforce_annual_salary and (
+            job_data["interval"]
+            and job_data["interval"] != "yearly"
+            and job_data["min_amount"]
+            and job_data["max_amount"]
+        ):
+            convert_to_annual(job_data)
+    elif country == Country.USA:
+        (
+            job_data["interval"],
+            job_data["min_amount"],
+            job_data["max_amount"],
+            job_data["currency"],
+        ) = extract_salary(
+            job.description,
+            enforce_annual_salary=enforce_annual_salary,
+        )
+        job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+    if not job_data["min_amount"]:
+        job_data["salary_source"] = None
+    return job_data
+
+
+class JobFrameBuilder:
+    """
+    Accumulates normalized jobs column by column and builds a single DataFrame
+    """
+
+    def __init__(
+        self,
+        country: Country | None = None,
+        enforce_annual_salary: bool = False,
+    ):
+        self.country = country
+        self.enforce_annual_salary = enforce_annual_salary
+        self._columns: dict[str, list] = {column: [] for column in desired_order}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add_job(self, site: str, job: JobPost):
+        self.add_row(
+            normalize_job(
+                job,
+                site,
+                country=self.country,
+                enforce_annual_salary=self.enforce_annual_salary,
+            )
+        )
+
+    def add_row(self, job_data: dict):
+        for column, values in self._columns.items():
+            values.append(job_data.get(column))
+        self._rows += 1
+
+    def set_value(self, row: int, column: str, value):
+        """
+        Sets a column of a row already added, e.g. once it is enriched
+        :param row: index of the row, in the order the rows were added
+        """
+        self._columns[column][row] = value
+
+    def build(self) -> pd.DataFrame:
+        if not self._rows:
+            return pd.DataFrame()
+
+        data = {}
+        for column, values in self._columns.items():
+            if all(value is None for value in values):
+                # column missing from every job, kept as an empty object column
+                data[column] = pd.Series([None] * self._rows, dtype=object)
+            else:
+                # missing cells are NaN, as if each job had been concatenated
+                data[column] = pd.Series(
+                    [np.nan if value is None else value for value in values]
+                )
+        jobs_df = pd.DataFrame(data, columns=desired_order)
+
+        return jobs_df.sort_values(
+            by=["site", "date_posted"], ascending=[True, False]
+        ).reset_index(drop=True)
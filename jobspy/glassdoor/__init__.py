@@ -3,9 +3,9 @@ from __future__ import annotations
 import re
 import json
 import requests
-from typing import Tuple
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, as_completed
 
 from jobspy.glassdoor.constant import fallback_token, query_template, headers
 from jobspy.glassdoor.util import (
@@ -18,6 +18,7 @@ from jobspy.util import (
     create_logger,
     create_session,
     markdown_converter,
+    thread_concurrency,
 )
 from jobspy.exception import GlassdoorException
 from jobspy.model import (
@@ -34,13 +35,18 @@ log = create_logger("Glassdoor")
 
 class Glassdoor(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
         """
         Initializes GlassdoorScraper with the Glassdoor job search url
         """
         site = Site(Site.GLASSDOOR)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            site, proxies=proxies, ca_cert=ca_cert, parse_executor=parse_executor
+        )
 
         self.base_url = None
         self.country = None
@@ -56,6 +62,15 @@ class Glassdoor(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes Glassdoor for jobs with scraper_input criteria, page by page
+        :param scraper_input: Information about job search criteria.
+        :return: iterator over the jobs of each results page
+        """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
         self.base_url = self.scraper_input.country.get_glassdoor_url()
@@ -72,12 +87,15 @@ class Glassdoor(Scraper):
         )
         if location_type is None:
             log.error("Glassdoor: location not parsed")
-            return JobResponse(jobs=[])
-        job_list: list[JobPost] = []
+            return
+        job_count = 0
         cursor = None
 
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
+        if scraper_input.job_filter is not None:
+            # jobs dropped by the filter do not count toward results_wanted
+            tot_pages = self.max_pages + 1
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
             log.info(f"search page: {page} / {range_end - 1}")
@@ -85,14 +103,17 @@ class Glassdoor(Scraper):
                 jobs, cursor = self._fetch_jobs_page(
                     scraper_input, location_id, location_type, page, cursor
                 )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
             except Exception as e:
                 log.error(f"Glassdoor: {str(e)}")
                 break
-        return JobResponse(jobs=job_list)
+            jobs = jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(jobs)
+            if jobs:
+                yield jobs
+            elif scraper_input.job_filter is None or not cursor:
+                break
+            if job_count >= scraper_input.results_wanted:
+                break
 
     def _fetch_jobs_page(
         self,
@@ -131,17 +152,17 @@ class Glassdoor(Scraper):
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        executor = thread_concurrency.executor
+        future_to_job_data = {
+            executor.submit(self._process_job, job): job for job in jobs_data
+        }
+        for future in as_completed(future_to_job_data):
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
         return jobs, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
@@ -171,6 +192,9 @@ class Glassdoor(Scraper):
         job = job_data["jobview"]
         title = job["job"]["jobTitleText"]
         company_name = job["header"]["employerNameFromSearch"]
+        job_filter = self.scraper_input.job_filter
+        if job_filter is not None and not job_filter.keeps(title, company_name):
+            return None
         company_id = job_data["jobview"]["header"]["employer"]["id"]
         location_name = job["header"].get("locationName", "")
         location_type = job["header"].get("locationType", "")
@@ -185,10 +209,8 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        if job_filter is not None and not job_filter.keeps_compensation(compensation):
+            return None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -199,7 +221,7 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
+        job_post = JobPost(
             id=f"gd-{job_id}",
             title=title,
             company_url=company_url if company_id else None,
@@ -209,11 +231,21 @@ class Glassdoor(Scraper):
             location=location,
             compensation=compensation,
             is_remote=is_remote,
-            description=description,
-            emails=extract_emails_from_text(description) if description else None,
             company_logo=company_logo,
             listing_type=listing_type,
         )
+        if self._wants_details(self.scraper_input, job_post):
+            try:
+                description = self._fetch_job_description(job_id)
+            except:
+                description = None
+            if job_filter is not None and not job_filter.keeps(description=description):
+                return None
+            job_post.description = description
+            job_post.emails = (
+                extract_emails_from_text(description) if description else None
+            )
+        return job_post
 
     def _fetch_job_description(self, job_id):
         """
@@ -244,13 +276,13 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, json=body, headers=headers)
         if res.status_code != 200:
             return None
         data = res.json()[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
+            desc = self.parse(markdown_converter, desc)
         return desc
 
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 import math
 import re
-import json
-from typing import Tuple
+from concurrent.futures import Executor
+from typing import Iterator, Tuple
 from datetime import datetime, timedelta
 
 from jobspy.google.constant import headers_jobs, headers_initial, async_param
@@ -16,19 +16,33 @@ from jobspy.model import (
     Location,
     JobType,
 )
-from jobspy.util import extract_emails_from_text, extract_job_type, create_session
-from jobspy.google.util import log, find_job_info_initial_page, find_job_info
+from jobspy.util import (
+    extract_emails_from_text,
+    extract_job_type,
+    create_session,
+    slice_pages,
+)
+from jobspy.google.util import (
+    log,
+    find_job_info_initial_page,
+    find_job_info_next_page,
+)
 
 
 class Google(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
         """
         Initializes Google Scraper with the Goodle jobs search url
         """
         site = Site(Site.GOOGLE)
-        super().__init__(site, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            site, proxies=proxies, ca_cert=ca_cert, parse_executor=parse_executor
+        )
 
         self.country = None
         self.session = None
@@ -44,6 +58,15 @@ class Google(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes Google for jobs with scraper_input criteria, page by page
+        :param scraper_input: Information about job search criteria.
+        :return: iterator over the jobs of each results page
+        """
         self.scraper_input = scraper_input
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
@@ -55,33 +78,43 @@ class Google(Scraper):
             log.warning(
                 "initial cursor not found, try changing your query or there was at most 10 results"
             )
-            return JobResponse(jobs=job_list)
+            if job_list:
+                yield job_list
+            return
+
+        yield from slice_pages(
+            self._iter_next_pages(job_list, forward_cursor),
+            scraper_input.offset,
+            scraper_input.results_wanted,
+        )
 
+    def _iter_next_pages(
+        self, job_list: list[JobPost], forward_cursor: str
+    ) -> Iterator[list[JobPost]]:
+        yield job_list
         page = 1
+        # jobs dropped by job_filter are seen but not counted
+        job_count = len(job_list)
 
         while (
-            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
+            job_count < self.scraper_input.results_wanted + self.scraper_input.offset
             and forward_cursor
         ):
             log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                f"search page: {page} / {math.ceil(self.scraper_input.results_wanted / self.jobs_per_page)}"
             )
             try:
                 jobs, forward_cursor = self._get_jobs_next_page(forward_cursor)
             except Exception as e:
                 log.error(f"failed to get jobs on page: {page}, {e}")
                 break
-            if not jobs:
+            if not jobs and self.scraper_input.job_filter is None:
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            job_count += len(jobs)
+            if jobs:
+                yield jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _get_initial_cursor_and_jobs(self) -> Tuple[str, list[JobPost]]:
         """Gets initial cursor and jobs to paginate through job listings"""
@@ -126,7 +159,7 @@ class Google(Scraper):
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = find_job_info_initial_page(response.text)
+        jobs_raw = self.parse(find_job_info_initial_page, response.text)
         jobs = []
         for job_raw in jobs_raw:
             job_post = self._parse_job(job_raw)
@@ -143,22 +176,9 @@ class Google(Scraper):
         """
         Parses jobs on a page with next page cursor
         """
-        start_idx = job_data.find("[[[")
-        end_idx = job_data.rindex("]]]") + 3
-        s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
-
-        pattern_fc = r'data-async-fc="([^"]+)"'
-        match_fc = re.search(pattern_fc, job_data)
-        data_async_fc = match_fc.group(1) if match_fc else None
+        jobs_info, data_async_fc = self.parse(find_job_info_next_page, job_data)
         jobs_on_page = []
-        for array in parsed:
-            _, job_data = array
-            if not job_data.startswith("[[["):
-                continue
-            job_d = json.loads(job_data)
-
-            job_info = find_job_info(job_d)
+        for job_info in jobs_info:
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
@@ -172,6 +192,12 @@ class Google(Scraper):
 
         title = job_info[0]
         company_name = job_info[1]
+        description = job_info[19]
+        job_filter = self.scraper_input.job_filter
+        if job_filter is not None and not job_filter.keeps(
+            title, company_name, description
+        ):
+            return None
         location = city = job_info[2]
         state = country = date_posted = None
         if location and "," in location:
@@ -183,8 +209,6 @@ class Google(Scraper):
             days_ago = int(match.group()) if match else None
             date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
-        description = job_info[19]
-
         job_post = JobPost(
             id=f"go-{job_info[28]}",
             title=title,
@@ -1,3 +1,4 @@
+import json
 import re
 
 from jobspy.util import create_logger
@@ -23,13 +24,29 @@ def find_job_info(jobs_data: list | dict) -> list | None:
     return None
 
 
+def find_job_info_next_page(job_data: str) -> tuple[list, str | None]:
+    """
+    :return: the job listings of a next page and the cursor of the page after it
+    """
+    start_idx = job_data.find("[[[")
+    end_idx = job_data.rindex("]]]") + 3
+    parsed = json.loads(job_data[start_idx:end_idx])[0]
+
+    pattern_fc = r'data-async-fc="([^"]+)"'
+    match_fc = re.search(pattern_fc, job_data)
+    data_async_fc = match_fc.group(1) if match_fc else None
+    jobs_info = []
+    for _, job_data in parsed:
+        if job_data.startswith("[[["):
+            jobs_info.append(find_job_info(json.loads(job_data)))
+    return jobs_info, data_async_fc
+
+
 def find_job_info_initial_page(html_text: str):
     pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
     results = []
     matches = re.finditer(pattern, html_text)
 
-    import json
-
     for match in matches:
         try:
             parsed_data = json.loads(match.group(1))
@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import math
 from datetime import datetime
-from typing import Tuple
+from concurrent.futures import Executor
+from typing import Iterator, Tuple
 
+from jobspy.filters import FILTERED_PAGES_FACTOR
 from jobspy.indeed.constant import job_search_query, api_headers
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
 from jobspy.model import (
@@ -21,6 +23,7 @@ from jobspy.util import (
     markdown_converter,
     create_session,
     create_logger,
+    slice_pages,
 )
 
 log = create_logger("Indeed")
@@ -28,12 +31,15 @@ log = create_logger("Indeed")
 
 class Indeed(Scraper):
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
         """
         Initializes IndeedScraper with the Indeed API url
         """
-        super().__init__(Site.INDEED, proxies=proxies)
+        super().__init__(Site.INDEED, proxies=proxies, parse_executor=parse_executor)
 
         self.session = create_session(
             proxies=self.proxies, ca_cert=ca_cert, is_tls=False
@@ -53,32 +59,54 @@ class Indeed(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes Indeed for jobs with scraper_input criteria, page by page
+        :param scraper_input:
+        :return: iterator over the jobs of each search page
+        """
         self.scraper_input = scraper_input
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
         self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
-        job_list = []
-        page = 1
+        yield from slice_pages(
+            self._iter_search_pages(),
+            scraper_input.offset,
+            scraper_input.results_wanted,
+        )
 
+    def _iter_search_pages(self) -> Iterator[list[JobPost]]:
+        page = 1
         cursor = None
+        # jobs dropped by job_filter are seen but not counted
+        job_count = 0
+        jobs_wanted = self.scraper_input.results_wanted + self.scraper_input.offset
+        # bounds the pages of a filtered search, which keeps following the
+        # cursor past pages whose jobs were all dropped
+        max_pages = FILTERED_PAGES_FACTOR * math.ceil(jobs_wanted / self.jobs_per_page)
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while job_count < jobs_wanted:
+            if page > max_pages and self.scraper_input.job_filter is not None:
+                log.info(
+                    f"Job filter kept {job_count} jobs in {max_pages} pages. "
+                    "Ending pagination."
+                )
+                break
             log.info(
-                f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
+                f"search page: {page} / {math.ceil(self.scraper_input.results_wanted / self.jobs_per_page)}"
             )
             jobs, cursor = self._scrape_page(cursor)
-            if not jobs:
+            if not jobs and (self.scraper_input.job_filter is None or not cursor):
                 log.info(f"found no jobs on page: {page}")
                 break
-            job_list += jobs
+            job_count += len(jobs)
+            if jobs:
+                yield jobs
             page += 1
-        return JobResponse(
-            jobs=job_list[
-                scraper_input.offset : scraper_input.offset
-                + scraper_input.results_wanted
-            ]
-        )
 
     def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
         """
@@ -203,8 +231,19 @@ class Indeed(Scraper):
             return
         self.seen_urls.add(job_url)
         description = job["description"]["html"]
+        compensation = get_compensation(job["compensation"])
+        job_filter = self.scraper_input.job_filter
+        if job_filter is not None and not (
+            job_filter.keeps(
+                job["title"],
+                job["employer"].get("name") if job.get("employer") else None,
+                description,
+            )
+            and job_filter.keeps_compensation(compensation)
+        ):
+            return None
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            description = self.parse(markdown_converter, description)
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
@@ -227,7 +266,7 @@ class Indeed(Scraper):
                 country=job.get("location", {}).get("countryCode"),
             ),
             job_type=job_type,
-            compensation=get_compensation(job["compensation"]),
+            compensation=compensation,
             date_posted=date_posted,
             job_url=job_url,
             job_url_direct=(
@@ -3,71 +3,209 @@ from __future__ import annotations
 import asyncio
 import math
 import json
-import random
+import queue
+import threading
 import time
-from datetime import datetime
-from typing import Optional, List
-from urllib.parse import urlparse, urlunparse, unquote
+from collections import deque
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import AsyncIterator, Iterator, Optional, List, Tuple
 
-import regex as re
 from bs4 import BeautifulSoup
-from bs4.element import Tag
 from requests import Response
 
 from jobspy.can_skip_job_post import CanSkipJobPost
 from jobspy.exception import LinkedInException
+from jobspy.filters import JobFilter
 from jobspy.is_seen import IsSeen
 from jobspy.linkedin.company import Company
+from jobspy.linkedin.company_cache import CompanyCache, normalize_company_url
 from jobspy.linkedin.constant import headers
+from jobspy.linkedin.details import DetailResolver
+from jobspy.linkedin.paginator import PaginationStats, SearchPaginator
 from jobspy.linkedin.util import (
-    is_job_remote,
+    JobPageWatcher,
     job_type_code,
-    parse_job_type,
-    parse_job_level,
-    parse_company_industry
+    parse_search_cards,
+    parse_job_details,
 )
 from jobspy.model import (
     JobPost,
-    Location,
     JobResponse,
-    Country,
-    Compensation,
-    DescriptionFormat,
     Scraper,
     ScraperInput,
     Site,
 )
 from jobspy.util import (
-    extract_emails_from_text,
-    currency_parser,
-    markdown_converter,
     create_session,
-    remove_attributes,
     create_logger,
+    thread_concurrency,
 )
+from jobspy.watermark import Watermark, WatermarkStore
 
 log = create_logger("LinkedIn")
 MAX_RECORDS = 50000
+# cards returned by a guest search page
+SEARCH_PAGE_SIZE = 10
+# attempts of a request linkedin blocks, each through the next proxy
+BLOCKED_ATTEMPTS = 3
+SIGN_IN_WALLS = (
+    "linkedin.com/signup",
+    "linkedin.com/authwall",
+    "linkedin.com/checkpoint",
+)
+# companies fetched by the scrapers created without a company cache
+_company_cache = CompanyCache()
+# shards of linkedin_company_ids searched at once
+SHARD_CONCURRENCY = 4
+# marks the end of a shard's pages in the queue they are merged from
+_SHARD_DONE = object()
+
+
+
+
+class _IncrementalCrawl:
+    """
+    Watermark bookkeeping of one incremental search run. The search is limited
+    to the jobs posted since the previous run, and stops at the first page
+    made only of jobs at or below the previous watermark
+    """
+
+    def __init__(self, store: WatermarkStore, scraper_input: ScraperInput):
+        self.store = store
+        self.key = store.key_for(Site.LINKEDIN, scraper_input)
+        self.previous = store.get(self.key)
+        self.run_at = time.time()
+        self.newest: Watermark | None = None
+        self.reached = False
+        self.search_input = scraper_input
+        if self.previous is not None:
+            # an hour of margin for the jobs linkedin indexes late
+            hours_old = math.ceil((self.run_at - self.previous.run_at) / 3600) + 1
+            if scraper_input.hours_old is not None:
+                hours_old = min(hours_old, scraper_input.hours_old)
+            self.search_input = scraper_input.model_copy(
+                update={"hours_old": hours_old}
+            )
+
+    def reached_watermark(self, cards: List[dict]) -> bool:
+        """
+        Records the newest job of a search page
+        :return: whether every job of the page is at or below the watermark
+        """
+        job_ids = []
+        for card in cards:
+            try:
+                job_id = int(card["id"])
+            except (TypeError, ValueError):
+                continue
+            job_ids.append(job_id)
+            if self.newest is None or job_id > self.newest.job_id:
+                date_posted = card.get("date_posted")
+                self.newest = Watermark(
+                    job_id=job_id,
+                    date_posted=date_posted.date() if date_posted else None,
+                    run_at=self.run_at,
+                )
+        if self.previous is not None and job_ids:
+            self.reached = max(job_ids) <= self.previous.job_id
+        return self.reached
+
+    def finish(self, exhausted: bool):
+        """
+        Moves the watermark once the run covered every job since the previous
+        one, by reaching its watermark or the end of the results
+        :param exhausted: the search ran out of results
+        """
+        if self.previous is not None and not (exhausted or self.reached):
+            log.info(
+                "results_wanted was reached before the previous run's jobs, "
+                "the watermark is kept"
+            )
+            return
+        watermark = self.newest
+        if self.previous is not None and (
+            watermark is None or watermark.job_id < self.previous.job_id
+        ):
+            watermark = Watermark(
+                job_id=self.previous.job_id,
+                date_posted=self.previous.date_posted,
+                run_at=self.run_at,
+            )
+        if watermark is not None:
+            self.store.set(self.key, watermark)
+
+
+class _FanOut:
+    """
+    Merges the pages of the shards of a search, dropping the jobs another shard
+    already returned, up to results_wanted jobs
+    """
+
+    def __init__(self, results_wanted: int):
+        self.remaining = results_wanted
+        self.paginators: list[SearchPaginator] = []
+        self._ids: set[str] = set()
+
+    def add(self, paginator: SearchPaginator) -> SearchPaginator:
+        self.paginators.append(paginator)
+        return paginator
+
+    def merge(self, page_jobs: list[JobPost]) -> list[JobPost]:
+        """
+        :return: the jobs of a shard's page that are new, up to the jobs wanted
+        """
+        page_jobs = [job for job in page_jobs if job.id not in self._ids]
+        page_jobs = page_jobs[: self.remaining]
+        self._ids.update(job.id for job in page_jobs)
+        self.remaining -= len(page_jobs)
+        return page_jobs
 
+    def stats(self) -> PaginationStats:
+        """
+        :return: search pages of every shard
+        """
+        return PaginationStats(
+            requests=sum(p.stats.requests for p in self.paginators),
+            cards=sum(p.stats.cards for p in self.paginators),
+            new_cards=sum(p.stats.new_cards for p in self.paginators),
+        )
 
+    def log(self, shard_count: int):
+        log.info(f"{shard_count} company shards searched, {len(self._ids)} jobs found")
 
 
 class LinkedIn(Scraper):
+    supports_async = True
     base_url = "https://www.linkedin.com"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 25
 
     def __init__(
         self,
             proxies: list[str] | str | None = None,
             ca_cert: str | None = None,
-            is_async: bool = False
+            is_async: bool = False,
+            parse_executor: Executor | None = None,
+            can_skip: CanSkipJobPost | None = None,
+            company_cache: CompanyCache | None = None,
+            watermarks: WatermarkStore | None = None,
     ):
         """
         Initializes LinkedInScraper with the LinkedIn job search url
+        :param can_skip: known jobs to skip, e.g. a SeenJobStore kept across runs.
+            Defaults to the jobs seen during each search
+        :param company_cache: parsed companies, e.g. CompanyCache("companies.sqlite")
+            to keep them across runs. Defaults to a cache shared in memory by the
+            scrapers of the process
+        :param watermarks: crawls incrementally, paging only through the jobs
+            posted since the previous run of the same search
         """
-        super().__init__(Site.LINKEDIN, proxies=proxies, ca_cert=ca_cert, is_async=is_async)
+        super().__init__(
+            Site.LINKEDIN,
+            proxies=proxies,
+            ca_cert=ca_cert,
+            is_async=is_async,
+            parse_executor=parse_executor,
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -80,7 +218,19 @@ class LinkedIn(Scraper):
         )
         self.scraper_input = None
         self.country = "worldwide"
-        self.job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
+        self.can_skip = can_skip
+        self.company_cache = (
+            company_cache if company_cache is not None else _company_cache
+        )
+        self.watermarks = watermarks
+        # search pages of the last run, e.g. their overlap
+        self.pagination_stats: PaginationStats | None = None
+        # fetches the details of the last run's jobs, see linkedin_defer_details
+        self.details: DetailResolver | None = None
+        # jobs of the last run dropped by its job_filter, not checked again
+        self._dropped: set[str] = set()
+        # company fetches in flight, awaited by every caller asking for them
+        self._company_fetches: dict[str, asyncio.Future] = {}
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -88,84 +238,474 @@ class LinkedIn(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes LinkedIn for jobs with scraper_input criteria, page by page
+        :param scraper_input:
+        :return: iterator over the jobs of each search page
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
-        can_skip = IsSeen()
-        start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
-        request_count = 0
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < MAX_RECORDS
-        )
-        while continue_search():
-            request_count += 1
+        self.details = DetailResolver(self, scraper_input)
+        self._dropped = set()
+        can_skip = self.can_skip if self.can_skip is not None else IsSeen()
+        shards = self._company_shards(scraper_input)
+        if len(shards) > 1:
+            yield from self._iter_shards_sync(scraper_input, shards, can_skip)
+            return
+        paginator = self._new_paginator(scraper_input)
+        self.pagination_stats = paginator.stats
+        yield from self._iter_search_sync(scraper_input, can_skip, paginator)
+
+    def _iter_search_sync(
+        self,
+        scraper_input: ScraperInput,
+        can_skip: CanSkipJobPost,
+        paginator: SearchPaginator,
+    ) -> Iterator[list[JobPost]]:
+        """
+        Pages through a single search
+        :return: iterator over the jobs of each search page
+        """
+        job_count = 0
+        crawl = self._start_crawl(scraper_input)
+        search_input = crawl.search_input if crawl else scraper_input
+        exhausted = False
+        while job_count < scraper_input.results_wanted:
+            start = paginator.next_start()
+            if start is None:
+                exhausted = True
+                break
             log.info(
-                f"search page: {request_count} / {math.ceil(scraper_input.results_wanted / 10)}"
+                f"search page: {paginator.stats.requests + 1} / {math.ceil(scraper_input.results_wanted / 10)}"
             )
 
-            max_page_fetch = scraper_input.results_wanted - len(job_list)
+            max_page_fetch = scraper_input.results_wanted - job_count
             max_page_fetch = min(max_page_fetch, MAX_RECORDS - start)
-            page_jobs = self.get_job_ads_page_sync(scraper_input, start, can_skip, max_page_fetch)
-            for job in page_jobs:
-                can_skip.add_seen(job.id)
-            job_list += page_jobs
-
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                #start += len(job_list)
-                # TODO GARY not sure about this
-                start += len(page_jobs)
-
-        job_list = job_list[: scraper_input.results_wanted]
-        return JobResponse(jobs=job_list)
+            cards = self._get_search_cards_sync(search_input, start)
+            if not cards:
+                # failed request or no more results
+                exhausted = cards == []
+                break
+            paginator.record(start, cards)
+            if crawl is not None and crawl.reached_watermark(cards):
+                break
+            page_jobs = self._get_jobs_from_cards_sync(
+                cards, search_input, can_skip, max_page_fetch
+            )
+            can_skip.add_seen_many(job.id for job in page_jobs)
+            page_jobs = page_jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(page_jobs)
+            if page_jobs:
+                yield page_jobs
+        self._log_pagination(paginator)
+        if crawl is not None:
+            crawl.finish(exhausted=exhausted)
+
+    async def iter_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Async version of iter_pages, requires the scraper to be created with is_async
+        :param scraper_input:
+        :return: async iterator over the jobs of each search page
+        """
+        self.scraper_input = scraper_input
+        self.details = DetailResolver(self, scraper_input)
+        self._dropped = set()
+        can_skip = self.can_skip if self.can_skip is not None else IsSeen()
+        shards = self._company_shards(scraper_input)
+        if len(shards) > 1:
+            async for page_jobs in self._iter_shards(scraper_input, shards, can_skip):
+                yield page_jobs
+            return
+        paginator = self._new_paginator(scraper_input)
+        self.pagination_stats = paginator.stats
+        async for page_jobs in self._iter_search(scraper_input, can_skip, paginator):
+            yield page_jobs
 
+    async def _iter_search(
+        self,
+        scraper_input: ScraperInput,
+        can_skip: CanSkipJobPost,
+        paginator: SearchPaginator,
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Async version of _iter_search_sync
+        """
+        job_count = 0
+        crawl = self._start_crawl(scraper_input)
+        search_input = crawl.search_input if crawl else scraper_input
+        if scraper_input.linkedin_prefetch_pages > 1:
+            async for page_jobs in self._iter_pages_prefetch(
+                search_input, can_skip, paginator, crawl
+            ):
+                yield page_jobs
+            return
+        exhausted = False
+        while job_count < scraper_input.results_wanted:
+            start = paginator.next_start()
+            if start is None:
+                exhausted = True
+                break
+            log.info(
+                f"search page: {paginator.stats.requests + 1} / {math.ceil(scraper_input.results_wanted / 10)}"
+            )
+
+            max_page_fetch = scraper_input.results_wanted - job_count
+            max_page_fetch = min(max_page_fetch, MAX_RECORDS - start)
+            cards = await self._get_search_cards(search_input, start)
+            if not cards:
+                # failed request or no more results
+                exhausted = cards == []
+                break
+            paginator.record(start, cards)
+            if crawl is not None and crawl.reached_watermark(cards):
+                break
+            page_jobs = await self._get_jobs_from_cards(
+                cards, search_input, can_skip, max_page_fetch
+            )
+            can_skip.add_seen_many(job.id for job in page_jobs)
+            page_jobs = page_jobs[: scraper_input.results_wanted - job_count]
+            job_count += len(page_jobs)
+            if page_jobs:
+                yield page_jobs
+        self._log_pagination(paginator)
+        if crawl is not None:
+            crawl.finish(exhausted=exhausted)
+
+    async def _iter_pages_prefetch(
+        self,
+        scraper_input: ScraperInput,
+        can_skip: CanSkipJobPost,
+        paginator: SearchPaginator,
+        crawl: _IncrementalCrawl | None = None,
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Keeps linkedin_prefetch_pages search pages in flight at the offsets the
+        paginator picks, so the crawl is paced by the rate limiter rather than
+        by the latency of each page. Pages are handled in order of offset, cards
+        repeated by overlapping pages are skipped through can_skip
+        :return: async iterator over the jobs of each search page
+        """
+        window = scraper_input.linkedin_prefetch_pages
+        pending: deque[tuple[int, asyncio.Task]] = deque()
+        job_count = 0
+        exhausted = False
+        try:
+            while job_count < scraper_input.results_wanted:
+                while len(pending) < window:
+                    next_start = paginator.next_start()
+                    if next_start is None:
+                        break
+                    task = asyncio.create_task(
+                        self._get_search_cards(scraper_input, next_start)
+                    )
+                    pending.append((next_start, task))
+                if not pending:
+                    exhausted = True
+                    break
+                log.info(
+                    f"search page: {paginator.stats.requests + 1} / {math.ceil(scraper_input.results_wanted / SEARCH_PAGE_SIZE)}"
+                )
+                start, task = pending.popleft()
+                cards = await task
+                if not cards:
+                    # failed request or no more results
+                    exhausted = cards == []
+                    break
+                paginator.record(start, cards)
+                if crawl is not None and crawl.reached_watermark(cards):
+                    break
+                page_jobs = await self._get_jobs_from_cards(
+                    cards,
+                    scraper_input,
+                    can_skip,
+                    scraper_input.results_wanted - job_count,
+                )
+                can_skip.add_seen_many(job.id for job in page_jobs)
+                job_count += len(page_jobs)
+                if page_jobs:
+                    yield page_jobs
+        finally:
+            for _, task in pending:
+                task.cancel()
+        self._log_pagination(paginator)
+        if crawl is not None:
+            crawl.finish(exhausted=exhausted)
+
+    @staticmethod
+    def _new_paginator(scraper_input: ScraperInput) -> SearchPaginator:
+        start = scraper_input.offset // 10 * 10 if scraper_input.offset else 0
+        return SearchPaginator(start, page_size=SEARCH_PAGE_SIZE, max_start=MAX_RECORDS)
+
+    @staticmethod
+    def _company_shards(scraper_input: ScraperInput) -> list[ScraperInput]:
+        """
+        :return: a search per linkedin_company_shard_size company ids, or the
+            search itself when it is not split
+        """
+        company_ids = scraper_input.linkedin_company_ids
+        shard_size = scraper_input.linkedin_company_shard_size
+        if not company_ids or not shard_size or len(company_ids) <= shard_size:
+            return [scraper_input]
+        return [
+            scraper_input.model_copy(
+                update={"linkedin_company_ids": company_ids[i : i + shard_size]}
+            )
+            for i in range(0, len(company_ids), shard_size)
+        ]
+
+    def _iter_shards_sync(
+        self,
+        scraper_input: ScraperInput,
+        shards: list[ScraperInput],
+        can_skip: CanSkipJobPost,
+    ) -> Iterator[list[JobPost]]:
+        """
+        Searches the shards of linkedin_company_ids in threads, SHARD_CONCURRENCY
+        at a time under the shared rate limit, and merges their pages as they
+        arrive until results_wanted jobs are found
+        :return: iterator over the jobs of each search page
+        """
+        fan_out = _FanOut(scraper_input.results_wanted)
+        pages: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def search(shard: ScraperInput):
+            try:
+                paginator = fan_out.add(self._new_paginator(shard))
+                for page_jobs in self._iter_search_sync(shard, can_skip, paginator):
+                    pages.put(page_jobs)
+                    # before the request of the next page
+                    if stop.is_set():
+                        break
+            except Exception as e:
+                pages.put(e)
+            finally:
+                pages.put(_SHARD_DONE)
+
+        # a pool of its own, the shards wait on the detail fetches they submit
+        # to thread_concurrency.executor
+        executor = ThreadPoolExecutor(max_workers=SHARD_CONCURRENCY)
+        for shard in shards:
+            executor.submit(search, shard)
+        try:
+            shards_running = len(shards)
+            while shards_running and fan_out.remaining:
+                page_jobs = pages.get()
+                if page_jobs is _SHARD_DONE:
+                    shards_running -= 1
+                    continue
+                if isinstance(page_jobs, Exception):
+                    raise page_jobs
+                page_jobs = fan_out.merge(page_jobs)
+                if page_jobs:
+                    yield page_jobs
+        finally:
+            # the shards running end after their current page
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.pagination_stats = fan_out.stats()
+            fan_out.log(len(shards))
+
+    async def _iter_shards(
+        self,
+        scraper_input: ScraperInput,
+        shards: list[ScraperInput],
+        can_skip: CanSkipJobPost,
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Searches the shards of linkedin_company_ids concurrently, SHARD_CONCURRENCY
+        at a time under the shared rate limit, and merges their pages as they
+        arrive until results_wanted jobs are found
+        :return: async iterator over the jobs of each search page
+        """
+        fan_out = _FanOut(scraper_input.results_wanted)
+        pages: asyncio.Queue = asyncio.Queue()
+        semaphore = asyncio.Semaphore(SHARD_CONCURRENCY)
+
+        async def search(shard: ScraperInput):
+            try:
+                async with semaphore:
+                    paginator = fan_out.add(self._new_paginator(shard))
+                    async for page_jobs in self._iter_search(
+                        shard, can_skip, paginator
+                    ):
+                        await pages.put(page_jobs)
+            except Exception as e:
+                await pages.put(e)
+            finally:
+                await pages.put(_SHARD_DONE)
+
+        tasks = [asyncio.create_task(search(shard)) for shard in shards]
+        try:
+            shards_running = len(tasks)
+            while shards_running and fan_out.remaining:
+                page_jobs = await pages.get()
+                if page_jobs is _SHARD_DONE:
+                    shards_running -= 1
+                    continue
+                if isinstance(page_jobs, Exception):
+                    raise page_jobs
+                # shards running at once can both take a job before either
+                # marks it as seen
+                page_jobs = fan_out.merge(page_jobs)
+                if page_jobs:
+                    yield page_jobs
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self.pagination_stats = fan_out.stats()
+            fan_out.log(len(shards))
+
+    @staticmethod
+    def _log_pagination(paginator: SearchPaginator):
+        stats = paginator.stats
+        if paginator.stale_pages >= paginator.max_stale_pages:
+            log.info(f"no new cards on {paginator.stale_pages} pages in a row, stopping")
+        log.info(
+            f"{stats.requests} search pages, {stats.new_per_request:.1f} new cards "
+            f"per page, {stats.overlap_ratio:.0%} overlap"
+        )
+
+    def _start_crawl(self, scraper_input: ScraperInput) -> _IncrementalCrawl | None:
+        """
+        :return: the watermark bookkeeping of the run, None when not incremental
+        """
+        if self.watermarks is None:
+            return None
+        return _IncrementalCrawl(self.watermarks, scraper_input)
 
     def get_job_ads_page_sync(self,
                               scraper_input: ScraperInput,
                               start: int,
                               can_skip: CanSkipJobPost,
                               max_page_fetch: Optional[int] = None) -> List[JobPost]:
+        return self._get_job_ads_page_sync(
+            scraper_input, start, can_skip, max_page_fetch
+        )[0]
+
+    def _get_job_ads_page_sync(self,
+                               scraper_input: ScraperInput,
+                               start: int,
+                               can_skip: CanSkipJobPost,
+                               max_page_fetch: Optional[int] = None
+                               ) -> Tuple[List[JobPost], int]:
+        """
+        :return: new jobs of the search page, number of cards on the page
+        """
+        cards = self._get_search_cards_sync(scraper_input, start) or []
+        page_jobs = self._get_jobs_from_cards_sync(
+            cards, scraper_input, can_skip, max_page_fetch
+        )
+        return page_jobs, len(cards)
+
+    def _get_search_cards_sync(
+        self, scraper_input: ScraperInput, start: int
+    ) -> Optional[List[dict]]:
+        """
+        :return: parsed cards of the search page at start, None when the
+            request failed
+        """
         request_params = self._build_search_request(scraper_input, start)
         response = self._send_request_sync(request_params)
-        if response is None:
-            return []
-        basic_job_infos = self._parse_search_response(response,
-                                           scraper_input,
-                                           can_skip, max_page_fetch)
-        fetch_desc = scraper_input.linkedin_fetch_description
-        if fetch_desc:
-            for basic_info in basic_job_infos:
-                job_details = self._get_job_details_sync(basic_info, scraper_input)
-                basic_info.update(job_details)
-        result = [JobPost(**basic_info) for basic_info in basic_job_infos]
-        return result
+        if not self._is_search_page(response):
+            return None
+        return self.parse(
+            parse_search_cards, response.text, self.base_url, self.country
+        )
+
+    def _get_jobs_from_cards_sync(
+        self,
+        cards: List[dict],
+        scraper_input: ScraperInput,
+        can_skip: CanSkipJobPost,
+        max_page_fetch: Optional[int] = None,
+    ) -> List[JobPost]:
+        """
+        :return: jobs of the new cards, with their details when
+            linkedin_fetch_description is set
+        """
+        basic_job_infos = self._select_search_cards(
+            cards, can_skip, max_page_fetch, scraper_input.job_filter
+        )
+        detailed_infos = self._select_for_details(basic_job_infos, scraper_input)
+        # fetched in parallel, paced by the rate limiter like the async path
+        executor = thread_concurrency.executor
+        fetch_results = [
+            executor.submit(self._get_job_details_sync, basic_info, scraper_input)
+            for basic_info in detailed_infos
+        ]
+        for basic_info, fetch_result in zip(detailed_infos, fetch_results):
+            basic_info.update(fetch_result.result())
+        return self._kept_jobs(basic_job_infos, scraper_input.job_filter)
 
     async def get_job_ads_page(self,
                               scraper_input: ScraperInput,
                               start: int,
                               can_skip: CanSkipJobPost,
                               max_page_fetch: Optional[int] = None) -> List[JobPost]:
+        page_jobs, _ = await self._get_job_ads_page(
+            scraper_input, start, can_skip, max_page_fetch
+        )
+        return page_jobs
+
+    async def _get_job_ads_page(self,
+                                scraper_input: ScraperInput,
+                                start: int,
+                                can_skip: CanSkipJobPost,
+                                max_page_fetch: Optional[int] = None
+                                ) -> Tuple[List[JobPost], int]:
+        """
+        :return: new jobs of the search page, number of cards on the page
+        """
+        cards = await self._get_search_cards(scraper_input, start) or []
+        page_jobs = await self._get_jobs_from_cards(
+            cards, scraper_input, can_skip, max_page_fetch
+        )
+        return page_jobs, len(cards)
+
+    async def _get_search_cards(
+        self, scraper_input: ScraperInput, start: int
+    ) -> Optional[List[dict]]:
+        """
+        :return: parsed cards of the search page at start, None when the
+            request failed
+        """
         request_params = self._build_search_request(scraper_input, start)
         response = await self._send_request_async(request_params)
-        if response is None:
-            return []
-        basic_job_infos = self._parse_search_response(response,
-                                           scraper_input,
-                                           can_skip, max_page_fetch)
-        fetch_desc = scraper_input.linkedin_fetch_description
-        fetch_results = []
-        if fetch_desc:
-            fetch_tasks = []
-            for basic_info in basic_job_infos:
-                fetch_tasks.append(self._get_job_details_async(basic_info, scraper_input))
-            fetch_results = await asyncio.gather(*fetch_tasks)
-        result = []
-        for i in range(len(basic_job_infos)):
-            basic_info = basic_job_infos[i]
-            if fetch_desc:
-                job_details = fetch_results[i]
-                basic_info.update(job_details)
-            result.append(JobPost(**basic_info))
-        return result
+        if not self._is_search_page(response):
+            return None
+        return await self.parse_async(
+            parse_search_cards, response.text, self.base_url, self.country
+        )
+
+    async def _get_jobs_from_cards(
+        self,
+        cards: List[dict],
+        scraper_input: ScraperInput,
+        can_skip: CanSkipJobPost,
+        max_page_fetch: Optional[int] = None,
+    ) -> List[JobPost]:
+        """
+        :return: jobs of the new cards, with their details when
+            linkedin_fetch_description is set
+        """
+        basic_job_infos = self._select_search_cards(
+            cards, can_skip, max_page_fetch, scraper_input.job_filter
+        )
+        detailed_infos = self._select_for_details(basic_job_infos, scraper_input)
+        fetch_tasks = []
+        for basic_info in detailed_infos:
+            fetch_tasks.append(self._get_job_details_async(basic_info, scraper_input))
+        fetch_results = await asyncio.gather(*fetch_tasks)
+        for basic_info, job_details in zip(detailed_infos, fetch_results):
+            basic_info.update(job_details)
+        return self._kept_jobs(basic_job_infos, scraper_input.job_filter)
 
     def _build_search_request(self,
                               scraper_input: ScraperInput,
@@ -194,6 +734,9 @@ class LinkedIn(Scraper):
         }
         if seconds_old is not None:
             params["f_TPR"] = f"r{seconds_old}"
+        if self.watermarks is not None:
+            # newest first, so the crawl can stop at the previous run's jobs
+            params["sortBy"] = "DD"
 
         params = {k: v for k, v in params.items() if v is not None}
         request_params = {
@@ -204,9 +747,70 @@ class LinkedIn(Scraper):
         }
         return request_params
 
+    @staticmethod
+    def _block_reason(response) -> Optional[str]:
+        """
+        :return: why the response looks blocked by linkedin, None if it does not
+        """
+        if response.status_code in (429, 999):
+            return f"{response.status_code} response"
+        url = str(response.url)
+        if any(wall in url for wall in SIGN_IN_WALLS):
+            return "redirected to sign in"
+        if (
+            "seeMoreJobPostings" in url
+            and response.status_code == 200
+            and "<html" in response.text[:2000].lower()
+            and "base-search-card" not in response.text
+        ):
+            # the guest api answers with bare cards, or nothing past the last page
+            return "search page without job cards"
+        return None
+
+    @classmethod
+    def _is_search_page(cls, response: Optional[Response]) -> bool:
+        """
+        :return: whether the response holds search results. An error or block
+            page parses to no cards, which must not read as the end of them
+        """
+        return (
+            response is not None
+            and response.status_code in range(200, 300)
+            and cls._block_reason(response) is None
+        )
+
+    def _request_sync(self, request_params: dict) -> Response:
+        """
+        Sends a request, again through the next proxies while linkedin blocks it.
+        Blocks take the proxy out of rotation and slow down the requests
+        :return: the last response
+        """
+        for attempt in range(1, BLOCKED_ATTEMPTS + 1):
+            # a blocked response is dropped from the cache, retries bypass it
+            response = self.session.request(**request_params, read_cache=attempt == 1)
+            reason = self._block_reason(response)
+            self.session.report(response, blocked=reason is not None)
+            if reason is None or attempt == BLOCKED_ATTEMPTS:
+                return response
+            log.warning(f"Blocked by LinkedIn: {reason}, retrying ({attempt})")
+
+    async def _request_async(self, request_params: dict) -> Response:
+        """
+        Async version of _request_sync
+        """
+        for attempt in range(1, BLOCKED_ATTEMPTS + 1):
+            response = await self.session.request_async(
+                **request_params, read_cache=attempt == 1
+            )
+            reason = self._block_reason(response)
+            self.session.report(response, blocked=reason is not None)
+            if reason is None or attempt == BLOCKED_ATTEMPTS:
+                return response
+            log.warning(f"Blocked by LinkedIn: {reason}, retrying ({attempt})")
+
     def _send_request_sync(self, request_params: dict) -> Optional[Response]:
         try:
-            response = self.session.request(**request_params)
+            response = self._request_sync(request_params)
             if response.status_code not in range(200, 400):
                 if response.status_code == 429:
                     err = (
@@ -226,7 +830,7 @@ class LinkedIn(Scraper):
 
     async def _send_request_async(self, request_params: dict) -> Optional[Response]:
         try:
-            response = await self.session.request_async(**request_params)
+            response = await self._request_async(request_params)
             if response.status_code not in range(200, 400):
                 if response.status_code == 429:
                     err = (
@@ -244,53 +848,94 @@ class LinkedIn(Scraper):
                 log.exception(f"LinkedIn: Failed to send request async")
             return None
 
-    def _parse_search_response(self,
-                               response: Response,
-                               scraper_input: ScraperInput,
-                               can_skip: CanSkipJobPost,
-                               max_page_fetch: Optional[int] = None) -> List[dict]:
+    def _select_search_cards(self,
+                             cards: List[dict],
+                             can_skip: CanSkipJobPost,
+                             max_page_fetch: Optional[int] = None,
+                             job_filter: Optional[JobFilter] = None) -> List[dict]:
+        """
+        Keeps the parsed search cards that are new and that job_filter keeps, up
+        to max_page_fetch
+        :param cards: output of parse_search_cards
+        :return: basic job infos
+        """
         seen_ids = set()
         job_list = []
-        soup = BeautifulSoup(response.text, "html.parser")
-        job_cards = soup.find_all("div", class_="base-search-card")
-        if len(job_cards) == 0:
-            return job_list
-
-        for job_card in job_cards:
-            href_tag = job_card.find("a", class_="base-card__full-link")
-            if href_tag and "href" in href_tag.attrs:
-                href = href_tag.attrs["href"].split("?")[0]
-                job_id = href.split("-")[-1]
-                if can_skip.can_skip(job_id):
-                    continue
-                if job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
+        for card in cards:
+            job_id = card["id"]
+            if can_skip.can_skip(job_id) or job_id in self._dropped:
+                continue
+            if job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
 
-                try:
-                    basic_job_info = self._process_job(job_card, job_id)
-                    if basic_job_info:
-                        job_list.append(basic_job_info)
-                    if max_page_fetch is not None and len(job_list) >= max_page_fetch:
-                        break
-                except Exception as e:
-                    raise LinkedInException(str(e))
+            if "error" in card:
+                raise LinkedInException(card["error"])
+            if job_filter is not None and not (
+                job_filter.keeps(card["title"], card["company_name"])
+                and job_filter.keeps_compensation(card["compensation"])
+            ):
+                self._dropped.add(job_id)
+                continue
+            job_list.append(card)
+            if max_page_fetch is not None and len(job_list) >= max_page_fetch:
+                break
         return job_list
 
+    def _kept_jobs(
+        self, basic_job_infos: List[dict], job_filter: Optional[JobFilter]
+    ) -> List[JobPost]:
+        """
+        :return: jobs of the basic job infos whose description job_filter keeps
+        """
+        jobs = []
+        for basic_info in basic_job_infos:
+            if job_filter is not None and not job_filter.keeps(
+                description=basic_info.get("description")
+            ):
+                self._dropped.add(basic_info["id"])
+                continue
+            jobs.append(JobPost(**basic_info))
+        return jobs
+
     def get_company_info_sync(self, company_name: str, company_url) -> Optional[Company]:
+        company = self.company_cache.get(company_url)
+        if company is not None:
+            return company
         request_params = self._build_company_info_request(company_name, company_url)
         response = self._send_request_sync(request_params)
         if response is None:
             return None
-        return self._parse_company_response(company_name, response)
+        company = self._parse_company_response(company_name, response)
+        if company is not None:
+            self.company_cache.put(company_url, company)
+        return company
 
     async def get_company_info(self, company_name: str, company_url) -> Optional[Company]:
+        company = self.company_cache.get(company_url)
+        if company is not None:
+            return company
+        key = normalize_company_url(company_url)
+        fetch = self._company_fetches.get(key)
+        if fetch is None:
+            fetch = asyncio.ensure_future(
+                self._fetch_company_info(company_name, company_url)
+            )
+            self._company_fetches[key] = fetch
+            fetch.add_done_callback(lambda _: self._company_fetches.pop(key, None))
+        # a cancelled caller leaves the fetch running for the others
+        return await asyncio.shield(fetch)
+
+    async def _fetch_company_info(self, company_name: str, company_url) -> Optional[Company]:
         log.info(f"get_company_info called, company_name: {company_name}, url: {company_url}")
         request_params = self._build_company_info_request(company_name, company_url)
         response = await self._send_request_async(request_params)
         if response is None:
             return None
-        return self._parse_company_response(company_name, response)
+        company = self._parse_company_response(company_name, response)
+        if company is not None:
+            self.company_cache.put(company_url, company)
+        return company
 
 
     def _build_company_info_request(self, company_name, company_url: str) -> dict:
@@ -330,183 +975,81 @@ class LinkedIn(Scraper):
             log.error(ex, f"Failed to parse company html for company: {company_name}")
         return organization
 
-    def _process_job(
-        self, job_card: Tag, job_id: str
-    ) -> Optional[dict]:
-        salary_tag = job_card.find("span", class_="job-search-card__salary-info")
-
-        compensation = description = None
-        if salary_tag:
-            salary_text = salary_tag.get_text(separator=" ").strip()
-            salary_values = [currency_parser(value) for value in salary_text.split("-")]
-            salary_min = salary_values[0]
-            salary_max = salary_values[1]
-            currency = salary_text[0] if salary_text[0] != "$" else "USD"
-
-            compensation = Compensation(
-                min_amount=int(salary_min),
-                max_amount=int(salary_max),
-                currency=currency,
-            )
-
-        title_tag = job_card.find("span", class_="sr-only")
-        title = title_tag.get_text(strip=True) if title_tag else "N/A"
-
-        company_tag = job_card.find("h4", class_="base-search-card__subtitle")
-        company_a_tag = company_tag.find("a") if company_tag else None
-        company_url = (
-            urlunparse(urlparse(company_a_tag.get("href"))._replace(query=""))
-            if company_a_tag and company_a_tag.has_attr("href")
-            else ""
+    @staticmethod
+    def _fetches_details(scraper_input: ScraperInput) -> bool:
+        """
+        Whether job pages are fetched with the search, rather than later through
+        the details resolver
+        """
+        return (
+            scraper_input.linkedin_fetch_description
+            and not scraper_input.linkedin_defer_details
         )
-        company = company_a_tag.get_text(strip=True) if company_a_tag else "N/A"
 
-        metadata_card = job_card.find("div", class_="base-search-card__metadata")
-        location = self._get_location(metadata_card)
+    def _select_for_details(
+        self, basic_job_infos: List[dict], scraper_input: ScraperInput
+    ) -> List[dict]:
+        """
+        :return: the basic job infos whose job page is fetched with the search,
+            those fetch_details_if keeps
+        """
+        if not self._fetches_details(scraper_input):
+            return []
+        if scraper_input.fetch_details_if is None:
+            return basic_job_infos
+        return [
+            basic_info
+            for basic_info in basic_job_infos
+            if self._wants_details(scraper_input, JobPost(**basic_info))
+        ]
 
-        datetime_tag = (
-            metadata_card.find("time", class_="job-search-card__listdate")
-            if metadata_card
-            else None
-        )
-        date_posted = None
-        if datetime_tag and "datetime" in datetime_tag.attrs:
-            datetime_str = datetime_tag["datetime"]
-            try:
-                date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
-            except:
-                date_posted = None
-        is_remote = is_job_remote(f'{title} {location.display_location()}'.lower())
-
-        basic_job_info = {
-            "id" :f"{job_id}",
-            "title" : title,
-            "company_name" : company,
-            "company_url" : company_url,
-            "location" : location,
-            "is_remote" : is_remote,
-            "date_posted" : date_posted,
-            "job_url" : f"{self.base_url}/jobs/view/{job_id}",
-            "compensation" : compensation,
+    def _build_job_details_request(self, basic_job_info: dict, scraper_input: ScraperInput) -> dict:
+        request_params = {
+            'method': 'GET',
+            'url': f"{self.base_url}/jobs/view/{basic_job_info['id']}",
+            'timeout' : 5
         }
-
-        return basic_job_info
+        if scraper_input.linkedin_stream_details:
+            # closes the connection once the fields are read
+            request_params['stream_until'] = JobPageWatcher
+        return request_params
 
     def _get_job_details_sync(self, basic_job_info: dict, scraper_input: ScraperInput) -> dict:
         """
         Retrieves job description and other job details by going to the job page url
         :return: dict
         """
-        request_params = {
-            'method': 'GET',
-            'url': f"{self.base_url}/jobs/view/{basic_job_info['id']}",
-            'timeout' : 5
-        }
+        request_params = self._build_job_details_request(basic_job_info, scraper_input)
         try:
-            response = self.session.request(**request_params)
+            response = self._request_sync(request_params)
             response.raise_for_status()
         except Exception as ex:
             log.error(ex, f"failed to get job details. Job Id: {basic_job_info['id']}")
             return {}
-        return self._parse_job_details_response(basic_job_info, response, scraper_input)
+        return self.parse(
+            parse_job_details,
+            response.text,
+            str(response.url),
+            scraper_input.description_format,
+            basic_job_info["is_remote"],
+        )
 
     async def _get_job_details_async(self, basic_job_info: dict, scraper_input: ScraperInput) -> dict:
         """
         Retrieves job description and other job details by going to the job page url
         :return: dict
         """
-        request_params = {
-            'method': 'GET',
-            'url': f"{self.base_url}/jobs/view/{basic_job_info['id']}",
-            'timeout' : 5
-        }
+        request_params = self._build_job_details_request(basic_job_info, scraper_input)
         try:
-            response = await self.session.request_async(**request_params)
+            response = await self._request_async(request_params)
             response.raise_for_status()
         except Exception as ex:
             log.error(ex, f"failed to get job details. Job Id: {basic_job_info['id']}")
             return {}
-        return self._parse_job_details_response(basic_job_info, response, scraper_input)
-
-    def _parse_job_details_response(self, basic_job_info, response: Response, scraper_input) -> Optional[dict]:
-        if "linkedin.com/signup" in str(response.url):
-            return {}
-        soup = BeautifulSoup(response.text, "html.parser")
-        div_content = soup.find(
-            "div", class_=lambda x: x and "show-more-less-html__markup" in x
-        )
-        description = None
-        if div_content is not None:
-            div_content = remove_attributes(div_content)
-            description = div_content.prettify(formatter="html")
-            if scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
-        h3_tag = soup.find(
-            "h3", text=lambda text: text and "Job function" in text.strip()
-        )
-        job_function = None
-        if h3_tag:
-            job_function_span = h3_tag.find_next(
-                "span", class_="description__job-criteria-text"
-            )
-            if job_function_span:
-                job_function = job_function_span.text.strip()
-        company_logo = (
-            logo_image.get("data-delayed-url")
-            if (logo_image := soup.find("img", {"class": "artdeco-entity-image"}))
-            else None
+        return await self.parse_async(
+            parse_job_details,
+            response.text,
+            str(response.url),
+            scraper_input.description_format,
+            basic_job_info["is_remote"],
         )
-        return {
-            "description": description,
-            "job_level": parse_job_level(soup),
-            "company_industry": parse_company_industry(soup),
-            "job_type": parse_job_type(soup),
-            "job_url_direct": self._parse_job_url_direct(soup),
-            "company_logo": company_logo,
-            "job_function": job_function,
-            "emails": extract_emails_from_text(description),
-            "is_remote": basic_job_info["is_remote"] or is_job_remote(description.lower())
-        }
-
-    def _get_location(self, metadata_card: Optional[Tag]) -> Location:
-        """
-        Extracts the location data from the job metadata card.
-        :param metadata_card
-        :return: location
-        """
-        location = Location(country=Country.from_string(self.country))
-        if metadata_card is not None:
-            location_tag = metadata_card.find(
-                "span", class_="job-search-card__location"
-            )
-            location_string = location_tag.text.strip() if location_tag else "N/A"
-            parts = location_string.split(", ")
-            if len(parts) == 2:
-                city, state = parts
-                location = Location(
-                    city=city,
-                    state=state,
-                    country=Country.from_string(self.country),
-                )
-            elif len(parts) == 3:
-                city, state, country = parts
-                country = Country.from_string(country)
-                location = Location(city=city, state=state, country=country)
-        return location
-
-    def _parse_job_url_direct(self, soup: BeautifulSoup) -> str | None:
-        """
-        Gets the job url direct from job page
-        :param soup:
-        :return: str
-        """
-        job_url_direct = None
-        job_url_direct_content = soup.find("code", id="applyUrl")
-        if job_url_direct_content:
-            job_url_direct_match = self.job_url_direct_regex.search(
-                job_url_direct_content.decode_contents().strip()
-            )
-            if job_url_direct_match:
-                job_url_direct = unquote(job_url_direct_match.group())
-
-        return job_url_direct
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from jobspy.linkedin.company import Company
+
+
+def normalize_company_url(company_url: str) -> str:
+    """
+    Key of a company page, the same for the urls linkedin uses for one company,
+    e.g. with a country subdomain, tracking query or trailing slash
+    """
+    parts = urlsplit(company_url.strip())
+    host = (parts.hostname or "").lower()
+    if host == "linkedin.com" or host.endswith(".linkedin.com"):
+        host = "www.linkedin.com"
+    path = parts.path.rstrip("/").lower()
+    return f"https://{host}{path}"
+
+
+class CompanyCache:
+    """
+    TTL and LRU cache of parsed LinkedIn companies keyed by normalized company
+    url, optionally persisted in SQLite so that later runs reuse it
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 10_000,
+    ):
+        """
+        :param path: SQLite file, kept in memory only when None
+        :param ttl: seconds a company is served before it is fetched again
+        :param max_entries: companies kept in memory, the least recently used
+            ones are dropped above it
+        """
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = self.misses = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[Company, float]] = OrderedDict()
+        self._db = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS companies (
+                    key TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    number_of_employees INTEGER NOT NULL,
+                    stored_at REAL NOT NULL
+                )
+                """
+            )
+            self._db.execute(
+                "DELETE FROM companies WHERE stored_at <= ?", (time.time() - ttl,)
+            )
+            self._db.commit()
+
+    def get(self, company_url: str) -> Company | None:
+        """
+        :return: the cached company, None when it is missing or expired
+        """
+        key = normalize_company_url(company_url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._db is not None:
+                entry = self._load(key)
+            if entry is None or time.time() - entry[1] >= self.ttl:
+                self.misses += 1
+                return None
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._evict()
+            self.hits += 1
+            return entry[0]
+
+    def put(self, company_url: str, company: Company) -> None:
+        key = normalize_company_url(company_url)
+        stored_at = time.time()
+        with self._lock:
+            self._entries[key] = (company, stored_at)
+            self._entries.move_to_end(key)
+            self._evict()
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO companies VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        company.name,
+                        company.url,
+                        company.description,
+                        company.number_of_employees,
+                        stored_at,
+                    ),
+                )
+                self._db.commit()
+
+    def _load(self, key: str) -> tuple[Company, float] | None:
+        row = self._db.execute(
+            "SELECT name, url, description, number_of_employees, stored_at "
+            "FROM companies WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        company = Company()
+        (
+            company.name,
+            company.url,
+            company.description,
+            company.number_of_employees,
+            stored_at,
+        ) = row
+        return company, stored_at
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM companies")
+                self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
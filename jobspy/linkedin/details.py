@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Iterable
+
+import pandas as pd
+
+from jobspy.model import ScraperInput
+from jobspy.util import thread_concurrency
+
+if TYPE_CHECKING:
+    from jobspy.linkedin import LinkedIn
+
+# DataFrame attrs entry naming the resolver of the frame's LinkedIn jobs
+RESOLVER_ATTR = "jobspy_detail_resolver"
+
+# resolvers of the frames returned by scrape_jobs, by the key kept in df.attrs,
+# least recently used first. Past MAX_RESOLVERS the oldest are closed, so a
+# long running process does not keep a session per scrape
+MAX_RESOLVERS = 16
+_resolvers: OrderedDict[str, DetailResolver] = OrderedDict()
+_resolvers_lock = threading.Lock()
+
+
+class DetailResolver:
+    """
+    Fetches the job pages of LinkedIn jobs scraped without their details, for
+    the jobs the caller picks. Pages are fetched in parallel, paced by the rate
+    limiter, and each job's details are kept so it is only fetched once
+    """
+
+    def __init__(self, scraper: LinkedIn, scraper_input: ScraperInput):
+        """
+        :param scraper: scraper the job pages are fetched with
+        :param scraper_input: search of the jobs, for its description_format
+        """
+        self.scraper = scraper
+        self.scraper_input = scraper_input
+        self._details: dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, job_ids: Iterable[str]) -> dict[str, dict]:
+        """
+        :param job_ids: ids of the jobs, as in JobPost.id
+        :return: fields of the job page per job id, the keyword arguments of
+            JobPost that linkedin_fetch_description fills in. Jobs whose page
+            could not be fetched are left out
+        """
+        if self.scraper.is_async:
+            raise Exception("Invalid usage. Use resolve_async")
+        job_ids, missing = self._missing(job_ids)
+        fetches = [
+            thread_concurrency.executor.submit(
+                self.scraper._get_job_details_sync,
+                {"id": job_id, "is_remote": False},
+                self.scraper_input,
+            )
+            for job_id in missing
+        ]
+        self._keep(missing, [fetch.result() for fetch in fetches])
+        return self._resolved(job_ids)
+
+    async def resolve_async(self, job_ids: Iterable[str]) -> dict[str, dict]:
+        """
+        Async version of resolve, for a sync or async scraper
+        """
+        if not self.scraper.is_async:
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self.resolve, list(job_ids)
+            )
+        job_ids, missing = self._missing(job_ids)
+        details = await asyncio.gather(
+            *(
+                self.scraper._get_job_details_async(
+                    {"id": job_id, "is_remote": False}, self.scraper_input
+                )
+                for job_id in missing
+            )
+        )
+        self._keep(missing, details)
+        return self._resolved(job_ids)
+
+    def _missing(self, job_ids: Iterable[str]) -> tuple[list[str], list[str]]:
+        """
+        :return: the job ids, and those not resolved yet without repeats
+        """
+        job_ids = [str(job_id) for job_id in job_ids]
+        with self._lock:
+            missing = [job_id for job_id in job_ids if job_id not in self._details]
+        return job_ids, list(dict.fromkeys(missing))
+
+    def _keep(self, job_ids: list[str], details: list[dict]):
+        with self._lock:
+            for job_id, job_details in zip(job_ids, details):
+                # failed fetches are retried on the next call
+                if job_details:
+                    self._details[job_id] = job_details
+
+    def _resolved(self, job_ids: list[str]) -> dict[str, dict]:
+        with self._lock:
+            return {
+                job_id: self._details[job_id]
+                for job_id in job_ids
+                if job_id in self._details
+            }
+
+    def register(self) -> str:
+        """
+        Makes the resolver reachable from the frames whose attrs hold the key,
+        closing the least recently used resolvers past MAX_RESOLVERS
+        :return: the key
+        """
+        key = uuid.uuid4().hex
+        evicted = []
+        with _resolvers_lock:
+            _resolvers[key] = self
+            while len(_resolvers) > MAX_RESOLVERS:
+                evicted.append(_resolvers.popitem(last=False)[1])
+        for resolver in evicted:
+            resolver.close()
+        return key
+
+    def close(self):
+        """
+        Unregisters the resolver and closes the scraper's connections
+        """
+        with _resolvers_lock:
+            for key in [key for key, value in _resolvers.items() if value is self]:
+                del _resolvers[key]
+        if not self.scraper.is_async:
+            self.scraper.session.close()
+
+
+def resolver_for(jobs_df: pd.DataFrame) -> DetailResolver | None:
+    """
+    :return: the resolver of a frame returned by scrape_jobs with
+        linkedin_defer_details, None for other frames
+    """
+    key = jobs_df.attrs.get(RESOLVER_ATTR)
+    with _resolvers_lock:
+        if key not in _resolvers:
+            return None
+        _resolvers.move_to_end(key)
+        return _resolvers[key]
+
+
+def detail_columns(details: dict, is_remote: bool = False) -> dict:
+    """
+    Flattens the fields of a job page as normalize_job does
+    :param is_remote: whether the job's row already marks it as remote
+    :return: value per scrape_jobs column
+    """
+    job_type = details.get("job_type")
+    emails = details.get("emails")
+    return {
+        "description": details.get("description"),
+        "job_level": details.get("job_level"),
+        "company_industry": details.get("company_industry"),
+        "job_type": (
+            ", ".join(value.value[0] for value in job_type) if job_type else None
+        ),
+        "job_url_direct": details.get("job_url_direct"),
+        "company_logo": details.get("company_logo"),
+        "job_function": details.get("job_function"),
+        "emails": ", ".join(emails) if emails else None,
+        "is_remote": is_remote or bool(details.get("is_remote")),
+    }
+
+
+@pd.api.extensions.register_dataframe_accessor("jobspy")
+class JobsAccessor:
+    """
+    df.jobspy on the frames returned by scrape_jobs
+    """
+
+    def __init__(self, jobs_df: pd.DataFrame):
+        self._df = jobs_df
+
+    def resolve_details(self, index: Iterable | None = None) -> pd.DataFrame:
+        """
+        Fetches the LinkedIn job pages of chosen rows of a frame scraped with
+        linkedin_defer_details, e.g. df.head(20).jobspy.resolve_details()
+        :param index: labels of the rows to resolve, defaults to every row
+        :return: copy of the frame with the description, criteria, direct url
+            and other job page columns of the LinkedIn rows filled in
+        """
+        resolver = resolver_for(self._df)
+        if resolver is None:
+            raise ValueError(
+                "the frame has no detail resolver, scrape it with "
+                "linkedin_defer_details=True. Only the frames of the last "
+                f"{MAX_RESOLVERS} such scrapes keep theirs"
+            )
+        jobs_df = self._df.copy()
+        if jobs_df.empty:
+            return jobs_df
+        rows = jobs_df if index is None else jobs_df.loc[list(index)]
+        job_ids = rows.loc[rows["site"] == "linkedin", "id"].astype(str)
+        details = resolver.resolve(job_ids)
+        for label, job_id in job_ids.items():
+            if job_id not in details:
+                continue
+            is_remote = jobs_df.at[label, "is_remote"]
+            is_remote = bool(is_remote) if pd.notna(is_remote) else False
+            columns = detail_columns(details[job_id], is_remote)
+            for column, value in columns.items():
+                if jobs_df[column].dtype != object and not isinstance(value, bool):
+                    # e.g. a column without values, read back as float NaN
+                    jobs_df[column] = jobs_df[column].astype(object)
+                jobs_df.at[label, column] = value
+        return jobs_df
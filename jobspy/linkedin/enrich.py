@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from urllib.parse import urlsplit
+
+from jobspy.frame_builder import JobFrameBuilder
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin.company import Company
+from jobspy.linkedin.company_cache import CompanyCache, normalize_company_url
+from jobspy.util import create_logger
+
+log = create_logger("LinkedIn")
+
+# company pages fetched at once, on top of the scrape's own requests
+ENRICH_CONCURRENCY = 8
+
+
+def is_company_page(company_url: str | None) -> bool:
+    """
+    Whether a job's company url is a LinkedIn company page
+    """
+    if not company_url:
+        return False
+    return urlsplit(normalize_company_url(company_url)).path.startswith("/company/")
+
+
+class CompanyEnricher:
+    """
+    Resolves the LinkedIn company pages of the jobs of a scrape while it runs,
+    each company once however many jobs it posted, and fills in the employee
+    count and description of the jobs that have none
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        company_cache: CompanyCache | None = None,
+        max_concurrent: int = ENRICH_CONCURRENCY,
+    ):
+        """
+        :param company_cache: parsed companies, defaults to the cache shared by
+            the LinkedIn scrapers of the process
+        :param max_concurrent: company pages fetched at once
+        """
+        self.linkedin = LinkedIn(
+            proxies=proxies,
+            ca_cert=ca_cert,
+            is_async=True,
+            company_cache=company_cache,
+        )
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # company page -> its fetch, and the rows of its jobs
+        self._fetches: dict[str, asyncio.Future] = {}
+        self._rows: dict[str, list[int]] = {}
+
+    def add(self, row: int, job_data: dict) -> None:
+        """
+        Starts resolving the company of a job, unless it is already known
+        :param row: index of the job in the frame builder
+        :param job_data: normalized job
+        """
+        if job_data.get("company_num_employees") is not None:
+            return
+        company_url = job_data.get("company_url")
+        if not is_company_page(company_url):
+            return
+        key = normalize_company_url(company_url)
+        if key not in self._fetches:
+            self._fetches[key] = asyncio.ensure_future(
+                self._fetch(job_data.get("company") or "", company_url)
+            )
+            self._rows[key] = []
+        self._rows[key].append(row)
+
+    async def _fetch(self, company_name: str, company_url: str) -> Company | None:
+        async with self._semaphore:
+            try:
+                return await self.linkedin.get_company_info(company_name, company_url)
+            except Exception as e:
+                log.error(f"Failed to get company {company_url}: {e}")
+                return None
+
+    async def fill(self, frame_builder: JobFrameBuilder) -> None:
+        """
+        Waits for the companies and sets their columns in the rows of their jobs
+        """
+        companies = await asyncio.gather(*self._fetches.values())
+        for key, company in zip(self._fetches, companies):
+            if company is None:
+                continue
+            num_employees = (
+                str(company.number_of_employees)
+                if company.number_of_employees >= 0
+                else None
+            )
+            for row in self._rows[key]:
+                if num_employees is not None:
+                    frame_builder.set_value(row, "company_num_employees", num_employees)
+                if company.description:
+                    frame_builder.set_value(
+                        row, "company_description", company.description
+                    )
+        log.info(f"enriched {len(self._fetches)} companies")
+
+    async def aclose(self) -> None:
+        """
+        Cancels the fetches still running and closes the connections
+        """
+        for fetch in self._fetches.values():
+            fetch.cancel()
+        await asyncio.gather(*self._fetches.values(), return_exceptions=True)
+        await self.linkedin.aclose()
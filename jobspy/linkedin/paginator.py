@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class PaginationStats:
+    # search pages requested and parsed
+    requests: int = 0
+    # cards on those pages, and those not on an earlier page of the search
+    cards: int = 0
+    new_cards: int = 0
+    # offset between the last two pages requested, 0 over several searches
+    stride: int = 0
+
+    @property
+    def overlap_ratio(self) -> float:
+        """
+        Share of the cards that earlier pages of the search already returned
+        """
+        return 1 - self.new_cards / self.cards if self.cards else 0.0
+
+    @property
+    def new_per_request(self) -> float:
+        return self.new_cards / self.requests if self.requests else 0.0
+
+
+class SearchPaginator:
+    """
+    Picks the start offset of each guest search page. Consecutive pages
+    overlap by a varying number of cards, so the stride between offsets is
+    adapted to the overlap of each page: it grows while pages repeat more than
+    target_overlap cards and shrinks when they repeat none, which could mean
+    jobs were skipped. The search is exhausted after max_stale_pages pages in a
+    row without a new card
+    """
+
+    def __init__(
+        self,
+        start: int = 0,
+        page_size: int = 10,
+        max_start: int = 50000,
+        target_overlap: int = 1,
+        max_stale_pages: int = 2,
+    ):
+        """
+        :param start: offset of the first page
+        :param page_size: cards on a full page, the first stride
+        :param max_start: offset no page starts at or after
+        :param target_overlap: repeated cards per page aimed for, one shows
+            that no job was skipped between two pages
+        :param max_stale_pages: pages in a row without a new card that end the
+            search
+        """
+        self.page_size = page_size
+        self.max_start = max_start
+        self.target_overlap = target_overlap
+        self.max_stale_pages = max_stale_pages
+        self.stride = page_size
+        self.stats = PaginationStats(stride=page_size)
+        self.stale_pages = 0
+
+        self._next = start
+        # offsets of the last page taken and of the last page recorded
+        self._last_start: int | None = None
+        self._recorded_start: int | None = None
+        self._seen: set[str] = set()
+
+    @property
+    def exhausted(self) -> bool:
+        if self.stale_pages >= self.max_stale_pages:
+            return True
+        return self._next >= self.max_start
+
+    def next_start(self) -> int | None:
+        """
+        Takes the offset of the next page, the one after it following at the
+        current stride
+        :return: the offset, None once the search is exhausted
+        """
+        if self.exhausted:
+            return None
+        start = self._last_start = self._next
+        self._next += self.stride
+        return start
+
+    def record(self, start: int, cards: list[dict]) -> int:
+        """
+        Adapts the stride to the overlap of a page with the pages before it.
+        Pages must be recorded in the order of their offsets
+        :param start: offset the page was requested at
+        :param cards: parsed cards of the page
+        :return: cards not returned by an earlier page
+        """
+        new_ids = {card["id"] for card in cards} - self._seen
+        self._seen |= new_ids
+        overlap = len(cards) - len(new_ids)
+        if self._recorded_start is not None:
+            # the stride that would have left target_overlap repeated cards
+            gap = start - self._recorded_start
+            stride = gap + overlap - self.target_overlap
+            self.stride = max(1, min(2 * self.page_size, stride))
+        self._recorded_start = start
+        self.stats.requests += 1
+        self.stats.cards += len(cards)
+        self.stats.new_cards += len(new_ids)
+        self.stats.stride = self.stride
+        self.stale_pages = self.stale_pages + 1 if not new_ids else 0
+        if start == self._last_start:
+            # no later page is in flight, the next one takes the new stride
+            self._next = start + self.stride
+        return len(new_ids)
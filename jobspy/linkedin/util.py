@@ -1,7 +1,35 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+from urllib.parse import urlparse, urlunparse, unquote
+
+import regex as re
 from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    # optional, search cards are parsed with BeautifulSoup without it
+    lxml_html = None
 
-from jobspy.model import JobType, Location
-from jobspy.util import get_enum_from_job_type
+from jobspy.model import (
+    JobType,
+    Location,
+    Country,
+    Compensation,
+    DescriptionFormat,
+)
+from jobspy.util import (
+    get_enum_from_job_type,
+    extract_emails_from_text,
+    currency_parser,
+    markdown_converter,
+    remove_attributes,
+)
+
+job_url_direct_regex = re.compile(r'(?<=\?url=)[^"]+')
 
 
 def job_type_code(job_type_enum: JobType) -> str:
@@ -14,81 +42,479 @@ def job_type_code(job_type_enum: JobType) -> str:
     }.get(job_type_enum, "")
 
 
-def parse_job_type(soup_job_type: BeautifulSoup) -> list[JobType] | None:
+def is_job_remote(full_string: str) -> bool:
+    """
+    Searches the title, location, and description to check if job is remote
+    """
+    remote_keywords = ["remote", "work from home", "wfh"]
+    is_remote = any(keyword in full_string for keyword in remote_keywords)
+    return is_remote
+
+
+def parse_search_cards(html: str, base_url: str, country: str) -> list[dict]:
+    """
+    Parses the job cards of a guest search page, with lxml when it is installed
+    and BeautifulSoup otherwise. Runs standalone so it can be offloaded to a
+    parse executor
+    :param html: search page body
+    :param base_url: linkedin base url
+    :param country: default country of the job locations
+    :return: basic job info per card in page order, {"id", "error"} for cards that failed to parse
+    """
+    if lxml_html is not None:
+        return parse_search_cards_lxml(html, base_url, country)
+    return parse_search_cards_bs4(html, base_url, country)
+
+
+def parse_search_cards_bs4(html: str, base_url: str, country: str) -> list[dict]:
     """
-    Gets the job type from job page
-    :param soup_job_type:
-    :return: JobType
+    BeautifulSoup backend of parse_search_cards
     """
-    h3_tag = soup_job_type.find(
-        "h3",
-        class_="description__job-criteria-subheader",
-        string=lambda text: "Employment type" in text,
+    cards = []
+    soup = BeautifulSoup(html, "html.parser")
+    for job_card in soup.find_all("div", class_="base-search-card"):
+        href_tag = job_card.find("a", class_="base-card__full-link")
+        if href_tag and "href" in href_tag.attrs:
+            href = href_tag.attrs["href"].split("?")[0]
+            job_id = href.split("-")[-1]
+            try:
+                cards.append(parse_search_card(job_card, job_id, base_url, country))
+            except Exception as e:
+                cards.append({"id": job_id, "error": str(e)})
+    return cards
+
+
+def parse_search_card(
+    job_card: Tag, job_id: str, base_url: str, country: str
+) -> dict:
+    """
+    Parses the basic job info of a single search card
+    :return: dict
+    """
+    salary_tag = job_card.find("span", class_="job-search-card__salary-info")
+    title_tag = job_card.find("span", class_="sr-only")
+    company_tag = job_card.find("h4", class_="base-search-card__subtitle")
+    company_a_tag = company_tag.find("a") if company_tag else None
+    metadata_card = job_card.find("div", class_="base-search-card__metadata")
+    location_tag = (
+        metadata_card.find("span", class_="job-search-card__location")
+        if metadata_card is not None
+        else None
+    )
+    datetime_tag = (
+        metadata_card.find("time", class_="job-search-card__listdate")
+        if metadata_card
+        else None
+    )
+    return build_search_card(
+        job_id,
+        base_url,
+        country,
+        salary_text=salary_tag.get_text(separator=" ") if salary_tag else None,
+        title=title_tag.get_text(strip=True) if title_tag else None,
+        company=company_a_tag.get_text(strip=True) if company_a_tag else None,
+        company_href=company_a_tag.get("href") if company_a_tag else None,
+        location_text=location_tag.text if location_tag else None,
+        datetime_str=datetime_tag.get("datetime") if datetime_tag else None,
+    )
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+if lxml_html is not None:
+    # the same lookups as the BeautifulSoup backend, compiled once
+    _xpath_cards = etree.XPath(f"//div[{_has_class('base-search-card')}]")
+    _xpath_href = etree.XPath(f"(.//a[{_has_class('base-card__full-link')}])[1]")
+    _xpath_salary = etree.XPath(
+        f"(.//span[{_has_class('job-search-card__salary-info')}])[1]"
+    )
+    _xpath_title = etree.XPath(f"(.//span[{_has_class('sr-only')}])[1]")
+    _xpath_company = etree.XPath(
+        f"((.//h4[{_has_class('base-search-card__subtitle')}])[1]//a)[1]"
+    )
+    _xpath_metadata = etree.XPath(
+        f"(.//div[{_has_class('base-search-card__metadata')}])[1]"
+    )
+    _xpath_location = etree.XPath(
+        f"(.//span[{_has_class('job-search-card__location')}])[1]"
+    )
+    _xpath_datetime = etree.XPath(
+        f"(.//time[{_has_class('job-search-card__listdate')}])[1]"
     )
-    employment_type = None
-    if h3_tag:
-        employment_type_span = h3_tag.find_next_sibling(
-            "span",
-            class_="description__job-criteria-text description__job-criteria-text--criteria",
-        )
-        if employment_type_span:
-            employment_type = employment_type_span.get_text(strip=True)
-            employment_type = employment_type.lower()
-            employment_type = employment_type.replace("-", "")
 
-    return [get_enum_from_job_type(employment_type)] if employment_type else []
 
+def _first(xpath, element):
+    matches = xpath(element)
+    return matches[0] if matches else None
 
-def parse_job_level(soup_job_level: BeautifulSoup) -> str | None:
+
+def _text(element, strip: bool = False) -> str:
+    """
+    Text of an element as BeautifulSoup's get_text returns it
+    """
+    if strip:
+        return "".join(text.strip() for text in element.itertext())
+    return "".join(element.itertext())
+
+
+def parse_search_cards_lxml(html: str, base_url: str, country: str) -> list[dict]:
     """
-    Gets the job level from job page
-    :param soup_job_level:
-    :return: str
+    lxml backend of parse_search_cards, returns the same cards as the
+    BeautifulSoup one
     """
-    h3_tag = soup_job_level.find(
-        "h3",
-        class_="description__job-criteria-subheader",
-        string=lambda text: "Seniority level" in text,
+    if not html.strip():
+        return []
+    try:
+        document = lxml_html.document_fromstring(html)
+    except (ValueError, etree.ParserError):
+        # e.g. a body with an encoding declaration, which lxml rejects in a str
+        return parse_search_cards_bs4(html, base_url, country)
+    cards = []
+    for job_card in _xpath_cards(document):
+        href_tag = _first(_xpath_href, job_card)
+        if href_tag is None or href_tag.get("href") is None:
+            continue
+        job_id = href_tag.get("href").split("?")[0].split("-")[-1]
+        try:
+            salary_tag = _first(_xpath_salary, job_card)
+            title_tag = _first(_xpath_title, job_card)
+            company_a_tag = _first(_xpath_company, job_card)
+            metadata_card = _first(_xpath_metadata, job_card)
+            location_tag = datetime_tag = None
+            if metadata_card is not None:
+                location_tag = _first(_xpath_location, metadata_card)
+                datetime_tag = _first(_xpath_datetime, metadata_card)
+            cards.append(
+                build_search_card(
+                    job_id,
+                    base_url,
+                    country,
+                    salary_text=(
+                        " ".join(salary_tag.itertext())
+                        if salary_tag is not None
+                        else None
+                    ),
+                    title=(
+                        _text(title_tag, strip=True) if title_tag is not None else None
+                    ),
+                    company=(
+                        _text(company_a_tag, strip=True)
+                        if company_a_tag is not None
+                        else None
+                    ),
+                    company_href=(
+                        company_a_tag.get("href") if company_a_tag is not None else None
+                    ),
+                    location_text=(
+                        _text(location_tag) if location_tag is not None else None
+                    ),
+                    datetime_str=(
+                        datetime_tag.get("datetime")
+                        if datetime_tag is not None
+                        else None
+                    ),
+                )
+            )
+        except Exception as e:
+            cards.append({"id": job_id, "error": str(e)})
+    return cards
+
+
+def build_search_card(
+    job_id: str,
+    base_url: str,
+    country: str,
+    salary_text: str | None,
+    title: str | None,
+    company: str | None,
+    company_href: str | None,
+    location_text: str | None,
+    datetime_str: str | None,
+) -> dict:
+    """
+    Builds the basic job info of a search card from the texts extracted by a
+    parser backend, None for the elements missing from the card
+    :return: dict
+    """
+    compensation = None
+    if salary_text is not None:
+        salary_text = salary_text.strip()
+        salary_values = [currency_parser(value) for value in salary_text.split("-")]
+        salary_min = salary_values[0]
+        salary_max = salary_values[1]
+        currency = salary_text[0] if salary_text[0] != "$" else "USD"
+
+        compensation = Compensation(
+            min_amount=int(salary_min),
+            max_amount=int(salary_max),
+            currency=currency,
+        )
+
+    title = title if title is not None else "N/A"
+    company_url = (
+        urlunparse(urlparse(company_href)._replace(query=""))
+        if company_href is not None
+        else ""
+    )
+    company = company if company is not None else "N/A"
+    location = parse_location(
+        location_text.strip() if location_text is not None else None, country
     )
-    job_level = None
-    if h3_tag:
-        job_level_span = h3_tag.find_next_sibling(
-            "span",
-            class_="description__job-criteria-text description__job-criteria-text--criteria",
+    date_posted = None
+    if datetime_str is not None:
+        date_posted = parse_date_posted(datetime_str)
+
+    return {
+        "id": f"{job_id}",
+        "title": title,
+        "company_name": company,
+        "company_url": company_url,
+        "location": location,
+        "is_remote": is_job_remote(f"{title} {location.display_location()}".lower()),
+        "date_posted": date_posted,
+        "job_url": f"{base_url}/jobs/view/{job_id}",
+        "compensation": compensation,
+    }
+
+
+def parse_location(location_string: str | None, country: str) -> Location:
+    """
+    Parses the location of a search card, e.g. "Austin, TX" or "Berlin, Berlin, Germany"
+    :param location_string: text of the card's location, None if the card has no metadata
+    :param country: country used when the location does not name one
+    :return: location
+    """
+    location = Location(country=Country.from_string(country))
+    if location_string is not None:
+        parts = location_string.split(", ")
+        if len(parts) == 2:
+            city, state = parts
+            location = Location(
+                city=city,
+                state=state,
+                country=Country.from_string(country),
+            )
+        elif len(parts) == 3:
+            city, state, country = parts
+            country = Country.from_string(country)
+            location = Location(city=city, state=state, country=country)
+    return location
+
+
+def parse_date_posted(datetime_str: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(datetime_str, "%Y-%m-%d")
+    except:
+        return None
+
+
+def parse_job_details(
+    html: str,
+    url: str,
+    description_format: DescriptionFormat,
+    is_remote: bool,
+) -> dict:
+    """
+    Parses a job page into the fields that complete the basic job info, in a
+    single pass over the page, with lxml when it is installed and BeautifulSoup
+    otherwise. Runs standalone so it can be offloaded to a parse executor
+    :param html: job page body
+    :param url: final url of the job page, after redirects
+    :param description_format:
+    :param is_remote: whether the search card already marked the job as remote
+    :return: dict, empty if linkedin redirected to the signup page
+    """
+    if "linkedin.com/signup" in url:
+        return {}
+    details = None
+    if lxml_html is not None:
+        details = _job_details_lxml(html)
+    if details is None:
+        details = _job_details_bs4(html)
+    description, criteria, job_url_direct, company_logo = details
+
+    if description is not None and description_format == DescriptionFormat.MARKDOWN:
+        description = markdown_converter(description)
+
+    def criterion(label: str) -> str | None:
+        return next(
+            (value for name, value in criteria if name and label in name), None
         )
-        if job_level_span:
-            job_level = job_level_span.get_text(strip=True)
 
-    return job_level
+    employment_type = criterion("Employment type")
+    if employment_type:
+        employment_type = employment_type.lower().replace("-", "")
+    return {
+        "description": description,
+        "job_level": criterion("Seniority level"),
+        "company_industry": criterion("Industries"),
+        "job_type": (
+            [get_enum_from_job_type(employment_type)] if employment_type else []
+        ),
+        "job_url_direct": job_url_direct,
+        "company_logo": company_logo,
+        "job_function": criterion("Job function"),
+        "emails": extract_emails_from_text(description),
+        "is_remote": is_remote or is_job_remote((description or "").lower()),
+    }
+
+
+class JobPageWatcher:
+    """
+    Fed the body of a job page chunk by chunk, tells when it is read past the
+    end of the job criteria list. The top card with the logo and apply url,
+    the description and the criteria come before it, the similar jobs and
+    scripts making up most of the page after it, so parse_job_details gets the
+    same fields from the prefix as from the whole page
+    """
+
+    _start = b'class="description__job-criteria-list'
+    _end = b"</ul>"
 
+    def __init__(self):
+        self.done = False
+        self._in_criteria = False
+        # end of the previous chunk, for markers split between chunks
+        self._tail = b""
 
-def parse_company_industry(soup_industry: BeautifulSoup) -> str | None:
+    def __call__(self, chunk: bytes) -> bool:
+        """
+        :return: whether the page is read far enough
+        """
+        if self.done:
+            return True
+        data = self._tail + chunk
+        if not self._in_criteria:
+            index = data.find(self._start)
+            if index == -1:
+                self._tail = data[-len(self._start) :]
+                return False
+            self._in_criteria = True
+            data = data[index + len(self._start) :]
+        # the criteria list holds no nested list
+        self.done = self._end in data.lower()
+        self._tail = data[-len(self._end) :]
+        return self.done
+
+
+_CRITERIA_VALUE_CLASS = (
+    "description__job-criteria-text description__job-criteria-text--criteria"
+)
+
+# description html, (label, value) of the job criteria, job url direct, logo
+_JobDetails = tuple[
+    Optional[str], list[tuple[Optional[str], str]], Optional[str], Optional[str]
+]
+
+
+def _job_details_bs4(html: str) -> _JobDetails:
     """
-    Gets the company industry from job page
-    :param soup_industry:
-    :return: str
+    Collects the job page fields in one walk over the tags that can hold them
     """
-    h3_tag = soup_industry.find(
-        "h3",
-        class_="description__job-criteria-subheader",
-        string=lambda text: "Industries" in text,
+    soup = BeautifulSoup(html, "html.parser")
+    description_tag = apply_url_tag = company_logo = None
+    criteria = []
+    for tag in soup.find_all(["div", "h3", "img", "code"]):
+        classes = tag.get("class") or []
+        if tag.name == "div":
+            if description_tag is None and any(
+                "show-more-less-html__markup" in name for name in classes
+            ):
+                description_tag = tag
+        elif tag.name == "h3":
+            if "description__job-criteria-subheader" in classes:
+                value_tag = tag.find_next_sibling(
+                    "span", class_=_CRITERIA_VALUE_CLASS
+                )
+                if value_tag:
+                    criteria.append((tag.string, value_tag.get_text(strip=True)))
+        elif tag.name == "img":
+            if company_logo is None and "artdeco-entity-image" in classes:
+                company_logo = tag.get("data-delayed-url")
+        elif apply_url_tag is None and tag.get("id") == "applyUrl":
+            apply_url_tag = tag
+
+    description = None
+    if description_tag is not None:
+        description = remove_attributes(description_tag).prettify(formatter="html")
+    job_url_direct = (
+        _job_url_direct(apply_url_tag.decode_contents())
+        if apply_url_tag is not None
+        else None
     )
-    industry = None
-    if h3_tag:
-        industry_span = h3_tag.find_next_sibling(
-            "span",
-            class_="description__job-criteria-text description__job-criteria-text--criteria",
-        )
-        if industry_span:
-            industry = industry_span.get_text(strip=True)
+    return description, criteria, job_url_direct, company_logo
 
-    return industry
 
+def _job_details_lxml(html: str) -> _JobDetails | None:
+    """
+    lxml version of _job_details_bs4. Only the description is handed to
+    BeautifulSoup, so that it is formatted exactly as by the other backend
+    :return: None when lxml cannot parse the page
+    """
+    try:
+        document = lxml_html.document_fromstring(html)
+    except (ValueError, etree.ParserError):
+        return None
+    description_tag = apply_url_tag = company_logo = None
+    criteria = []
+    for tag in document.iter("div", "h3", "img", "code"):
+        classes = (tag.get("class") or "").split()
+        if tag.tag == "div":
+            if description_tag is None and any(
+                "show-more-less-html__markup" in name for name in classes
+            ):
+                description_tag = tag
+        elif tag.tag == "h3":
+            if "description__job-criteria-subheader" in classes:
+                value_tag = next(
+                    (
+                        sibling
+                        for sibling in tag.itersiblings("span")
+                        if sibling.get("class") == _CRITERIA_VALUE_CLASS
+                    ),
+                    None,
+                )
+                if value_tag is not None:
+                    criteria.append((_string(tag), _text(value_tag, strip=True)))
+        elif tag.tag == "img":
+            if company_logo is None and "artdeco-entity-image" in classes:
+                company_logo = tag.get("data-delayed-url")
+        elif apply_url_tag is None and tag.get("id") == "applyUrl":
+            apply_url_tag = tag
 
-def is_job_remote(full_string: str) -> bool:
+    description = None
+    if description_tag is not None:
+        fragment = lxml_html.tostring(
+            description_tag, encoding="unicode", with_tail=False
+        )
+        description_soup = BeautifulSoup(fragment, "html.parser")
+        description = remove_attributes(description_soup.find()).prettify(
+            formatter="html"
+        )
+    job_url_direct = None
+    if apply_url_tag is not None:
+        contents = "".join(
+            etree.tostring(child, encoding="unicode", with_tail=True)
+            for child in apply_url_tag
+        )
+        job_url_direct = _job_url_direct((apply_url_tag.text or "") + contents)
+    return description, criteria, job_url_direct, company_logo
+
+
+def _string(element) -> str | None:
     """
-    Searches the title, location, and description to check if job is remote
+    The element's text when it is its only content, as BeautifulSoup's .string
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    is_remote = any(keyword in full_string for keyword in remote_keywords)
-    return is_remote
+    if len(element) == 0:
+        return element.text
+    if len(element) == 1 and not element.text and not element[0].tail:
+        return _string(element[0])
+    return None
+
+
+def _job_url_direct(apply_url_contents: str) -> str | None:
+    job_url_direct_match = job_url_direct_regex.search(apply_url_contents.strip())
+    return unquote(job_url_direct_match.group()) if job_url_direct_match else None
+
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Executor
+from typing import AsyncIterator, Callable, Iterator, Optional, TypeVar
 from datetime import date
 from enum import Enum
+from urllib.parse import urlsplit
 from pydantic import BaseModel
 
+from jobspy.filters import JobFilter
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -293,6 +298,29 @@ class Site(Enum):
     NAUKRI = "naukri"
 
 
+# part of the host name identifying each site, glassdoor uses a domain per country
+SITE_HOSTS = {
+    Site.LINKEDIN: "linkedin.com",
+    Site.INDEED: "indeed.com",
+    Site.ZIP_RECRUITER: "ziprecruiter.com",
+    Site.GLASSDOOR: "glassdoor.",
+    Site.GOOGLE: "google.com",
+    Site.BAYT: "bayt.com",
+    Site.NAUKRI: "naukri.com",
+}
+
+
+def site_key(url: str) -> str:
+    """
+    The site of a url, or its host when it belongs to none of them
+    """
+    host = urlsplit(url).hostname or ""
+    for site, site_host in SITE_HOSTS.items():
+        if site_host in host:
+            return site.value
+    return host or "other"
+
+
 class SalarySource(Enum):
     DIRECT_DATA = "direct_data"
     DESCRIPTION = "description"
@@ -312,23 +340,112 @@ class ScraperInput(BaseModel):
     offset: int = 0
     linkedin_fetch_description: bool = False
     linkedin_company_ids: list[int] | None = None
+    linkedin_company_shard_size: int | None = None
+    linkedin_prefetch_pages: int = 1
+    linkedin_stream_details: bool = False
+    linkedin_defer_details: bool = False
+    # jobs as parsed from the search results whose detail request is sent
+    fetch_details_if: Callable[[JobPost], bool] | None = None
+    job_filter: JobFilter | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
 
     results_wanted: int = 15
     hours_old: int | None = None
 
 
+T = TypeVar("T")
+
+
 class Scraper(ABC):
+    # scrapers that implement iter_pages_async natively when created with is_async
+    supports_async = False
+
     def __init__(
         self,
             site: Site, proxies: list[str] | None = None,
             ca_cert: str | None = None,
-            is_async: bool = False
+            is_async: bool = False,
+            parse_executor: Executor | None = None,
     ):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
         self.is_async = is_async
+        self.parse_executor = parse_executor
+
+    def parse(self, parser: Callable[..., T], *args) -> T:
+        """
+        Runs a CPU bound parser on the raw response data, in the parse executor
+        if one was given. The parser must be a module level function so it can be
+        sent to a process pool
+        """
+        if self.parse_executor is None:
+            return parser(*args)
+        return self.parse_executor.submit(parser, *args).result()
+
+    async def parse_async(self, parser: Callable[..., T], *args) -> T:
+        """
+        Async version of parse
+        """
+        if self.parse_executor is None:
+            return parser(*args)
+        return await asyncio.wrap_future(self.parse_executor.submit(parser, *args))
+
+    @staticmethod
+    def _wants_details(scraper_input: ScraperInput, job: JobPost) -> bool:
+        """
+        Whether the detail request of a job is sent, see fetch_details_if
+        :param job: the job with the fields of its search result only
+        """
+        predicate = scraper_input.fetch_details_if
+        return predicate is None or bool(predicate(job))
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    async def aclose(self):
+        """
+        Closes the connections of the scraper's session
+        """
+        session = getattr(self, "session", None)
+        if session is not None:
+            await session.aclose()
+
+    async def __aenter__(self) -> Scraper:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Yields the jobs of each results page as soon as it is scraped.
+        Scrapers without page level support yield all of their jobs at once
+        :param scraper_input:
+        :return: iterator over lists of jobs
+        """
+        yield self.scrape(scraper_input).jobs
+
+    async def iter_pages_async(
+        self, scraper_input: ScraperInput
+    ) -> AsyncIterator[list[JobPost]]:
+        """
+        Async version of iter_pages. Scrapers without native async support step
+        through iter_pages on the event loop's default executor
+        :param scraper_input:
+        :return: async iterator over lists of jobs
+        """
+        loop = asyncio.get_running_loop()
+        pages = self.iter_pages(scraper_input)
+        try:
+            while True:
+                page = await loop.run_in_executor(None, next, pages, None)
+                if page is None:
+                    break
+                yield page
+        finally:
+            try:
+                pages.close()
+            except ValueError:
+                # still running a page in the executor, it stops on its own
+                pass
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
 import math
-import random
-import time
 from datetime import datetime, date, timedelta
-from typing import Optional
+from concurrent.futures import Executor
+from typing import Iterator, Optional
 
 import regex as re
 import requests
@@ -39,17 +38,20 @@ log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
     jobs_per_page = 20  
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
         """
-        super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
+        super().__init__(
+            Site.NAUKRI, proxies=proxies, ca_cert=ca_cert, parse_executor=parse_executor
+        )
         self.session = create_session(
             proxies=self.proxies,
             ca_cert=ca_cert,
@@ -69,8 +71,18 @@ class Naukri(Scraper):
         :param scraper_input:
         :return: job_response
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes Naukri API for jobs with scraper_input criteria, page by page
+        :param scraper_input:
+        :return: iterator over the jobs of each results page
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         seen_ids = set()
         start = scraper_input.offset or 0
         page = (start // self.jobs_per_page) + 1
@@ -79,7 +91,7 @@ class Naukri(Scraper):
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
         continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
+            lambda: job_count < scraper_input.results_wanted and page <= 50  # Arbitrary limit
         )
 
         while continue_search():
@@ -111,7 +123,7 @@ class Naukri(Scraper):
                 if response.status_code not in range(200, 400):
                     err = f"Naukri API response status code {response.status_code} - {response.text}"
                     log.error(err)
-                    return JobResponse(jobs=job_list)
+                    return
                 data = response.json()
                 job_details = data.get("jobDetails", [])
                 log.info(f"Received {len(job_details)} job entries from API")
@@ -120,8 +132,9 @@ class Naukri(Scraper):
                     break
             except Exception as e:
                 log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
+                return
 
+            page_jobs: list[JobPost] = []
             for job in job_details:
                 job_id = job.get("jobId")
                 if not job_id or job_id in seen_ids:
@@ -133,21 +146,18 @@ class Naukri(Scraper):
                     fetch_desc = scraper_input.linkedin_fetch_description
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
-                        job_list.append(job_post)
+                        page_jobs.append(job_post)
+                        job_count += 1
                         log.info(f"Added job: {job_post.title} (ID: {job_id})")
                     if not continue_search():
                         break
                 except Exception as e:
                     log.error(f"Error processing job ID {job_id}: {str(e)}")
                     raise NaukriException(str(e))
+            if page_jobs:
+                yield page_jobs
 
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
-                page += 1
-
-        job_list = job_list[:scraper_input.results_wanted]
-        log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
-        return JobResponse(jobs=job_list)
+            page += 1
 
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
@@ -157,16 +167,23 @@ class Naukri(Scraper):
         """
         title = job.get("title", "N/A")
         company = job.get("companyName", "N/A")
+        description = job.get("jobDescription") if full_descr else None
+        compensation = self._get_compensation(job.get("placeholders", []))
+        job_filter = self.scraper_input.job_filter
+        if job_filter is not None and not (
+            job_filter.keeps(title, company, description)
+            and job_filter.keeps_compensation(compensation)
+        ):
+            log.debug(f"Dropped job: {title} at {company}")
+            return None
         company_url = f"https://www.naukri.com/{job.get('staticUrl', '')}" if job.get("staticUrl") else None
 
         location = self._get_location(job.get("placeholders", []))
-        compensation = self._get_compensation(job.get("placeholders", []))
         date_posted = self._parse_date(job.get("footerPlaceholderLabel"), job.get("createdDate"))
 
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
-        description = job.get("jobDescription") if full_descr else None
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            description = self.parse(markdown_converter, description)
 
         job_type = parse_job_type(description) if description else None
         company_industry = parse_company_industry(description) if description else None
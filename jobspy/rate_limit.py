@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+from jobspy.model import SITE_HOSTS, Site, site_key
+
+# pace of the search pages, as the sleeps between pages used to be. Detail and
+# company pages are not limited by default
+DEFAULT_RATES: dict[Site | str, tuple[float, float]] = {
+    "linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings": (1 / 5, 1),
+    "api.ziprecruiter.com/jobs-app/jobs": (1 / 5, 1),
+    Site.NAUKRI: (1 / 5, 1),
+    Site.BAYT: (1 / 3.5, 1),
+}
+# starting rate of the hosts without a rate once they block a request
+ADAPTIVE_RATE = 1.0
+
+
+class TokenBucket:
+    """
+    Allows rate requests per second on average and up to burst at once. Each
+    acquire reserves a token, so waiting callers are served in order
+    """
+
+    def __init__(self, rate: float, burst: float = 1, min_rate: float = 1 / 60):
+        """
+        :param rate: requests per second, also the most slow_down can recover to
+        :param burst: requests allowed at once
+        :param min_rate: the least slow_down can reduce the rate to
+        """
+        self.rate = self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.burst = burst
+        # created for a host without a rate after it blocked a request
+        self.adaptive = False
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, going into debt when there is none
+        :return: seconds to wait before the token can be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    def slow_down(self):
+        """
+        Halves the rate, after the site blocked a request
+        """
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def speed_up(self):
+        """
+        Raises the rate by a tenth of its maximum, after a successful request
+        """
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+
+    def acquire(self):
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Token buckets per host, or per host and proxy, shared by every session in
+    the process. Rates are set per site or per url prefix such as
+    "linkedin.com/jobs-guest", the longest matching prefix wins. Hosts without
+    a rate are not limited unless a default rate is set
+    """
+
+    def __init__(
+        self,
+        default_rate: float | None = None,
+        default_burst: float = 1,
+        per_proxy: bool = False,
+        rates: dict[Site | str, tuple[float, float]] | None = None,
+    ):
+        """
+        :param default_rate: requests per second of the hosts without a rate
+        :param default_burst: burst of the hosts without a rate
+        :param per_proxy: keeps a bucket per proxy, so each proxy gets the rate
+        :param rates: (rate, burst) per site or url prefix, defaults to
+            DEFAULT_RATES
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.per_proxy = per_proxy
+        self._rules: dict[str, tuple[float, float] | None] = {}
+        self._buckets: dict[tuple[str, str | None], TokenBucket] = {}
+        self._lock = threading.Lock()
+        for target, (rate, burst) in (rates or DEFAULT_RATES).items():
+            self.set_rate(target, rate, burst)
+
+    def set_rate(self, target: Site | str, rate: float | None, burst: float = 1):
+        """
+        :param target: site, host or url prefix without scheme
+        :param rate: requests per second, None removes the limit
+        :param burst: requests allowed at once
+        """
+        rule = SITE_HOSTS[target] if isinstance(target, Site) else target
+        with self._lock:
+            self._rules[rule] = (rate, burst) if rate else None
+            # buckets are recreated with the new rate on the next request
+            self._buckets = {
+                key: bucket for key, bucket in self._buckets.items() if key[0] != rule
+            }
+
+    def _match(self, url: str) -> tuple[str, tuple[float, float] | None]:
+        parts = urlsplit(url)
+        host = parts.hostname or ""
+        matched = None
+        for rule in self._rules:
+            rule_host, _, rule_path = rule.partition("/")
+            if rule_host in host and parts.path.lstrip("/").startswith(rule_path):
+                if matched is None or len(rule) > len(matched):
+                    matched = rule
+        if matched is not None:
+            return matched, self._rules[matched]
+        if self.default_rate:
+            return host, (self.default_rate, self.default_burst)
+        return host, None
+
+    def bucket_for(
+        self, url: str, proxy: str | None = None, create: bool = False
+    ) -> TokenBucket | None:
+        """
+        :param create: creates a bucket at ADAPTIVE_RATE for a url without a rate,
+            removed once it recovers to that rate
+        :return: the bucket pacing the url, None when it is not limited
+        """
+        with self._lock:
+            key, rate = self._match(url)
+            bucket_key = (key, proxy if self.per_proxy else None)
+            bucket = self._buckets.get(bucket_key)
+            if bucket is None:
+                adaptive = rate is None and create
+                if adaptive:
+                    rate = (ADAPTIVE_RATE, 1)
+                if rate is None:
+                    return None
+                bucket = self._buckets[bucket_key] = TokenBucket(*rate)
+                bucket.adaptive = adaptive
+            return bucket
+
+    def report(self, url: str, proxy: str | None = None, blocked: bool = False):
+        """
+        Adapts the rate of a url to the site's blocks, halving it on a block and
+        recovering it additively on success. A host without a rate is unlimited
+        again once it recovers
+        """
+        bucket = self.bucket_for(url, proxy, create=blocked)
+        if bucket is None:
+            return
+        if blocked:
+            bucket.slow_down()
+            return
+        bucket.speed_up()
+        if bucket.adaptive and bucket.rate >= bucket.max_rate:
+            with self._lock:
+                self._buckets = {
+                    key: value
+                    for key, value in self._buckets.items()
+                    if value is not bucket
+                }
+
+    def acquire(self, url: str, proxy: str | None = None):
+        bucket = self.bucket_for(url, proxy)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, url: str, proxy: str | None = None):
+        bucket = self.bucket_for(url, proxy)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+
+class CircuitBreaker:
+    """
+    Takes a proxy out of rotation for a site once the site blocks it, for a
+    cooldown that doubles with each block in a row. The first request after
+    the cooldown tries the proxy again, a success closes the breaker
+    """
+
+    def __init__(self, cooldown: float = 60, max_cooldown: float = 900):
+        """
+        :param cooldown: seconds a proxy rests after its first block
+        :param max_cooldown: longest rest after repeated blocks
+        """
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        # (site, proxy) -> (blocks in a row, closes at)
+        self._state: dict[tuple[str, str | None], tuple[int, float]] = {}
+        self._lock = threading.Lock()
+
+    def retry_after(self, url: str, proxy: str | None = None) -> float:
+        """
+        :return: seconds until the proxy can be used for the url, 0 when it can
+        """
+        with self._lock:
+            state = self._state.get((site_key(url), proxy))
+        if state is None:
+            return 0.0
+        return max(0.0, state[1] - time.monotonic())
+
+    def is_open(self, url: str, proxy: str | None = None) -> bool:
+        return self.retry_after(url, proxy) > 0
+
+    def report(self, url: str, proxy: str | None = None, blocked: bool = False):
+        key = (site_key(url), proxy)
+        with self._lock:
+            if not blocked:
+                self._state.pop(key, None)
+                return
+            blocks = self._state.get(key, (0, 0.0))[0] + 1
+            cooldown = min(self.max_cooldown, self.cooldown * 2 ** (blocks - 1))
+            self._state[key] = (blocks, time.monotonic() + cooldown)
+
+    def reset(self):
+        with self._lock:
+            self._state.clear()
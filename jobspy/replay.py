@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import base64
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import requests
+
+from jobspy.cache import CacheEntry, ResponseCache
+from jobspy.model import site_key
+
+_TRANSPORT_HEADERS = {"content-encoding", "content-length", "transfer-encoding"}
+
+
+def archive_name(url: str) -> str:
+    """
+    Name of the archive a request is saved in, the site of the url or its host
+    """
+    return site_key(url)
+
+
+def _url_key(method: str, url: str, kwargs: dict) -> str:
+    return "url:" + ResponseCache.make_key(method, url, params=kwargs.get("params"))
+
+
+class HttpArchive:
+    """
+    Request/response pairs saved per site as gzipped JSON lines in a directory,
+    one file per site. Requests are matched on method, url, params and body,
+    then on method, url and params. Responses of a request recorded several
+    times are replayed in the order they were recorded, the last one repeating
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._responses: dict[str, list[dict]] | None = None
+        self._served: dict[str, int] = defaultdict(int)
+        self.misses: list[str] = []
+
+    def record(self, method: str, url: str, kwargs: dict, response) -> None:
+        """
+        Appends a requests, httpx or tls_client response to the site's archive
+        """
+        record = {
+            "key": ResponseCache.make_key(method, url, **kwargs),
+            "url_key": _url_key(method, url, kwargs),
+            "method": method.upper(),
+            "url": url,
+            "params": kwargs.get("params"),
+            "status_code": response.status_code,
+            "final_url": str(response.url),
+            "headers": {
+                name: ", ".join(value) if isinstance(value, list) else value
+                for name, value in response.headers.items()
+                if name.lower() not in _TRANSPORT_HEADERS
+            },
+            "encoding": getattr(response, "encoding", None),
+            "content": base64.b64encode(response.content).decode(),
+        }
+        if record["encoding"] is None:
+            if not isinstance(response, requests.Response):
+                # tls_client decodes bodies without a charset as utf-8
+                record["encoding"] = "utf-8"
+        line = json.dumps(record, default=str) + "\n"
+        with self._lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # appending gzip members keeps the file readable as a single stream
+            with gzip.open(self.path / f"{archive_name(url)}.jsonl.gz", "at") as f:
+                f.write(line)
+
+    def load(self) -> None:
+        """
+        Reads the archives, done on the first replayed request otherwise
+        """
+        with self._lock:
+            if self._responses is None:
+                self._responses = self._read()
+
+    def _read(self) -> dict[str, list[dict]]:
+        responses = defaultdict(list)
+        for archive in sorted(self.path.glob("*.jsonl.gz")):
+            with gzip.open(archive, "rt") as f:
+                for line in f:
+                    record = json.loads(line)
+                    responses[record["key"]].append(record)
+                    responses[record["url_key"]].append(record)
+        return responses
+
+    def replay(self, method: str, url: str, kwargs: dict, is_async: bool = False):
+        """
+        :return: the recorded response to the request, rebuilt as the session
+            type expects, or a 404 response when it was not recorded
+        """
+        self.load()
+        key = ResponseCache.make_key(method, url, **kwargs)
+        with self._lock:
+            records = self._responses.get(key)
+            if not records:
+                # bodies can hold timestamps or tokens, fall back to the url
+                key = _url_key(method, url, kwargs)
+                records = self._responses.get(key)
+            if records:
+                record = records[min(self._served[key], len(records) - 1)]
+                self._served[key] += 1
+        if not records:
+            self.misses.append(f"{method} {url}")
+            record = {
+                "status_code": 404,
+                "final_url": url,
+                "headers": {},
+                "encoding": "utf-8",
+                "content": "",
+            }
+        entry = CacheEntry(
+            key=key,
+            url=record["final_url"],
+            status_code=record["status_code"],
+            headers=record["headers"],
+            content=base64.b64decode(record["content"]),
+            encoding=record["encoding"],
+            stored_at=time.time(),
+            ttl=0,
+        )
+        response = entry.to_response(method, is_async=is_async)
+        response.from_cache = False
+        response.from_replay = True
+        return response
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterable
+
+from jobspy.can_skip_job_post import CanSkipJobPost
+
+DEFAULT_SEEN_STORE_PATH = Path.home() / ".cache" / "jobspy" / "seen.sqlite"
+
+
+class SeenJobStore(CanSkipJobPost):
+    """
+    Persistent set of seen job ids in SQLite, shared by the threads and
+    processes that open the same file. Ids expire max_age after they were seen
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_age: timedelta | None = None,
+        namespace: str = "",
+    ):
+        """
+        :param path: SQLite file, defaults to ~/.cache/jobspy/seen.sqlite
+        :param max_age: how long a job is skipped, forever when None
+        :param namespace: separates the ids of different sites or schedules
+        """
+        self.path = Path(path) if path else DEFAULT_SEEN_STORE_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age.total_seconds() if max_age is not None else None
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS seen_jobs (
+                namespace TEXT NOT NULL,
+                job_id TEXT NOT NULL,
+                seen_at REAL NOT NULL,
+                PRIMARY KEY (namespace, job_id)
+            )
+            """
+        )
+        self._db.commit()
+        self.purge()
+        # ids seen by this process or loaded at start, other processes' ids are
+        # looked up in the database on a miss
+        self._seen: dict[str, float] = dict(
+            self._db.execute(
+                "SELECT job_id, seen_at FROM seen_jobs WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchall()
+        )
+
+    def _is_expired(self, seen_at: float) -> bool:
+        return self.max_age is not None and time.time() - seen_at >= self.max_age
+
+    def can_skip(self, job_id: str) -> bool:
+        with self._lock:
+            seen_at = self._seen.get(job_id)
+            if seen_at is None:
+                row = self._db.execute(
+                    "SELECT seen_at FROM seen_jobs WHERE namespace = ? AND job_id = ?",
+                    (self.namespace, job_id),
+                ).fetchone()
+                if row is None:
+                    return False
+                seen_at = self._seen[job_id] = row[0]
+            return not self._is_expired(seen_at)
+
+    def add_seen(self, job_id: str):
+        self.add_seen_many([job_id])
+
+    def add_seen_many(self, job_ids: Iterable[str]):
+        """
+        Stores the ids in a single commit
+        """
+        seen_at = time.time()
+        job_ids = list(job_ids)
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO seen_jobs VALUES (?, ?, ?)",
+                [(self.namespace, job_id, seen_at) for job_id in job_ids],
+            )
+            self._db.commit()
+            self._seen.update(dict.fromkeys(job_ids, seen_at))
+
+    def purge(self) -> int:
+        """
+        Deletes the expired ids of the namespace
+        :return: number of ids deleted
+        """
+        if self.max_age is None:
+            return 0
+        with self._lock:
+            deleted = self._db.execute(
+                "DELETE FROM seen_jobs WHERE namespace = ? AND seen_at <= ?",
+                (self.namespace, time.time() - self.max_age),
+            ).rowcount
+            self._db.commit()
+            if hasattr(self, "_seen"):
+                self._seen = {
+                    job_id: seen_at
+                    for job_id, seen_at in self._seen.items()
+                    if not self._is_expired(seen_at)
+                }
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM seen_jobs WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()[0]
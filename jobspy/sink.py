@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import uuid
+from datetime import date
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import pandas as pd
+
+from jobspy.util import create_logger, desired_order
+
+log = create_logger("Sink")
+
+# columns with few distinct values, stored as dictionaries in arrow and parquet
+DICTIONARY_COLUMNS = (
+    "site",
+    "job_type",
+    "salary_source",
+    "interval",
+    "currency",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "company_industry",
+    "company_num_employees",
+    "company_revenue",
+    "experience_range",
+    "work_from_home_type",
+)
+FLOAT_COLUMNS = ("min_amount", "max_amount", "company_rating")
+INT_COLUMNS = ("company_reviews_count", "vacancy_count")
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError(
+            "ParquetSink requires pyarrow, install it with "
+            "`pip install python-jobspy[parquet]`"
+        ) from e
+    return pyarrow, pyarrow.dataset
+
+
+def job_schema():
+    """
+    Arrow schema of the scrape_jobs columns, in desired_order, plus the
+    scrape_date partition column
+    :return: pyarrow.Schema
+    """
+    pa, _ = _import_pyarrow()
+    fields = []
+    for column in desired_order:
+        if column in DICTIONARY_COLUMNS:
+            column_type = pa.dictionary(pa.int32(), pa.string())
+        elif column in FLOAT_COLUMNS:
+            column_type = pa.float64()
+        elif column in INT_COLUMNS:
+            column_type = pa.int64()
+        elif column == "date_posted":
+            column_type = pa.date32()
+        elif column == "is_remote":
+            column_type = pa.bool_()
+        else:
+            column_type = pa.string()
+        fields.append(pa.field(column, column_type))
+    fields.append(pa.field("scrape_date", pa.date32()))
+    return pa.schema(fields)
+
+
+class ParquetSink:
+    """
+    Writes scraped jobs as a hive partitioned parquet dataset. Each write adds
+    new files next to the existing ones, so runs append to the dataset
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        partition_by: tuple[str, ...] = ("site", "scrape_date"),
+        scrape_date: date | None = None,
+        batch_size: int = 1000,
+        compression: str = "zstd",
+    ):
+        """
+        :param path: root directory of the dataset
+        :param partition_by: partition columns, any of the schema columns
+        :param scrape_date: value of the scrape_date column, defaults to today
+        :param batch_size: number of jobs per record batch
+        :param compression: parquet compression codec
+        """
+        pa, ds = _import_pyarrow()
+        self.path = Path(path)
+        self.schema = job_schema()
+        unknown = [
+            column for column in partition_by if column not in self.schema.names
+        ]
+        if unknown:
+            raise ValueError(f"Unknown partition columns: {unknown}")
+        self.partition_by = tuple(partition_by)
+        self.scrape_date = scrape_date or date.today()
+        self.batch_size = batch_size
+        self.run_id = uuid.uuid4().hex
+        self.writes = 0
+
+        self._partitioning = ds.partitioning(
+            pa.schema([self.schema.field(column) for column in self.partition_by]),
+            flavor="hive",
+        )
+        self._file_options = ds.ParquetFileFormat().make_write_options(
+            compression=compression,
+            use_dictionary=list(DICTIONARY_COLUMNS),
+        )
+
+    def write(self, jobs: pd.DataFrame | Iterable[dict]) -> int:
+        """
+        Appends jobs to the dataset, streaming them in record batches
+        :param jobs: DataFrame returned by scrape_jobs, or the rows of iter_jobs
+        :return: number of jobs written
+        """
+        _, ds = _import_pyarrow()
+        written = 0
+
+        def batches():
+            nonlocal written
+            for batch in self._iter_batches(jobs):
+                written += batch.num_rows
+                yield batch
+
+        ds.write_dataset(
+            batches(),
+            self.path,
+            schema=self.schema,
+            format="parquet",
+            partitioning=self._partitioning,
+            basename_template=f"{self.run_id}-{self.writes}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            file_options=self._file_options,
+        )
+        self.writes += 1
+        log.info(f"wrote {written} jobs to {self.path}")
+        return written
+
+    def _iter_batches(self, jobs: pd.DataFrame | Iterable[dict]) -> Iterator:
+        pa, _ = _import_pyarrow()
+        if isinstance(jobs, pd.DataFrame):
+            if jobs.empty:
+                return
+            # missing columns would be float, which arrow can't convert to strings
+            missing = {
+                column: object for column in desired_order if column not in jobs
+            }
+            jobs_df = (
+                jobs.reindex(columns=desired_order)
+                .astype(missing)
+                .assign(scrape_date=self.scrape_date)
+            )
+            table = pa.Table.from_pandas(
+                jobs_df, schema=self.schema, preserve_index=False
+            )
+            yield from table.to_batches(max_chunksize=self.batch_size)
+            return
+
+        rows = iter(jobs)
+        while chunk := list(islice(rows, self.batch_size)):
+            yield pa.RecordBatch.from_pylist(
+                [{**row, "scrape_date": self.scrape_date} for row in chunk],
+                schema=self.schema,
+            )
+
+
+def read_jobs(
+    path: str | Path,
+    partition_by: tuple[str, ...] = ("site", "scrape_date"),
+    **filters,
+) -> pd.DataFrame:
+    """
+    Reads a dataset written by ParquetSink
+    :param path: root directory of the dataset
+    :param partition_by: partition columns the dataset was written with
+    :param filters: equality filters on columns, e.g. site="indeed"
+    :return: Pandas DataFrame with the columns of scrape_jobs and scrape_date
+    """
+    pa, ds = _import_pyarrow()
+    schema = job_schema()
+    partitioning = ds.HivePartitioning.discover(
+        schema=pa.schema([schema.field(column) for column in partition_by])
+    )
+    dataset = ds.dataset(path, format="parquet", partitioning=partitioning)
+    expression = None
+    for column, value in filters.items():
+        condition = ds.field(column) == value
+        expression = condition if expression is None else expression & condition
+    table = dataset.to_table(columns=schema.names, filter=expression)
+    return table.to_pandas()
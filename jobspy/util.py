@@ -3,7 +3,10 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from itertools import cycle
+from weakref import WeakKeyDictionary
 import httpx
 import httpx_retries
 import numpy as np
@@ -14,8 +17,19 @@ from httpx_retries import RetryTransport
 from markdownify import markdownify as md
 from requests import Response
 from requests.adapters import HTTPAdapter, Retry
-from typing import MutableMapping, TypeAlias, Any
+from typing import (
+    MutableMapping,
+    TypeAlias,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Iterable,
+    Iterator,
+)
+from jobspy.cache import CacheEntry, ResponseCache
 from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.rate_limit import CircuitBreaker, RateLimiter
+from jobspy.replay import HttpArchive
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -34,6 +48,12 @@ def create_logger(name: str):
 
 _Verify: TypeAlias = bool | str
 
+# bytes read at a time from the body of a streamed request
+STREAM_CHUNK_SIZE = 16 * 1024
+# a streamed body is read to the end rather than closed once its unread part is
+# at most this long, which keeps the connection for the next request
+STREAM_DRAIN_BYTES = 16 * 1024
+
 
 
 
@@ -41,27 +61,43 @@ class RotatingProxySession:
     def __init__(self, proxies=None, is_async = False):
         self.is_async = is_async
         if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
-        else:
-            self.proxy_cycle = None
+            proxies = [proxies]
+        self.proxy_cycle = (
+            cycle([(proxy, self.format_proxy(proxy)) for proxy in proxies])
+            if proxies
+            else None
+        )
+        self.proxy_count = len(proxies) if proxies else 0
 
 
     def format_proxy(self, proxy):
-        """Utility method to format a proxy string into a dictionary."""
-        if proxy.startswith("http://") or proxy.startswith("https://"):
-            return {"http": proxy, "https": proxy}
-        if proxy.startswith("socks5://"):
-            return {"http": proxy, "https": proxy}
-        if not self.is_async:
-            return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
-        else:
-            return {"http://": httpx.AsyncHTTPTransport(proxy=f"http://{proxy}"), "https://": httpx.AsyncHTTPTransport(proxy=f"http://{proxy}")}
+        """Utility method to format a proxy string into a dictionary, or a url for async sessions."""
+        if not proxy.startswith(("http://", "https://", "socks5://")):
+            proxy = f"http://{proxy}"
+        if self.is_async:
+            return proxy
+        return {"http": proxy, "https": proxy}
+
+    def next_proxy(self, url: str | None = None) -> tuple[str | None, dict | None]:
+        """
+        Advances the proxy cycle, past the proxies the url's site has blocked
+        :param url: skips the proxies whose breaker is open for it
+        :return: the proxy as given and formatted, (None, None) without proxies.
+            When every proxy is blocked, the one available the soonest
+        """
+        if not self.proxy_cycle:
+            return None, None
+        if url is None:
+            return next(self.proxy_cycle)
+        soonest = None
+        for _ in range(self.proxy_count):
+            proxy = next(self.proxy_cycle)
+            retry_after = proxy_breaker.retry_after(url, proxy[0])
+            if not retry_after:
+                return proxy
+            if soonest is None or retry_after < soonest[0]:
+                soonest = (retry_after, proxy)
+        return soonest[1]
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
@@ -85,55 +121,155 @@ class RequestsRotating(RotatingProxySession, requests.Session):
             self.mount("http://", adapter)
             self.mount("https://", adapter)
 
-    def request(self, method, url, **kwargs):
+    def request(self, method, url, rotating_proxy=None, **kwargs):
         if self.clear_cookies:
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
+        if rotating_proxy is None:
+            _, rotating_proxy = self.next_proxy()
+        # passed per request, the session can be shared by threads
+        if rotating_proxy and rotating_proxy["http"] != "http://localhost":
+            kwargs.setdefault("proxies", rotating_proxy)
         return requests.Session.request(self, method, url, **kwargs)
 
-class RequestsRotatingAsync(RotatingProxySession):
+async def _aclose_clients(clients: Iterable[httpx.AsyncClient]):
+    await asyncio.gather(
+        *(client.aclose() for client in clients), return_exceptions=True
+    )
 
 
-    def __init__(self, headers, proxies=None, has_retry=False, delay=1, clear_cookies=False):
+async def _close_with_loop(session: RequestsRotatingAsync):
+    """
+    Stays suspended until the event loop running it shuts down its async
+    generators, as asyncio.run does before closing the loop, then closes the
+    session's clients while the loop can still close their connections. Does
+    nothing if the session moved to another loop since
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        yield
+    finally:
+        if session._loop is loop:
+            await session.aclose()
+
+
+def _start(generator: AsyncGenerator):
+    """
+    Runs an async generator to its first yield, which registers it with the
+    running loop for shutdown_asyncgens
+    """
+    try:
+        generator.asend(None).send(None)
+    except StopIteration:
+        pass
+
+
+class RequestsRotatingAsync(RotatingProxySession):
+    """
+    Async session keeping one pooled httpx.AsyncClient per proxy, so that
+    connections, TLS sessions and HTTP/2 streams are reused across requests.
+    Close it with aclose() or use it as an async context manager
+    """
+
+    def __init__(
+        self,
+        headers,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ):
+        """
+        :param limits: connection pool limits of each proxy's client
+        :param http2: negotiates HTTP/2, requires the h2 package
+        """
         RotatingProxySession.__init__(self, proxies=proxies, is_async=True)
         self.clear_cookies = clear_cookies
         self.has_retry = has_retry
         self.delay = delay
         self.allow_redirects = True
         self.headers = headers
-
-    def setup_session(self, has_retry, delay) -> RetryTransport | None:
-        if has_retry:
+        self.verify: _Verify = True
+        self.limits = limits if limits is not None else httpx.Limits()
+        self.http2 = http2
+        self._clients: dict[str | None, httpx.AsyncClient] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._closer: AsyncGenerator | None = None
+
+    def setup_session(self, proxy: str | None) -> httpx.AsyncBaseTransport:
+        transport = httpx.AsyncHTTPTransport(
+            proxy=proxy, verify=self.verify, limits=self.limits, http2=self.http2
+        )
+        if self.has_retry:
             retries = httpx_retries.Retry(
                 total=3,
                 status_forcelist=[500, 502, 503, 504, 429],
-                backoff_factor=delay,
+                backoff_factor=self.delay,
             )
+            return RetryTransport(transport=transport, retry=retries)
+        return transport
+
+    def client_for(self, proxy: str | None) -> httpx.AsyncClient:
+        """
+        :param proxy: proxy url, None or http://localhost for direct requests
+        :return: the client of the proxy, created on its first request
+        """
+        if proxy == "http://localhost":
+            proxy = None
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # connections can neither be reused nor closed from another event
+            # loop. Those of a loop still open are closed on it, those of a
+            # closed loop were closed by its _close_with_loop as it shut down
+            clients, self._clients = self._clients, {}
+            if clients and self._loop is not None and not self._loop.is_closed():
+                asyncio.run_coroutine_threadsafe(
+                    _aclose_clients(clients.values()), self._loop
+                )
+            self._loop = loop
+            self._closer = _close_with_loop(self)
+            _start(self._closer)
+        client = self._clients.get(proxy)
+        if client is None:
+            client = self._clients[proxy] = httpx.AsyncClient(
+                transport=self.setup_session(proxy)
+            )
+        return client
+
+    async def request(self, method, url, rotating_proxy=None, stream=False, **kwargs):
+        """
+        :param stream: returns once the headers are received, the body is read
+            from the response, which must then be closed
+        """
+        if rotating_proxy is None:
+            _, rotating_proxy = self.next_proxy()
+        client = self.client_for(rotating_proxy)
+        if self.clear_cookies:
+            client.cookies.clear()
+        # the session headers can change after the client was created
+        kwargs["headers"] = {**(self.headers or {}), **(kwargs.get("headers") or {})}
+        if not stream:
+            return await client.request(method, url, **kwargs)
+        auth = kwargs.pop("auth", httpx.USE_CLIENT_DEFAULT)
+        follow_redirects = kwargs.pop("follow_redirects", httpx.USE_CLIENT_DEFAULT)
+        return await client.send(
+            client.build_request(method, url, **kwargs),
+            stream=True,
+            auth=auth,
+            follow_redirects=follow_redirects,
+        )
 
-            transport = RetryTransport(retry=retries)
-            return transport
-        return None
-
+    async def aclose(self):
+        clients, self._clients = self._clients, {}
+        await asyncio.gather(*(client.aclose() for client in clients.values()))
 
-    async def request(self, method, url, **kwargs):
-        proxies = None
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            http_proxy = next_proxy.get('http', None)
-            if not http_proxy:
-                http_proxy = next_proxy.get('http://', None)
-            if http_proxy is not None and http_proxy != "http://localhost":
-                proxies = next_proxy
-        async with httpx.AsyncClient(mounts=proxies, transport=self.setup_session(self.has_retry, self.delay)) as client:
-            client.headers.update(self.headers)
-            return await client.request(method, url, **kwargs)
+    async def __aenter__(self) -> RequestsRotatingAsync:
+        return self
 
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
@@ -141,38 +277,136 @@ class TLSRotating(RotatingProxySession, tls_client.Session):
         RotatingProxySession.__init__(self, proxies=proxies)
         tls_client.Session.__init__(self, random_tls_extension_order=True)
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
+    def execute_request(self, *args, rotating_proxy=None, **kwargs):
+        if rotating_proxy is None:
+            _, rotating_proxy = self.next_proxy()
+        # passed per request, the session can be shared by threads
+        if rotating_proxy and rotating_proxy["http"] != "http://localhost":
+            kwargs.setdefault("proxy", rotating_proxy)
         response = tls_client.Session.execute_request(self, *args, **kwargs)
         response.ok = response.status_code in range(200, 400)
         return response
 
 class _HTTPAIOConcurrency:
 
-    semaphore : asyncio.Semaphore
+    max_concurrent_connections : int
 
     def __init__(self):
-        self.semaphore = asyncio.Semaphore(12)
+        self.max_concurrent_connections = 12
+        # a semaphore can only be awaited from one event loop, and every
+        # scrape_jobs call runs its own
+        self._semaphores: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = WeakKeyDictionary()
+
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        The semaphore of the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.max_concurrent_connections
+            )
+        return semaphore
 
     def set_max_concurrent_connections(self, max_concurrent_connections: int):
-        self.semaphore = asyncio.Semaphore(max_concurrent_connections)
+        self.max_concurrent_connections = max_concurrent_connections
+        self._semaphores = WeakKeyDictionary()
 
 http_aio_concurrency = _HTTPAIOConcurrency()
 
+class _ThreadConcurrency:
+
+    executor : ThreadPoolExecutor
+
+    def __init__(self):
+        self.executor = ThreadPoolExecutor(max_workers=32)
+
+    def set_max_workers(self, max_workers: int):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+
+# shared by the scrapers that process the jobs of a page in parallel
+thread_concurrency = _ThreadConcurrency()
+
+# paces the requests of every session, configured with rate_limiter.set_rate
+rate_limiter = RateLimiter()
+
+# proxies blocked by a site, skipped by the sessions until their cooldown ends
+proxy_breaker = CircuitBreaker()
+
+class _HTTPCache:
+
+    cache : ResponseCache | None
+
+    def __init__(self):
+        self.cache = None
+
+    def set_cache(self, cache: ResponseCache | None):
+        self.cache = cache
+
+# response cache of the sessions created without an explicit one, off by default
+http_cache = _HTTPCache()
+
+class _HTTPReplay:
+
+    mode : str | None
+
+    archive : HttpArchive | None
+
+    latency : float
+
+    def __init__(self):
+        self.mode = None
+        self.archive = None
+        self.latency = 0.0
+
+    def record(self, path: str):
+        """
+        Saves the responses of every session into the archives in path
+        """
+        self.mode, self.archive = "record", HttpArchive(path)
+
+    def replay(self, path: str, latency: float = 0.0):
+        """
+        Serves the requests of every session from the archives in path, without
+        network access, rate limiting or caching
+        :param latency: seconds each replayed response takes
+        """
+        self.mode, self.archive, self.latency = "replay", HttpArchive(path), latency
+
+    def off(self):
+        self.mode, self.archive = None, None
+
+    def serve(self, method, url, kwargs, is_async=False) -> Response:
+        misses = len(self.archive.misses)
+        response = self.archive.replay(method, url, kwargs, is_async=is_async)
+        if len(self.archive.misses) > misses:
+            replay_log.warning(f"no recorded response for {method} {url}")
+        return response
+
+# record/replay of the requests of every session, off by default
+http_replay = _HTTPReplay()
+replay_log = create_logger("Replay")
+
 class SessionAdapter:
 
     _instance: RequestsRotating | TLSRotating | RequestsRotatingAsync
 
     _is_async: bool
 
-    def __init__(self, instance: RequestsRotating | TLSRotating | RequestsRotatingAsync):
+    cache: ResponseCache | None
+
+    def __init__(
+        self,
+        instance: RequestsRotating | TLSRotating | RequestsRotatingAsync,
+        cache: ResponseCache | None = None,
+    ):
         self._instance = instance
         self._is_async = isinstance(self._instance, RequestsRotatingAsync)
+        self.cache = cache
 
 
     @property
@@ -191,29 +425,253 @@ class SessionAdapter:
     def verify(self, value: _Verify):
         self._instance.verify = value
 
-    def request(self, method, url, **kwargs) -> Response:
+    def request(
+        self,
+        method,
+        url,
+        stream_until: Callable[[], Callable[[bytes], bool]] | None = None,
+        read_cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        :param stream_until: reads the body in chunks and closes the connection
+            once the callable it creates returns True for a chunk, so that only
+            the prefix of the body that is needed is downloaded. The response
+            holds the bytes read and is marked truncated when the rest was not.
+            Responses of TLS sessions are read whole
+        :param read_cache: False sends the request even when the cache holds
+            a fresh response, storing the new one, e.g. to retry a response the
+            site blocked
+        """
         if self._is_async:
             raise Exception("Invalid usage. Use request async")
-        return self._instance.request(method, url, **kwargs)
-
+        if self.cache is None or http_replay.mode == "replay":
+            return self._send(method, url, stream_until, **kwargs)
+
+        key = self.cache.make_key(method, url, **kwargs)
+        entry = self.cache.get(key) if read_cache else None
+        if entry is not None and entry.is_fresh:
+            self.cache.hits += 1
+            return self._cached(key, entry.to_response(method))
+        response = self._send(
+            method, url, stream_until, **self._conditional(entry, kwargs)
+        )
+        return self._store(key, method, entry, response, read_cache=read_cache)
 
     def get(self, url: str, **kwargs: Any) -> Response:
-        if self._is_async:
-            raise Exception("Invalid usage. Use get async")
-        return self._instance.get(url, **kwargs)
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def _send(self, method, url, stream_until=None, **kwargs) -> Response:
+        if http_replay.mode == "replay":
+            if http_replay.latency:
+                time.sleep(http_replay.latency)
+            return http_replay.serve(method, url, kwargs)
+
+        proxy, rotating_proxy = self._instance.next_proxy(url)
+        retry_after = proxy_breaker.retry_after(url, proxy)
+        if retry_after:
+            # every proxy is blocked by the site
+            time.sleep(retry_after)
+        rate_limiter.acquire(url, proxy)
+        if isinstance(self._instance, TLSRotating):
+            response = self._instance.execute_request(
+                method, url, rotating_proxy=rotating_proxy, **kwargs
+            )
+        elif stream_until is not None:
+            response = self._instance.request(
+                method, url, rotating_proxy=rotating_proxy, stream=True, **kwargs
+            )
+            _read_prefix(response, stream_until())
+        else:
+            response = self._instance.request(
+                method, url, rotating_proxy=rotating_proxy, **kwargs
+            )
+        if http_replay.mode == "record":
+            http_replay.archive.record(method, url, kwargs, response)
+        response.proxy, response.request_url = proxy, url
+        return response
 
-    async def request_async(self, method, url, **kwargs) -> Response:
+    async def request_async(
+        self,
+        method,
+        url,
+        stream_until: Callable[[], Callable[[bytes], bool]] | None = None,
+        read_cache: bool = True,
+        **kwargs,
+    ) -> Response:
+        """
+        :param stream_until: see request
+        :param read_cache: see request
+        """
         if not self._is_async:
             raise Exception("Invalid usage. Use request")
+        if self.cache is None or http_replay.mode == "replay":
+            return await self._send_async(method, url, stream_until, **kwargs)
+
+        key = self.cache.make_key(method, url, **kwargs)
+        entry = self.cache.get(key) if read_cache else None
+        if entry is not None and entry.is_fresh:
+            self.cache.hits += 1
+            return self._cached(key, entry.to_response(method, is_async=True))
+        response = await self._send_async(
+            method, url, stream_until, **self._conditional(entry, kwargs)
+        )
+        return self._store(
+            key, method, entry, response, is_async=True, read_cache=read_cache
+        )
+
+    async def _send_async(self, method, url, stream_until=None, **kwargs) -> Response:
+        if http_replay.mode == "replay":
+            if http_replay.latency:
+                await asyncio.sleep(http_replay.latency)
+            return http_replay.serve(method, url, kwargs, is_async=True)
+
+        proxy, rotating_proxy = self._instance.next_proxy(url)
+        retry_after = proxy_breaker.retry_after(url, proxy)
+        if retry_after:
+            # every proxy is blocked by the site
+            await asyncio.sleep(retry_after)
+        # waits for a token before taking one of the connection slots
+        await rate_limiter.acquire_async(url, proxy)
         async with http_aio_concurrency.semaphore:
-            return await self._instance.request(method, url, **kwargs)
+            response = await self._instance.request(
+                method,
+                url,
+                rotating_proxy=rotating_proxy,
+                stream=stream_until is not None,
+                **kwargs,
+            )
+            if stream_until is not None:
+                await _read_prefix_async(response, stream_until())
+        if http_replay.mode == "record":
+            http_replay.archive.record(method, url, kwargs, response)
+        response.proxy, response.request_url = proxy, url
+        return response
 
 
     async def get_async(self, url: str, **kwargs: Any) -> Response:
-        if not self._is_async:
-            raise Exception("Invalid usage. Use get")
-        async with http_aio_concurrency.semaphore:
-            return await self._instance.get(url, **kwargs)
+        return await self.request_async("GET", url, **kwargs)
+
+    async def post_async(self, url: str, **kwargs: Any) -> Response:
+        return await self.request_async("POST", url, **kwargs)
+
+    def report(self, response, blocked: bool):
+        """
+        Tells the circuit breaker and the rate limiter whether the site blocked
+        a response, taking its proxy out of rotation and slowing down on blocks.
+        A blocked response is dropped from the cache. Cached and replayed
+        responses are otherwise ignored
+        """
+        cache_key = getattr(response, "cache_key", None)
+        if blocked and cache_key is not None and self.cache is not None:
+            self.cache.delete(cache_key)
+        if not hasattr(response, "request_url"):
+            return
+        proxy_breaker.report(response.request_url, response.proxy, blocked)
+        rate_limiter.report(response.request_url, response.proxy, blocked)
+
+    def close(self):
+        if self._is_async:
+            raise Exception("Invalid usage. Use aclose")
+        self._instance.close()
+
+    async def aclose(self):
+        """
+        Closes the connections of the session, sync or async
+        """
+        if self._is_async:
+            await self._instance.aclose()
+        else:
+            self._instance.close()
+
+    async def __aenter__(self) -> SessionAdapter:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    @staticmethod
+    def _conditional(entry: CacheEntry | None, kwargs: dict) -> dict:
+        """
+        Adds the revalidation headers of a stale cache entry to request kwargs
+        """
+        if entry is None or not entry.validators:
+            return kwargs
+        headers = dict(kwargs.get("headers") or {})
+        headers.update(entry.validators)
+        return {**kwargs, "headers": headers}
+
+    def _store(
+        self, key, method, entry, response, is_async=False, read_cache=True
+    ) -> Response:
+        """
+        :param read_cache: whether the cache was looked up, a request that
+            bypassed it is not a miss
+        """
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidated += 1
+            self.cache.refresh(entry)
+            return self._cached(key, entry.to_response(method, is_async=is_async))
+        if read_cache:
+            self.cache.misses += 1
+        self.cache.put(key, method, response)
+        return self._cached(key, response)
+
+    @staticmethod
+    def _cached(key: str, response: Response) -> Response:
+        """
+        Marks the cache entry of a response, so report can drop it
+        """
+        response.cache_key = key
+        return response
+
+
+def _stop_early(response, bytes_read: int) -> bool:
+    """
+    Whether to close a streamed response whose wanted prefix is read, rather
+    than read the rest and keep its connection. Bodies of unknown length are
+    closed
+    """
+    length = response.headers.get("content-length", "")
+    return not length.isdigit() or int(length) - bytes_read > STREAM_DRAIN_BYTES
+
+
+def _read_prefix(response: Response, done: Callable[[bytes], bool]) -> None:
+    """
+    Reads a streamed requests response until done returns True for a chunk and
+    closes it, the bytes read becoming its content
+    """
+    chunks = []
+    response.truncated = False
+    for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        if done(chunk) and _stop_early(response, response.raw.tell()):
+            response.truncated = True
+            break
+    # closes the connection unless the body was read to the end
+    response.close()
+    response._content = b"".join(chunks)
+    response._content_consumed = True
+
+
+async def _read_prefix_async(
+    response: httpx.Response, done: Callable[[bytes], bool]
+) -> None:
+    """
+    Async version of _read_prefix, for httpx responses
+    """
+    chunks = []
+    response.truncated = False
+    async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+        chunks.append(chunk)
+        if done(chunk) and _stop_early(response, response.num_bytes_downloaded):
+            response.truncated = True
+            break
+    await response.aclose()
+    response._content = b"".join(chunks)
 
 
 def create_session(
@@ -225,10 +683,16 @@ def create_session(
     delay: int = 1,
     clear_cookies: bool = False,
     is_async: bool = False,
-    headers = None
+    headers = None,
+    cache: ResponseCache | None = None,
+    limits: httpx.Limits | None = None,
+    http2: bool = False,
 ) -> SessionAdapter:
     """
-    Creates a requests session with optional tls, proxy, and retry settings.
+    Creates a requests session with optional tls, proxy, retry and cache settings.
+    :param cache: response cache, defaults to the one set on http_cache
+    :param limits: connection pool limits per proxy of an async session
+    :param http2: negotiates HTTP/2 in an async session, requires h2
     :return: A session object
     """
     if is_tls:
@@ -250,11 +714,15 @@ def create_session(
                 has_retry=has_retry,
                 delay=delay,
                 clear_cookies=clear_cookies,
+                limits=limits,
+                http2=http2,
             )
 
     if ca_cert:
         session.verify = ca_cert
-    session = SessionAdapter(session)
+    if cache is None:
+        cache = http_cache.cache
+    session = SessionAdapter(session, cache=cache)
     return session
 
 
@@ -414,6 +882,23 @@ def extract_job_type(description: str):
     return listing_types if listing_types else None
 
 
+def slice_pages(
+    pages: Iterable[list], offset: int, limit: int
+) -> Iterator[list]:
+    """
+    Applies an offset and a limit across consecutive pages, the same way
+    jobs[offset : offset + limit] would on the concatenated pages
+    """
+    count = 0
+    for page in pages:
+        page_slice = page[max(offset - count, 0) : max(offset + limit - count, 0)]
+        count += len(page)
+        if page_slice:
+            yield page_slice
+        if count >= offset + limit:
+            break
+
+
 def map_str_to_site(site_name: str) -> Site:
     return Site[site_name.upper()]
 
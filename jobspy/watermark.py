@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+from jobspy.model import ScraperInput, Site
+
+DEFAULT_WATERMARK_PATH = Path.home() / ".cache" / "jobspy" / "watermarks.sqlite"
+
+# fields that change how many results are returned, how they are formatted or
+# which of them are kept, not the search sent to the site, which is what a
+# watermark marks the position in
+_UNKEYED_FIELDS = {
+    "site_type",
+    "results_wanted",
+    "offset",
+    "description_format",
+    "linkedin_fetch_description",
+    "linkedin_prefetch_pages",
+    "linkedin_stream_details",
+    "linkedin_company_shard_size",
+    "linkedin_defer_details",
+    "fetch_details_if",
+    "job_filter",
+}
+
+
+@dataclass
+class Watermark:
+    # newest job id returned by the query
+    job_id: int
+    date_posted: date | None
+    # unix time the run that set it started
+    run_at: float
+
+
+class WatermarkStore:
+    """
+    Newest job seen per search query and site, in SQLite, so that the next run
+    of a query only pages through the jobs posted since
+    """
+
+    def __init__(self, path: str | Path | None = None):
+        """
+        :param path: SQLite file, defaults to ~/.cache/jobspy/watermarks.sqlite
+        """
+        self.path = Path(path) if path else DEFAULT_WATERMARK_PATH
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS watermarks (
+                key TEXT PRIMARY KEY,
+                job_id INTEGER NOT NULL,
+                date_posted TEXT,
+                run_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key_for(site: Site, scraper_input: ScraperInput) -> str:
+        """
+        Key of a query, the same for inputs that match the same jobs on a site
+        """
+        query = scraper_input.model_dump(mode="json", exclude=_UNKEYED_FIELDS)
+        query = {
+            name: value.strip().lower() if isinstance(value, str) else value
+            for name, value in query.items()
+        }
+        serialized = json.dumps([site.value, query], sort_keys=True)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Watermark | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT job_id, date_posted, run_at FROM watermarks WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        job_id, date_posted, run_at = row
+        return Watermark(
+            job_id=job_id,
+            date_posted=date.fromisoformat(date_posted) if date_posted else None,
+            run_at=run_at,
+        )
+
+    def set(self, key: str, watermark: Watermark) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    watermark.job_id,
+                    (
+                        watermark.date_posted.isoformat()
+                        if watermark.date_posted
+                        else None
+                    ),
+                    watermark.run_at,
+                ),
+            )
+            self._db.commit()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM watermarks WHERE key = ?", (key,))
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
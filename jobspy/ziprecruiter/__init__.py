@@ -1,21 +1,18 @@
 from __future__ import annotations
 
-import json
 import math
-import re
-import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Executor
 from datetime import datetime
+from typing import Iterator
 
-from bs4 import BeautifulSoup
-
+from jobspy.filters import FILTERED_PAGES_FACTOR
 from jobspy.ziprecruiter.constant import headers, get_cookie_data
 from jobspy.util import (
     extract_emails_from_text,
     create_session,
     markdown_converter,
-    remove_attributes,
     create_logger,
+    thread_concurrency,
 )
 from jobspy.model import (
     JobPost,
@@ -28,7 +25,7 @@ from jobspy.model import (
     ScraperInput,
     Site,
 )
-from jobspy.ziprecruiter.util import get_job_type_enum, add_params
+from jobspy.ziprecruiter.util import get_job_type_enum, add_params, parse_job_page
 
 log = create_logger("ZipRecruiter")
 
@@ -38,19 +35,23 @@ class ZipRecruiter(Scraper):
     api_url = "https://api.ziprecruiter.com"
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        parse_executor: Executor | None = None,
     ):
         """
         Initializes ZipRecruiterScraper with the ZipRecruiter job search url
         """
-        super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
+        super().__init__(
+            Site.ZIP_RECRUITER, proxies=proxies, parse_executor=parse_executor
+        )
 
         self.scraper_input = None
         self.session = create_session(proxies=proxies, ca_cert=ca_cert)
         self.session.headers.update(headers)
         self._get_cookies()
 
-        self.delay = 5
         self.jobs_per_page = 20
         self.seen_urls = set()
 
@@ -60,27 +61,45 @@ class ZipRecruiter(Scraper):
         :param scraper_input: Information about job search criteria.
         :return: JobResponse containing a list of jobs.
         """
+        job_list = [job for page in self.iter_pages(scraper_input) for job in page]
+        return JobResponse(jobs=job_list)
+
+    def iter_pages(self, scraper_input: ScraperInput) -> Iterator[list[JobPost]]:
+        """
+        Scrapes ZipRecruiter for jobs with scraper_input criteria, page by page
+        :param scraper_input: Information about job search criteria.
+        :return: iterator over the jobs of each results page
+        """
         self.scraper_input = scraper_input
-        job_list: list[JobPost] = []
+        job_count = 0
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+        if scraper_input.job_filter is not None:
+            # jobs dropped by job_filter do not count toward results_wanted
+            max_pages *= FILTERED_PAGES_FACTOR
+        page = 0
+        while job_count < scraper_input.results_wanted:
+            page += 1
+            if page > max_pages:
+                if scraper_input.job_filter is not None:
+                    log.info(
+                        f"Job filter kept {job_count} jobs in {max_pages} pages. "
+                        "Ending pagination."
+                    )
                 break
-            if page > 1:
-                time.sleep(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
             )
             if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
+                jobs_on_page = jobs_on_page[: scraper_input.results_wanted - job_count]
+                job_count += len(jobs_on_page)
+                yield jobs_on_page
+            elif scraper_input.job_filter is None:
                 break
             if not continue_token:
                 break
-        return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
         self, scraper_input: ScraperInput, continue_token: str | None = None
@@ -115,8 +134,8 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+        executor = thread_concurrency.executor
+        job_results = [executor.submit(self._process_job, job) for job in jobs_list]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
@@ -132,13 +151,24 @@ class ZipRecruiter(Scraper):
         self.seen_urls.add(job_url)
 
         description = job.get("job_description", "").strip()
+        company = job.get("hiring_company", {}).get("name")
+        comp_interval = job.get("compensation_interval")
+        comp_interval = "yearly" if comp_interval == "annual" else comp_interval
+        job_filter = self.scraper_input.job_filter
+        if job_filter is not None and not (
+            job_filter.keeps(title, company, description)
+            and job_filter.keeps_salary(
+                job.get("compensation_min"), job.get("compensation_max"), comp_interval
+            )
+        ):
+            return None
+
         listing_type = job.get("buyer_type", "")
         description = (
-            markdown_converter(description)
+            self.parse(markdown_converter, description)
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
             else description
         )
-        company = job.get("hiring_company", {}).get("name")
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
 
@@ -149,14 +179,11 @@ class ZipRecruiter(Scraper):
             job.get("employment_type", "").replace("_", "").lower()
         )
         date_posted = datetime.fromisoformat(job["posted_time"].rstrip("Z")).date()
-        comp_interval = job.get("compensation_interval")
-        comp_interval = "yearly" if comp_interval == "annual" else comp_interval
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
 
-        return JobPost(
+        job_post = JobPost(
             id=f'zr-{job["listing_key"]}',
             title=title,
             company_name=company,
@@ -170,44 +197,28 @@ class ZipRecruiter(Scraper):
             ),
             date_posted=date_posted,
             job_url=job_url,
-            description=description_full if description_full else description,
+            description=description,
             emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
             listing_type=listing_type,
         )
+        if self._wants_details(self.scraper_input, job_post):
+            description_full, job_url_direct = self._get_descr(job_url)
+            if job_filter is not None and not job_filter.keeps(
+                description=description_full
+            ):
+                return None
+            if description_full:
+                job_post.description = description_full
+            job_post.job_url_direct = job_url_direct
+        return job_post
 
     def _get_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
-            job_descr_div = soup.find("div", class_="job_description")
-            company_descr_section = soup.find("section", class_="company_description")
-            job_description_clean = (
-                remove_attributes(job_descr_div).prettify(formatter="html")
-                if job_descr_div
-                else ""
-            )
-            company_description_clean = (
-                remove_attributes(company_descr_section).prettify(formatter="html")
-                if company_descr_section
-                else ""
+            description_full, job_url_direct = self.parse(
+                parse_job_page, res.text, self.scraper_input.description_format
             )
-            description_full = job_description_clean + company_description_clean
-
-            try:
-                script_tag = soup.find("script", type="application/json")
-                if script_tag:
-                    job_json = json.loads(script_tag.string)
-                    job_url_val = job_json["model"].get("saveJobURL", "")
-                    m = re.search(r"job_url=(.+)", job_url_val)
-                    if m:
-                        job_url_direct = m.group(1)
-            except:
-                job_url_direct = None
-
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
 
         return description_full, job_url_direct
 
@@ -1,4 +1,10 @@
-from jobspy.model import JobType
+import json
+import re
+
+from bs4 import BeautifulSoup
+
+from jobspy.model import JobType, DescriptionFormat
+from jobspy.util import markdown_converter, remove_attributes
 
 
 def add_params(scraper_input) -> dict[str, str | int]:
@@ -29,3 +35,46 @@ def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
         if job_type_str in job_type.value:
             return [job_type]
     return None
+
+
+def parse_job_page(
+    html: str, description_format: DescriptionFormat
+) -> tuple[str, str | None]:
+    """
+    Parses the full description and the direct job url from a job page. Runs
+    standalone so it can be offloaded to a parse executor
+    :param html: job page body
+    :param description_format:
+    :return: description, job url direct
+    """
+    job_url_direct = None
+    soup = BeautifulSoup(html, "html.parser")
+    job_descr_div = soup.find("div", class_="job_description")
+    company_descr_section = soup.find("section", class_="company_description")
+    job_description_clean = (
+        remove_attributes(job_descr_div).prettify(formatter="html")
+        if job_descr_div
+        else ""
+    )
+    company_description_clean = (
+        remove_attributes(company_descr_section).prettify(formatter="html")
+        if company_descr_section
+        else ""
+    )
+    description_full = job_description_clean + company_description_clean
+
+    try:
+        script_tag = soup.find("script", type="application/json")
+        if script_tag:
+            job_json = json.loads(script_tag.string)
+            job_url_val = job_json["model"].get("saveJobURL", "")
+            m = re.search(r"job_url=(.+)", job_url_val)
+            if m:
+                job_url_direct = m.group(1)
+    except:
+        job_url_direct = None
+
+    if description_format == DescriptionFormat.MARKDOWN:
+        description_full = markdown_converter(description_full)
+
+    return description_full, job_url_direct
@@ -0,0 +1,40 @@
+import pytest
+
+from jobspy.bloom import BloomFilter
+
+ERROR_RATE = 0.01
+
+
+@pytest.fixture
+def grown_filter() -> BloomFilter:
+    bloom = BloomFilter(initial_capacity=1_000, error_rate=ERROR_RATE)
+    for i in range(10_000):
+        bloom.add(f"seen-{i}")
+    assert len(bloom.stages) > 1
+    return bloom
+
+
+def test_false_positive_rate_stays_under_target_after_growth(grown_filter):
+    assert all(f"seen-{i}" in grown_filter for i in range(10_000))
+    false_positives = sum(f"unseen-{i}" in grown_filter for i in range(50_000))
+    assert false_positives / 50_000 < ERROR_RATE
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_save_load_round_trip(tmp_path, grown_filter, mmap):
+    path = tmp_path / "seen.bloom"
+    grown_filter.save(path)
+    loaded = BloomFilter.load(path, mmap=mmap)
+
+    assert len(loaded) == len(grown_filter)
+    assert loaded.error_rate == grown_filter.error_rate
+    job_ids = [f"seen-{i}" for i in range(10_000)]
+    job_ids += [f"unseen-{i}" for i in range(10_000)]
+    assert [job_id in loaded for job_id in job_ids] == [
+        job_id in grown_filter for job_id in job_ids
+    ]
+
+    # a mapped filter stays read-only, new ids go to a new stage
+    assert loaded.add("added-after-load")
+    assert "added-after-load" in loaded
+    assert "added-after-load" not in BloomFilter.load(path, mmap=mmap)
@@ -0,0 +1,140 @@
+import time
+
+import requests
+import pytest
+
+from jobspy.cache import ResponseCache
+from jobspy.linkedin import LinkedIn
+from jobspy.model import ScraperInput, Site
+from jobspy.util import create_session, http_cache, proxy_breaker, rate_limiter
+
+SEARCH_PAGE = """<li><div class="base-card base-search-card job-search-card">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/dev-3900000001">
+<span class="sr-only">Developer</span></a></div></li>"""
+BLOCK_PAGE = "<html><body>Sign in to see more jobs</body></html>"
+
+
+@pytest.fixture
+def linkedin(tmp_path, monkeypatch):
+    """
+    LinkedIn scraper with a response cache, whose server blocks the first
+    search request
+    """
+    bodies = [BLOCK_PAGE, SEARCH_PAGE]
+    sent = []
+
+    def request(self, method, url, **kwargs):
+        sent.append(url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = bodies[min(len(sent), len(bodies)) - 1].encode()
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    # no cooldown or slow down between the attempts
+    monkeypatch.setattr(proxy_breaker, "cooldown", 0)
+    monkeypatch.setattr(rate_limiter, "acquire", lambda *args, **kwargs: None)
+    monkeypatch.setattr(rate_limiter, "report", lambda *args, **kwargs: None)
+    cache = ResponseCache(tmp_path / "http.sqlite")
+    http_cache.set_cache(cache)
+    try:
+        scraper = LinkedIn()
+        scraper.sent = sent
+        yield scraper
+    finally:
+        http_cache.set_cache(None)
+        proxy_breaker.reset()
+        cache.close()
+
+
+def test_blocked_response_is_not_cached(linkedin):
+    scraper_input = ScraperInput(site_type=[Site.LINKEDIN], search_term="developer")
+    request_params = linkedin._build_search_request(scraper_input, 0)
+    response = linkedin._request_sync(request_params)
+    assert linkedin._block_reason(response) is None
+    # the retry went to the server rather than to the cached block page
+    assert len(linkedin.sent) == 2
+
+    # the good response replaced it in the cache
+    response = linkedin._request_sync(request_params)
+    assert len(linkedin.sent) == 2
+    assert "base-search-card" in response.text
+
+
+
+def _response(url: str, body: bytes, status_code: int = 200, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.url = url
+    response.encoding = "utf-8"
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.fixture
+def etag_server(monkeypatch):
+    """
+    Serves a page with an ETag, answering its revalidations with a 304
+    :return: the headers of each request sent
+    """
+    sent = []
+
+    def request(self, method, url, **kwargs):
+        headers = kwargs.get("headers") or {}
+        sent.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _response(url, b"", status_code=304)
+        return _response(url, b"page", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    return sent
+
+
+def test_stale_entry_is_revalidated(tmp_path, etag_server):
+    cache = ResponseCache(tmp_path / "http.sqlite", ttl=0.2)
+    session = create_session(is_tls=False, cache=cache)
+    try:
+        assert session.get("https://example.com/jobs").text == "page"
+        assert session.get("https://example.com/jobs").from_cache
+        assert (cache.hits, cache.misses, len(etag_server)) == (1, 1, 1)
+
+        time.sleep(0.25)
+        response = session.get("https://example.com/jobs")
+        assert etag_server[-1]["If-None-Match"] == '"v1"'
+        assert response.text == "page" and cache.revalidated == 1
+
+        # the 304 made the entry fresh again
+        assert session.get("https://example.com/jobs").from_cache
+        assert len(etag_server) == 2
+    finally:
+        cache.close()
+
+
+def test_bypassing_the_cache_is_not_a_miss(tmp_path, etag_server):
+    cache = ResponseCache(tmp_path / "http.sqlite")
+    session = create_session(is_tls=False, cache=cache)
+    try:
+        session.get("https://example.com/jobs", read_cache=False)
+        assert cache.misses == 0 and len(cache) == 1
+    finally:
+        cache.close()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = ResponseCache(tmp_path / "http.sqlite", max_size=25)
+    try:
+        for name in ("a", "b"):
+            url = f"https://example.com/{name}"
+            cache.put(name, "GET", _response(url, b"0123456789"))
+        # read after b, so b is the least recently used
+        time.sleep(0.01)
+        assert cache.get("a") is not None
+        cache.put("c", "GET", _response("https://example.com/c", b"0123456789"))
+        assert cache.get("b") is None
+        assert cache.get("a") is not None and cache.get("c") is not None
+        assert len(cache) == 2
+    finally:
+        cache.close()
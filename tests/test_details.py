@@ -0,0 +1,48 @@
+import httpx
+import pandas as pd
+
+from jobspy import scrape_jobs
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin import details
+from jobspy.linkedin.details import (
+    MAX_RESOLVERS,
+    RESOLVER_ATTR,
+    DetailResolver,
+    resolver_for,
+)
+from jobspy.model import ScraperInput, Site
+from jobspy.util import RequestsRotatingAsync
+
+
+def test_registry_closes_least_recently_used_resolvers(monkeypatch):
+    closed = []
+    monkeypatch.setattr(DetailResolver, "close", lambda self: closed.append(self))
+    monkeypatch.setattr(details, "_resolvers", details.OrderedDict())
+    scraper_input = ScraperInput(site_type=[Site.LINKEDIN])
+    frames = []
+    for _ in range(MAX_RESOLVERS + 2):
+        jobs_df = pd.DataFrame({"site": ["linkedin"], "id": ["1"]})
+        resolver = DetailResolver(LinkedIn(), scraper_input)
+        jobs_df.attrs[RESOLVER_ATTR] = resolver.register()
+        frames.append((jobs_df, resolver))
+        if len(frames) == MAX_RESOLVERS:
+            # used since, so it outlives the frames registered after it
+            assert resolver_for(frames[0][0]) is frames[0][1]
+
+    assert closed == [frames[1][1], frames[2][1]]
+    assert resolver_for(frames[1][0]) is None
+    assert resolver_for(frames[0][0]) is frames[0][1]
+    assert resolver_for(frames[-1][0]) is frames[-1][1]
+
+
+def test_no_resolver_without_linkedin_rows(monkeypatch):
+    async def request(self, method, url, rotating_proxy=None, stream=False, **kw):
+        # past the last page, the guest api answers with an empty body
+        return httpx.Response(200, content=b"", request=httpx.Request(method, url))
+
+    monkeypatch.setattr(RequestsRotatingAsync, "request", request)
+    jobs_df = scrape_jobs(
+        site_name="linkedin", search_term="developer", linkedin_defer_details=True
+    )
+    assert jobs_df.empty
+    assert RESOLVER_ATTR not in jobs_df.attrs
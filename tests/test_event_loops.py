@@ -0,0 +1,131 @@
+import asyncio
+
+import httpx
+import pytest
+
+from jobspy import scrape_jobs
+from jobspy.util import RequestsRotatingAsync, rate_limiter
+
+SEARCH_URL = "linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings"
+JOB_ID = 3900000000
+
+
+def _search_page(start: int, total: int) -> str:
+    cards = []
+    for job_id in range(JOB_ID + start, JOB_ID + min(start + 10, total)):
+        cards.append(
+            f"""<div class="base-card base-search-card job-search-card">
+  <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/dev-{job_id}">
+    <span class="sr-only">Developer {job_id}</span>
+  </a>
+  <h4 class="base-search-card__subtitle">
+    <a href="https://www.linkedin.com/company/acme">Acme</a>
+  </h4>
+</div>"""
+        )
+    return "".join(cards)
+
+
+def _job_page(job_id: str) -> str:
+    return f"""<html><body><section class="description">
+<div class="show-more-less-html__markup">Job {job_id} description</div>
+<ul class="description__job-criteria-list"></ul>
+</section></body></html>"""
+
+
+@pytest.fixture
+def fake_linkedin(monkeypatch):
+    """
+    Serves the same 60 LinkedIn jobs to every search, each response after a short delay so that more
+    requests are in flight than the connection semaphore allows
+    """
+
+    async def request(self, method, url, rotating_proxy=None, stream=False, **kw):
+        await asyncio.sleep(0.01)
+        if "seeMoreJobPostings" in url:
+            body = _search_page(int(kw["params"]["start"]), 60)
+        else:
+            body = _job_page(url.rsplit("/", 1)[-1])
+        return httpx.Response(
+            200,
+            content=body.encode(),
+            headers={"Content-Type": "text/html; charset=utf-8"},
+            request=httpx.Request(method, url),
+        )
+
+    monkeypatch.setattr(RequestsRotatingAsync, "request", request)
+    rate_limiter.set_rate(SEARCH_URL, None)
+    yield
+    rate_limiter.set_rate(SEARCH_URL, 1 / 5, 1)
+
+
+def test_scrape_jobs_twice_in_one_process(fake_linkedin):
+    # each call runs its own event loop, the second must not reuse the first's.
+    # The company shards keep dozens of requests in flight
+    for _ in range(2):
+        jobs = scrape_jobs(
+            site_name="linkedin",
+            search_term="developer",
+            results_wanted=60,
+            linkedin_fetch_description=True,
+            linkedin_company_ids=list(range(8)),
+            linkedin_company_shard_size=2,
+        )
+        assert len(jobs) == 60
+        assert jobs["description"].notna().all()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    monkeypatch.setattr(
+        RequestsRotatingAsync,
+        "setup_session",
+        lambda self, proxy: httpx.MockTransport(lambda request: httpx.Response(200)),
+    )
+    return RequestsRotatingAsync(headers={})
+
+
+async def _request_client(session: RequestsRotatingAsync) -> httpx.AsyncClient:
+    await session.request("GET", "https://www.linkedin.com/jobs")
+    return session.client_for(None)
+
+
+def test_clients_closed_with_their_event_loop(session):
+    first = asyncio.run(_request_client(session))
+    assert first.is_closed
+    second = asyncio.run(_request_client(session))
+    assert second is not first and second.is_closed
+
+
+def test_stale_clients_closed_on_their_open_loop(session):
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(_request_client(session))
+        second = asyncio.run(_request_client(session))
+        assert second is not first and not first.is_closed
+        # the close is scheduled on the open loop, done once it runs again
+        loop.run_until_complete(asyncio.sleep(0.01))
+        assert first.is_closed
+    finally:
+        loop.close()
+
+
+def test_clients_closed_once_by_aclose_then_the_loop(session, monkeypatch):
+    closes = []
+    aclose = httpx.AsyncClient.aclose
+
+    async def counted_aclose(client):
+        closes.append(client)
+        await aclose(client)
+
+    monkeypatch.setattr(httpx.AsyncClient, "aclose", counted_aclose)
+
+    async def scrape_then_close():
+        client = await _request_client(session)
+        await session.aclose()
+        # a request after aclose gets a new client, closed with the loop
+        return client, await _request_client(session)
+
+    first, second = asyncio.run(scrape_then_close())
+    assert closes == [first, second]
+    assert first.is_closed and second.is_closed
@@ -0,0 +1,66 @@
+import pytest
+
+from jobspy.bayt import BaytScraper
+from jobspy.filters import FILTERED_PAGES_FACTOR, JobFilter
+from jobspy.indeed import Indeed
+from jobspy.model import ScraperInput, Site
+from jobspy.watermark import WatermarkStore
+from jobspy.ziprecruiter import ZipRecruiter
+
+
+def test_job_filter_does_not_change_the_watermark_key():
+    search = ScraperInput(site_type=[Site.LINKEDIN], search_term="developer")
+    filtered = search.model_copy(
+        update={"job_filter": JobFilter(exclude_companies=["Acme"])}
+    )
+    assert WatermarkStore.key_for(Site.LINKEDIN, search) == WatermarkStore.key_for(
+        Site.LINKEDIN, filtered
+    )
+
+
+def _drop_everything(site: Site) -> ScraperInput:
+    return ScraperInput(
+        site_type=[site],
+        search_term="developer",
+        results_wanted=30,
+        job_filter=JobFilter(exclude_companies=["Acme"]),
+    )
+
+
+def test_bayt_filtered_paging_is_bounded(monkeypatch):
+    pages = []
+
+    def fetch_jobs(self, query, page):
+        pages.append(page)
+        return [
+            {"title": "Developer", "company_name": "Acme", "job_url": f"{page}-{i}"}
+            for i in range(BaytScraper.jobs_per_page)
+        ]
+
+    monkeypatch.setattr(BaytScraper, "_fetch_jobs", fetch_jobs)
+    assert BaytScraper().scrape(_drop_everything(Site.BAYT)).jobs == []
+    assert len(pages) == 2 * FILTERED_PAGES_FACTOR
+
+
+@pytest.mark.parametrize(
+    "scraper_class, site, fetch_page, pages_wanted",
+    [
+        (ZipRecruiter, Site.ZIP_RECRUITER, "_find_jobs_in_page", 2),
+        (Indeed, Site.INDEED, "_scrape_page", 1),
+    ],
+)
+def test_filtered_paging_is_bounded(
+    monkeypatch, scraper_class, site, fetch_page, pages_wanted
+):
+    pages = []
+
+    def scrape_page(self, *args):
+        # every job of the page was dropped, and the site has more
+        pages.append(args)
+        return [], "next"
+
+    monkeypatch.setattr(scraper_class, fetch_page, scrape_page)
+    # ZipRecruiter posts a session event when created
+    monkeypatch.setattr(ZipRecruiter, "_get_cookies", lambda self: None)
+    assert scraper_class().scrape(_drop_everything(site)).jobs == []
+    assert len(pages) == pages_wanted * FILTERED_PAGES_FACTOR
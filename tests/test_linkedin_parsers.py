@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin import util
+from jobspy.model import DescriptionFormat, JobPost
+
+pytest.importorskip("lxml")
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linkedin"
+SEARCH_PAGES = sorted(FIXTURES.glob("search_*.html"))
+JOB_PAGES = sorted(FIXTURES.glob("job_*.html"))
+
+
+@pytest.fixture
+def bs4_backend(monkeypatch):
+    """
+    Parses with BeautifulSoup, as when lxml is not installed
+    """
+
+    def use_bs4():
+        monkeypatch.setattr(util, "lxml_html", None)
+
+    return use_bs4
+
+
+def _search_jobs(html: str) -> list[dict]:
+    cards = util.parse_search_cards(html, LinkedIn.base_url, "worldwide")
+    return [JobPost(**card).model_dump() for card in cards]
+
+
+def _job(html: str, description_format: DescriptionFormat) -> dict:
+    card = {"title": "Developer", "company_name": "Acme", "location": None}
+    details = util.parse_job_details(
+        html, f"{LinkedIn.base_url}/jobs/view/1", description_format, False
+    )
+    return JobPost(
+        **card, job_url=f"{LinkedIn.base_url}/jobs/view/1", **details
+    ).model_dump()
+
+
+@pytest.mark.parametrize("page", SEARCH_PAGES, ids=lambda page: page.name)
+def test_search_cards_parity(page, bs4_backend):
+    html = page.read_text()
+    lxml_jobs = _search_jobs(html)
+    bs4_backend()
+    bs4_jobs = _search_jobs(html)
+    assert len(lxml_jobs) == html.count("base-card__full-link")
+    assert lxml_jobs == bs4_jobs
+
+
+@pytest.mark.parametrize("description_format", list(DescriptionFormat))
+@pytest.mark.parametrize("page", JOB_PAGES, ids=lambda page: page.name)
+def test_job_details_parity(page, description_format, bs4_backend):
+    html = page.read_text()
+    lxml_job = _job(html, description_format)
+    bs4_backend()
+    bs4_job = _job(html, description_format)
+    assert lxml_job["job_level"] is not None
+    assert lxml_job == bs4_job
@@ -0,0 +1,51 @@
+from jobspy.linkedin.paginator import SearchPaginator
+
+
+def _cards(*job_ids: int) -> list[dict]:
+    return [{"id": str(job_id)} for job_id in job_ids]
+
+
+def test_stride_is_clamped_to_twice_the_page_size():
+    paginator = SearchPaginator(page_size=10, max_stale_pages=5)
+    assert paginator.next_start() == 0
+    paginator.record(0, _cards(*range(10)))
+    assert paginator.next_start() == 10
+    # a page repeating all its cards asks for a stride of 10 + 10 - 1
+    paginator.record(10, _cards(*range(10)))
+    assert paginator.stride == 19
+    assert paginator.next_start() == 29
+    paginator.record(29, _cards(*range(10)))
+    assert paginator.stride == 20
+    assert paginator.next_start() == 49
+
+
+def test_stride_is_clamped_to_one():
+    paginator = SearchPaginator(page_size=10)
+    paginator.record(0, _cards(*range(10)))
+    # pages one card apart without any overlap ask for a stride of 0
+    paginator.record(1, _cards(*range(10, 20)))
+    assert paginator.stride == 1
+    paginator.record(1, _cards(*range(20, 30)))
+    assert paginator.stride == 1
+
+
+def test_search_ends_after_max_stale_pages():
+    paginator = SearchPaginator(page_size=10, max_stale_pages=2)
+    start = paginator.next_start()
+    paginator.record(start, _cards(*range(10)))
+    start = paginator.next_start()
+    paginator.record(start, _cards(*range(10)))
+    assert paginator.stale_pages == 1
+    # a new card resets the stale pages
+    start = paginator.next_start()
+    paginator.record(start, _cards(*range(11)))
+    assert paginator.stale_pages == 0
+
+    for stale_pages in range(1, 3):
+        assert not paginator.exhausted
+        start = paginator.next_start()
+        paginator.record(start, _cards(*range(11)))
+        assert paginator.stale_pages == stale_pages
+    assert paginator.exhausted
+    assert paginator.next_start() is None
+    assert paginator.stats.requests == 5
@@ -0,0 +1,28 @@
+from jobspy.rate_limit import ADAPTIVE_RATE, RateLimiter
+
+DETAIL_URL = "https://www.linkedin.com/jobs/view/3900000000"
+
+
+def test_unlimited_host_recovers_after_a_block():
+    limiter = RateLimiter(rates={})
+    assert limiter.bucket_for(DETAIL_URL) is None
+
+    limiter.report(DETAIL_URL, blocked=True)
+    bucket = limiter.bucket_for(DETAIL_URL)
+    assert bucket.rate == ADAPTIVE_RATE / 2
+
+    # each success recovers a tenth of the rate, back at it the limit is lifted
+    limiter.report(DETAIL_URL)
+    assert limiter.bucket_for(DETAIL_URL) is bucket
+    for _ in range(10):
+        limiter.report(DETAIL_URL)
+    assert limiter.bucket_for(DETAIL_URL) is None
+
+
+def test_configured_rate_is_kept_after_recovery():
+    limiter = RateLimiter(rates={"linkedin.com/jobs": (2.0, 1)})
+    limiter.report(DETAIL_URL, blocked=True)
+    for _ in range(10):
+        limiter.report(DETAIL_URL)
+    bucket = limiter.bucket_for(DETAIL_URL)
+    assert bucket is not None and bucket.rate == 2.0
@@ -0,0 +1,80 @@
+import requests
+import pytest
+
+from jobspy.linkedin import LinkedIn
+from jobspy.model import ScraperInput, Site
+from jobspy.seen_store import SeenJobStore
+from jobspy.util import proxy_breaker, rate_limiter
+
+
+JOB_IDS = range(3900000000, 3900000020)
+
+
+def _search_page(start: int) -> str:
+    return "".join(
+        f"""<li><div class="base-card base-search-card job-search-card">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/dev-{job_id}">
+<span class="sr-only">Developer {job_id}</span></a></div></li>"""
+        for job_id in JOB_IDS[start : start + 10]
+    )
+
+
+@pytest.fixture
+def twenty_jobs(monkeypatch):
+    """
+    Serves twenty jobs, ten from any offset, then empty pages
+    """
+
+    def request(self, method, url, **kwargs):
+        start = int((kwargs.get("params") or {}).get("start", 0))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = _search_page(start).encode()
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    monkeypatch.setattr(proxy_breaker, "cooldown", 0)
+    monkeypatch.setattr(rate_limiter, "acquire", lambda *args, **kwargs: None)
+    monkeypatch.setattr(rate_limiter, "report", lambda *args, **kwargs: None)
+    yield
+    proxy_breaker.reset()
+
+
+class _CountingConnection:
+    def __init__(self, db):
+        self._db = db
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+        self._db.commit()
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def test_seen_jobs_are_skipped_after_reopening(tmp_path, twenty_jobs):
+    path = tmp_path / "seen.sqlite"
+    scraper_input = ScraperInput(
+        site_type=[Site.LINKEDIN], search_term="developer", results_wanted=50
+    )
+
+    store = SeenJobStore(path)
+    store._db = _CountingConnection(store._db)
+    try:
+        jobs = LinkedIn(can_skip=store).scrape(scraper_input).jobs
+        assert len(jobs) == len(JOB_IDS)
+        # one commit per page, not per job
+        assert store._db.commits < len(JOB_IDS) / 2
+    finally:
+        store.close()
+
+    store = SeenJobStore(path)
+    try:
+        assert len(store) == len(JOB_IDS)
+        assert all(store.can_skip(job.id) for job in jobs)
+        assert LinkedIn(can_skip=store).scrape(scraper_input).jobs == []
+    finally:
+        store.close()
@@ -0,0 +1,64 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from jobspy.linkedin import LinkedIn
+from jobspy.model import ScraperInput, Site
+from jobspy.util import rate_limiter
+
+SEARCH_URL = "linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings"
+
+
+@pytest.fixture
+def company_searches(monkeypatch):
+    """
+    Serves one page of 10 jobs per company search, each after a short delay
+    :return: the most search requests that were in flight at once
+    """
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def request(self, method, url, **kwargs):
+        params = kwargs.get("params") or {}
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight[0] -= 1
+        body = ""
+        if int(params.get("start", 0)) == 0:
+            shard = int(params["f_C"].split(",")[0])
+            body = "".join(
+                f"""<li><div class="base-card base-search-card job-search-card">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/dev-{job_id}">
+<span class="sr-only">Developer {job_id}</span></a></div></li>"""
+                for job_id in range(3900000000 + shard * 100, 3900000010 + shard * 100)
+            )
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body.encode()
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    rate_limiter.set_rate(SEARCH_URL, None)
+    yield in_flight
+    rate_limiter.set_rate(SEARCH_URL, 1 / 5, 1)
+
+
+def test_sync_shards_are_searched_concurrently(company_searches):
+    scraper_input = ScraperInput(
+        site_type=[Site.LINKEDIN],
+        search_term="developer",
+        results_wanted=80,
+        linkedin_company_ids=list(range(8)),
+        linkedin_company_shard_size=1,
+    )
+    jobs = LinkedIn().scrape(scraper_input).jobs
+    assert len(jobs) == 80
+    assert len({job.id for job in jobs}) == 80
+    assert company_searches[1] > 1
@@ -0,0 +1,70 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from jobspy.sink import (
+    DICTIONARY_COLUMNS,
+    FLOAT_COLUMNS,
+    INT_COLUMNS,
+    ParquetSink,
+    read_jobs,
+)
+
+pytest.importorskip("pyarrow")
+
+SCRAPE_DATE = date(2026, 10, 17)
+
+
+def _job(job_id: str, **fields) -> dict:
+    return {
+        "id": job_id,
+        "site": "indeed",
+        "title": "Developer",
+        "date_posted": date(2026, 10, 1),
+        "job_type": "fulltime",
+        "min_amount": 100000.0,
+        "is_remote": True,
+        "company_reviews_count": 12,
+        **fields,
+    }
+
+
+def test_appending_to_a_partition_keeps_both_batches(tmp_path):
+    sink = ParquetSink(tmp_path, scrape_date=SCRAPE_DATE)
+    sink.write([_job("in-1"), _job("in-2")])
+    sink.write([_job("in-3")])
+    # a later run writing the same site and date
+    ParquetSink(tmp_path, scrape_date=SCRAPE_DATE).write([_job("in-4")])
+
+    partition = tmp_path / "site=indeed" / f"scrape_date={SCRAPE_DATE}"
+    assert len(list(partition.glob("*.parquet"))) == 3
+    jobs = read_jobs(tmp_path)
+    assert sorted(jobs["id"]) == ["in-1", "in-2", "in-3", "in-4"]
+    assert len(read_jobs(tmp_path, site="indeed", scrape_date=SCRAPE_DATE)) == 4
+
+
+def test_read_jobs_round_trips_dtypes(tmp_path):
+    written = pd.DataFrame(
+        [
+            _job("in-1"),
+            _job("in-2", is_remote=False, min_amount=None, company_reviews_count=None),
+        ]
+    )
+    ParquetSink(tmp_path, scrape_date=SCRAPE_DATE).write(written)
+
+    jobs = read_jobs(tmp_path).sort_values("id", ignore_index=True)
+    for column in DICTIONARY_COLUMNS:
+        assert isinstance(jobs[column].dtype, pd.CategoricalDtype), column
+    for column in FLOAT_COLUMNS + INT_COLUMNS:
+        assert pd.api.types.is_float_dtype(jobs[column]), column
+    assert pd.api.types.is_bool_dtype(jobs["is_remote"])
+
+    assert list(jobs["site"]) == ["indeed", "indeed"]
+    assert list(jobs["job_type"]) == ["fulltime", "fulltime"]
+    assert list(jobs["date_posted"]) == [date(2026, 10, 1)] * 2
+    assert list(jobs["scrape_date"]) == [SCRAPE_DATE] * 2
+    assert list(jobs["is_remote"]) == [True, False]
+    assert jobs["min_amount"][0] == 100000.0 and pd.isna(jobs["min_amount"][1])
+    assert jobs["company_reviews_count"][0] == 12
+    assert pd.isna(jobs["company_reviews_count"][1])
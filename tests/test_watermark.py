@@ -0,0 +1,61 @@
+import requests
+import pytest
+
+from jobspy.linkedin import LinkedIn
+from jobspy.model import ScraperInput, Site
+from jobspy.util import proxy_breaker, rate_limiter
+from jobspy.watermark import Watermark, WatermarkStore
+
+PREVIOUS_JOB_ID = 3900000000
+
+
+def _search_page(start: int) -> str:
+    newest = PREVIOUS_JOB_ID + 100 - start
+    return "".join(
+        f"""<li><div class="base-card base-search-card job-search-card">
+<a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/dev-{job_id}">
+<span class="sr-only">Developer {job_id}</span></a></div></li>"""
+        for job_id in range(newest, newest - 10, -1)
+    )
+
+
+@pytest.fixture
+def blocked_second_page(monkeypatch):
+    """
+    Serves the first search page, and answers every request for the second one
+    with a 429
+    """
+
+    def request(self, method, url, **kwargs):
+        start = int((kwargs.get("params") or {}).get("start", 0))
+        response = requests.Response()
+        response.status_code = 200 if start == 0 else 429
+        response._content = (_search_page(start) if start == 0 else "").encode()
+        response.url = url
+        response.encoding = "utf-8"
+        return response
+
+    monkeypatch.setattr(requests.Session, "request", request)
+    monkeypatch.setattr(proxy_breaker, "cooldown", 0)
+    monkeypatch.setattr(rate_limiter, "acquire", lambda *args, **kwargs: None)
+    monkeypatch.setattr(rate_limiter, "report", lambda *args, **kwargs: None)
+    yield
+    proxy_breaker.reset()
+
+
+def test_blocked_page_keeps_the_watermark(tmp_path, blocked_second_page):
+    store = WatermarkStore(tmp_path / "watermarks.sqlite")
+    scraper_input = ScraperInput(
+        site_type=[Site.LINKEDIN], search_term="developer", results_wanted=50
+    )
+    key = store.key_for(Site.LINKEDIN, scraper_input)
+    previous = Watermark(job_id=PREVIOUS_JOB_ID, date_posted=None, run_at=0.0)
+    store.set(key, previous)
+
+    try:
+        jobs = LinkedIn(watermarks=store).scrape(scraper_input).jobs
+        assert len(jobs) == 10
+        # the jobs of the unread pages are still ahead of the watermark
+        assert store.get(key).job_id == PREVIOUS_JOB_ID
+    finally:
+        store.close()